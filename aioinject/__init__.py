@@ -1,27 +1,50 @@
+from aioinject._features.lazy import Factory, Lazy, SyncFactory, SyncLazy
 from aioinject.containers import Container
 from aioinject.context import InjectionContext, SyncInjectionContext
 from aioinject.decorators import inject
 from aioinject.markers import Inject, Injected
 from aioinject.providers import (
+    ConcurrencyLimit,
+    Custom,
+    ItemScoped,
+    Keyed,
     Object,
+    Pooled,
     Provider,
     Scoped,
     Singleton,
+    TaskLocal,
+    ThreadLocal,
     Transient,
+    TTLSingleton,
+    WeakSingleton,
 )
 
 
 __all__ = [
+    "ConcurrencyLimit",
     "Container",
+    "Custom",
+    "Factory",
     "Inject",
     "Injected",
     "InjectionContext",
+    "ItemScoped",
+    "Keyed",
+    "Lazy",
     "Object",
+    "Pooled",
     "Provider",
     "Scoped",
     "Singleton",
+    "SyncFactory",
     "SyncInjectionContext",
+    "SyncLazy",
+    "TTLSingleton",
+    "TaskLocal",
+    "ThreadLocal",
     "Transient",
+    "WeakSingleton",
     "inject",
 ]
 
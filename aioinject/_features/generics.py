@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import functools
+import abc
+import copy
 import types
 import typing as t
+from inspect import isclass
 from types import GenericAlias
 from typing import TYPE_CHECKING, Any, TypeGuard
 
@@ -10,7 +12,7 @@ from aioinject._utils import is_iterable_generic_collection
 
 
 if TYPE_CHECKING:
-    from aioinject.providers import Dependency
+    from aioinject.providers import Dependency, Provider
 
 
 def _is_generic_alias(type_: Any) -> TypeGuard[GenericAlias]:
@@ -34,7 +36,6 @@ def _get_generic_arguments(type_: Any) -> list[t.TypeVar] | None:
     return None
 
 
-@functools.cache
 def _get_generic_args_map(type_: type[object]) -> dict[str, type[object]]:
     if _is_generic_alias(type_):
         params: dict[str, Any] = {
@@ -58,12 +59,11 @@ def _get_generic_args_map(type_: type[object]) -> dict[str, type[object]]:
     return args_map
 
 
-@functools.cache
 def get_generic_parameter_map(
     provided_type: type[object],
     dependencies: tuple[Dependency[Any], ...],
 ) -> dict[str, type[object]]:
-    args_map = _get_generic_args_map(provided_type)  # type: ignore[arg-type]
+    args_map = _get_generic_args_map(provided_type)
     result = {}
     for dependency in dependencies:
         inner_type = dependency.inner_type
@@ -84,3 +84,45 @@ def get_generic_origin(generic: type[object]) -> type[object]:
     if _is_generic_alias(generic):
         return t.get_origin(generic)
     return generic
+
+
+_IGNORED_INTERFACES = frozenset((object, abc.ABC, t.Generic, t.Protocol))
+
+
+def get_interfaces(type_: Any) -> list[Any]:
+    origin: Any = get_generic_origin(type_)
+    if not isclass(origin):
+        return []
+
+    interfaces: list[Any] = []
+    for cls in origin.__mro__:
+        if cls is not origin and cls not in _IGNORED_INTERFACES:
+            interfaces.append(cls)
+        interfaces.extend(
+            base
+            for base in cls.__dict__.get("__orig_bases__", ())
+            if _is_generic_alias(base) and not is_open_generic(base)
+        )
+    return interfaces
+
+
+def is_open_generic(type_: Any) -> bool:
+    if isinstance(type_, type):
+        return bool(getattr(type_, "__parameters__", ()))
+    return _is_generic_alias(type_) and all(
+        isinstance(arg, t.TypeVar) for arg in t.get_args(type_)
+    )
+
+
+def close_generic_provider(
+    provider: Provider[Any],
+    type_: Any,
+) -> Provider[Any]:
+    closed = copy.copy(provider)
+    closed.type_ = type_
+    vars(closed).pop("_specialized_dependencies", None)
+    impl: Any = get_generic_origin(provider.impl)
+    args = t.get_args(type_)
+    if isclass(impl) and len(getattr(impl, "__parameters__", ())) == len(args):
+        closed.impl = impl[args]  # type: ignore[index]
+    return closed
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import typing as t
+from collections.abc import Awaitable, Callable, Generator
+from typing import Any, Generic, TypeVar
+
+
+T = TypeVar("T")
+
+_NOT_SET: Any = object()
+
+
+class Lazy(Generic[T]):
+    __slots__ = ("_instance", "_resolve")
+
+    def __init__(self, resolve: Callable[[], Awaitable[T]]) -> None:
+        self._resolve = resolve
+        self._instance: T = _NOT_SET
+
+    async def get(self) -> T:
+        if self._instance is _NOT_SET:
+            self._instance = await self._resolve()
+        return self._instance
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self.get().__await__()
+
+
+class SyncLazy(Generic[T]):
+    __slots__ = ("_instance", "_resolve")
+
+    def __init__(self, resolve: Callable[[], T]) -> None:
+        self._resolve = resolve
+        self._instance: T = _NOT_SET
+
+    def get(self) -> T:
+        if self._instance is _NOT_SET:
+            self._instance = self._resolve()
+        return self._instance
+
+
+class Factory(Generic[T]):
+    __slots__ = ("_create",)
+
+    def __init__(self, create: Callable[[], Awaitable[T]]) -> None:
+        self._create = create
+
+    def __call__(self) -> Awaitable[T]:
+        return self._create()
+
+
+class SyncFactory(Generic[T]):
+    __slots__ = ("_create",)
+
+    def __init__(self, create: Callable[[], T]) -> None:
+        self._create = create
+
+    def __call__(self) -> T:
+        return self._create()
+
+
+def get_handle_type(type_: Any, origin: type[Any]) -> type[Any] | None:
+    if t.get_origin(type_) is not origin:
+        return None
+    return t.get_args(type_)[0]
+
+
+def unwrap_handle(type_: Any) -> Any:
+    if t.get_origin(type_) in (Lazy, SyncLazy, Factory, SyncFactory):
+        return t.get_args(type_)[0]
+    return type_
@@ -1,19 +1,37 @@
 from __future__ import annotations
 
+import asyncio
 import collections
 import contextlib
 import enum
+import logging
+import sys
 import threading
+import time
 import typing
-from collections.abc import AsyncIterator, Iterator
+import weakref
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar
 
 import anyio
 
+
+if sys.version_info < (3, 11):  # pragma: no cover
+    from exceptiongroup import ExceptionGroup
+
 from aioinject._utils import enter_context_maybe, enter_sync_context_maybe
-from aioinject.providers import DependencyLifetime
+from aioinject.providers import DependencyLifetime, TTLSingleton
 
 
 if TYPE_CHECKING:
@@ -23,28 +41,103 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+_CLOSE_ERRORS_MESSAGE = "Errors occurred while closing dependencies"
+
+
+def _get_dependants(
+    stacked: Collection[Provider[Any]],
+    dependencies: Mapping[Provider[Any], Collection[Provider[Any]]],
+) -> dict[Provider[Any], list[Provider[Any]]]:
+    dependants: dict[Provider[Any], list[Provider[Any]]] = (
+        collections.defaultdict(list)
+    )
+    for provider in stacked:
+        for dependency in _find_stacked_dependencies(
+            provider, stacked, dependencies
+        ):
+            dependants[dependency].append(provider)
+    return dependants
+
+
+def _find_stacked_dependencies(
+    provider: Provider[Any],
+    stacked: Collection[Provider[Any]],
+    dependencies: Mapping[Provider[Any], Collection[Provider[Any]]],
+) -> Iterator[Provider[Any]]:
+    # Providers without an exit stack are walked through, so that
+    # dependencies reached via them are still closed after the provider
+    pending = [*dependencies.get(provider, ())]
+    visited: set[Provider[Any]] = set()
+    while pending:
+        if (dependency := pending.pop()) in visited:
+            continue
+        visited.add(dependency)
+        if dependency in stacked:
+            yield dependency
+        else:
+            pending.extend(dependencies.get(dependency, ()))
+
 
 class NotInCache(enum.Enum):
     sentinel = enum.auto()
 
 
 class InstanceStore:
+    requires_lock: ClassVar[bool] = False
+    # Allocated on first use, most stores never need them
+    _provider_exit_stacks: (
+        dict[Provider[Any], contextlib.AsyncExitStack] | None
+    ) = None
+    _provider_sync_exit_stacks: (
+        dict[Provider[Any], contextlib.ExitStack] | None
+    ) = None
+    _dependencies: dict[Provider[Any], set[Provider[Any]]] | None = None
+
     def __init__(
         self,
         exit_stack: contextlib.AsyncExitStack | None = None,
         sync_exit_stack: contextlib.ExitStack | None = None,
+        parent: InstanceStore | None = None,
+        *,
+        concurrent_teardown: bool = False,
     ) -> None:
-        self._cache: dict[Provider[Any], Any] = {}
-        self._exit_stack = exit_stack or contextlib.AsyncExitStack()
-        self._sync_exit_stack = sync_exit_stack or contextlib.ExitStack()
+        self._cache: MutableMapping[Provider[Any], Any] = {}
+        # Exit stacks are created on first use, most stores never need them
+        self._exit_stack = exit_stack
+        self._sync_exit_stack = sync_exit_stack
+        self._parent = parent
+        self._concurrent_teardown = concurrent_teardown
 
     def get(self, provider: Provider[T]) -> T | Literal[NotInCache.sentinel]:
-        return self._cache.get(provider, NotInCache.sentinel)
+        obj = self._cache.get(provider, NotInCache.sentinel)
+        if obj is NotInCache.sentinel and self._parent is not None:
+            return self._parent.get(provider)
+        return obj
 
     def add(self, provider: Provider[T], obj: T) -> None:
+        if provider.releasable and self._dependencies is None:
+            # Instances depending on releasable ones are dropped on release
+            self._dependencies = {}
         if provider.lifetime is not DependencyLifetime.transient:
             self._cache[provider] = obj
 
+    @property
+    def tracks_dependencies(self) -> bool:
+        return self._concurrent_teardown or self._dependencies is not None
+
+    def add_dependencies(
+        self,
+        provider: Provider[Any],
+        dependencies: Iterable[Provider[Any]],
+    ) -> None:
+        # Recorded as providers were resolved, so that teardown order follows
+        # interfaces, generics and handles the same way resolution did
+        if self._dependencies is None:
+            self._dependencies = {}
+        self._dependencies.setdefault(provider, set()).update(dependencies)
+
     def lock(
         self,
         provider: Provider[Any],
@@ -57,32 +150,125 @@ class InstanceStore:
     ) -> AbstractContextManager[bool]:
         return contextlib.nullcontext(provider not in self._cache)
 
+    def should_refresh(self, provider: Provider[Any]) -> bool:  # noqa: ARG002
+        return False
+
+    async def refresh(
+        self,
+        provider: Provider[Any],  # noqa: ARG002
+        provide: Callable[[], Awaitable[object]],
+    ) -> None:
+        await provide()
+
+    def sync_refresh(
+        self,
+        provider: Provider[Any],  # noqa: ARG002
+        provide: Callable[[], object],
+    ) -> None:
+        provide()
+
     @typing.overload
     async def enter_context(
         self,
         obj: AbstractAsyncContextManager[T] | AbstractContextManager[T],
+        provider: Provider[Any] | None = None,
     ) -> T: ...
 
     @typing.overload
-    async def enter_context(self, obj: T) -> T: ...
+    async def enter_context(
+        self,
+        obj: T,
+        provider: Provider[Any] | None = None,
+    ) -> T: ...
 
     async def enter_context(
         self,
         obj: AbstractAsyncContextManager[T] | AbstractContextManager[T] | T,
+        provider: Provider[Any] | None = None,
     ) -> T:
-        return await enter_context_maybe(obj, self._exit_stack)
+        if provider is None or not (
+            self._concurrent_teardown or provider.releasable
+        ):
+            return await enter_context_maybe(obj, self._get_exit_stack())
+
+        if (stacks := self._provider_exit_stacks) is None:
+            stacks = self._provider_exit_stacks = {}
+        if (stack := stacks.get(provider)) is None:
+            stack = stacks[provider] = contextlib.AsyncExitStack()
+            if not self._concurrent_teardown:
+                await self._get_exit_stack().enter_async_context(stack)
+        return await enter_context_maybe(obj, stack)
 
     @typing.overload
-    def enter_sync_context(self, obj: AbstractContextManager[T]) -> T: ...
+    def enter_sync_context(
+        self,
+        obj: AbstractContextManager[T],
+        provider: Provider[Any] | None = None,
+    ) -> T: ...
 
     @typing.overload
-    def enter_sync_context(self, obj: T) -> T: ...
+    def enter_sync_context(
+        self,
+        obj: T,
+        provider: Provider[Any] | None = None,
+    ) -> T: ...
 
     def enter_sync_context(
         self,
         obj: AbstractContextManager[T] | T,
+        provider: Provider[Any] | None = None,
     ) -> T:
-        return enter_sync_context_maybe(obj, self._sync_exit_stack)
+        if provider is None or not provider.releasable:
+            return enter_sync_context_maybe(obj, self._get_sync_exit_stack())
+
+        if (stacks := self._provider_sync_exit_stacks) is None:
+            stacks = self._provider_sync_exit_stacks = {}
+        if (stack := stacks.get(provider)) is None:
+            stack = stacks[provider] = (
+                self._get_sync_exit_stack().enter_context(
+                    contextlib.ExitStack()
+                )
+            )
+        return enter_sync_context_maybe(obj, stack)
+
+    def _get_exit_stack(self) -> contextlib.AsyncExitStack:
+        if self._exit_stack is None:
+            self._exit_stack = contextlib.AsyncExitStack()
+        return self._exit_stack
+
+    def _get_sync_exit_stack(self) -> contextlib.ExitStack:
+        if self._sync_exit_stack is None:
+            self._sync_exit_stack = contextlib.ExitStack()
+        return self._sync_exit_stack
+
+    def _drop_dependants(self, provider: Provider[Any]) -> None:
+        # Cached instances that depend on a released one would keep using it
+        # after it's closed, they're created again on next resolve instead
+        dependencies = self._dependencies or {}
+        pending, dropped = [provider], {provider}
+        while pending:
+            released = pending.pop()
+            for dependant, used in dependencies.items():
+                if released in used and dependant not in dropped:
+                    dropped.add(dependant)
+                    pending.append(dependant)
+                    self._cache.pop(dependant, None)
+
+    async def release(self, provider: Provider[Any]) -> None:
+        self._drop_dependants(provider)
+        self._cache.pop(provider, None)
+        if self._provider_exit_stacks and (
+            stack := self._provider_exit_stacks.pop(provider, None)
+        ):
+            await stack.aclose()
+
+    def sync_release(self, provider: Provider[Any]) -> None:
+        self._drop_dependants(provider)
+        self._cache.pop(provider, None)
+        if self._provider_sync_exit_stacks and (
+            stack := self._provider_sync_exit_stacks.pop(provider, None)
+        ):
+            stack.close()
 
     async def __aenter__(self) -> Self:
         return self  # pragma: no cover
@@ -93,7 +279,65 @@ class InstanceStore:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
+        if not (self._concurrent_teardown and self._provider_exit_stacks):
+            await self._close_exit_stack(exc_type, exc_val, exc_tb)
+            return
+
+        errors: list[Exception] = []
+        try:
+            await self._close_concurrently(exc_type, exc_val, exc_tb)
+        except ExceptionGroup as group:
+            errors.extend(group.exceptions)
+        finally:
+            try:
+                await self._close_exit_stack(exc_type, exc_val, exc_tb)
+            except Exception as e:
+                if not errors:
+                    raise
+                errors.append(e)
+        if errors:
+            raise ExceptionGroup(_CLOSE_ERRORS_MESSAGE, errors)
+
+    async def _close_exit_stack(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._exit_stack is not None:
+            await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _close_concurrently(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        stacks, self._provider_exit_stacks = (
+            self._provider_exit_stacks or {},
+            None,
+        )
+        dependencies, self._dependencies = self._dependencies or {}, None
+        dependants = _get_dependants(stacks, dependencies)
+        closed = {provider: anyio.Event() for provider in stacks}
+        errors: list[Exception] = []
+
+        async def close(provider: Provider[Any]) -> None:
+            for dependant in dependants[provider]:
+                await closed[dependant].wait()
+            try:
+                await stacks[provider].__aexit__(exc_type, exc_val, exc_tb)
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+            finally:
+                closed[provider].set()
+
+        async with anyio.create_task_group() as task_group:
+            for provider in stacks:
+                task_group.start_soon(close, provider)
+
+        if errors:
+            raise ExceptionGroup(_CLOSE_ERRORS_MESSAGE, errors)
 
     async def aclose(self) -> None:
         await self.__aexit__(None, None, None)
@@ -107,19 +351,28 @@ class InstanceStore:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        self._sync_exit_stack.__exit__(exc_type, exc_val, exc_tb)
+        if self._sync_exit_stack is not None:
+            self._sync_exit_stack.__exit__(exc_type, exc_val, exc_tb)
 
     def close(self) -> None:
         self.__exit__(None, None, None)
 
 
 class SingletonStore(InstanceStore):
+    requires_lock = True
+
     def __init__(
         self,
         exit_stack: contextlib.AsyncExitStack | None = None,
         sync_exit_stack: contextlib.ExitStack | None = None,
+        *,
+        concurrent_teardown: bool = False,
     ) -> None:
-        super().__init__(exit_stack, sync_exit_stack)
+        super().__init__(
+            exit_stack,
+            sync_exit_stack,
+            concurrent_teardown=concurrent_teardown,
+        )
         self._locks: dict[Provider[Any], anyio.Lock] = collections.defaultdict(
             anyio.Lock,
         )
@@ -128,12 +381,136 @@ class SingletonStore(InstanceStore):
                 threading.Lock,
             )
         )
+        self._expires_at: dict[Provider[Any], float] = {}
+        self._refreshing: set[Provider[Any]] = set()
+        self._generations: dict[
+            Provider[Any],
+            contextlib.AsyncExitStack | contextlib.ExitStack,
+        ] = {}
+        self._pending: dict[
+            Provider[Any],
+            contextlib.AsyncExitStack | contextlib.ExitStack,
+        ] = {}
+        self._retired: list[
+            contextlib.AsyncExitStack | contextlib.ExitStack
+        ] = []
+
+    def add(self, provider: Provider[T], obj: T) -> None:
+        super().add(provider, obj)
+        if not isinstance(provider, TTLSingleton):
+            return
+
+        self._expires_at[provider] = time.monotonic() + provider.ttl
+        if (stack := self._pending.pop(provider, None)) is not None:
+            if (previous := self._generations.get(provider)) is not None:
+                self._retired.append(previous)
+            self._generations[provider] = stack
+
+    def should_refresh(self, provider: Provider[Any]) -> bool:
+        expires_at = self._expires_at.get(provider)
+        if (
+            expires_at is None
+            or expires_at > time.monotonic()
+            or provider in self._refreshing
+        ):
+            return False
+        self._refreshing.add(provider)
+        return True
 
+    async def refresh(
+        self,
+        provider: Provider[Any],
+        provide: Callable[[], Awaitable[object]],
+    ) -> None:
+        try:
+            await provide()
+        finally:
+            self._refreshing.discard(provider)
+            if (stack := self._pending.pop(provider, None)) is not None:
+                self._retired.append(stack)
+            while self._retired:
+                retired = self._retired.pop()
+                if isinstance(retired, contextlib.AsyncExitStack):
+                    await retired.aclose()
+                else:
+                    retired.close()
+
+    def sync_refresh(
+        self,
+        provider: Provider[Any],
+        provide: Callable[[], object],
+    ) -> None:
+        try:
+            provide()
+        finally:
+            self._refreshing.discard(provider)
+            if (stack := self._pending.pop(provider, None)) is not None:
+                self._retired.append(stack)
+            for retired in [
+                retired
+                for retired in self._retired
+                if isinstance(retired, contextlib.ExitStack)
+            ]:
+                self._retired.remove(retired)
+                retired.close()
+
+    async def enter_context(
+        self,
+        obj: AbstractAsyncContextManager[T] | AbstractContextManager[T] | T,
+        provider: Provider[Any] | None = None,
+    ) -> T:
+        if not isinstance(provider, TTLSingleton):
+            return await super().enter_context(obj, provider)
+        stack = self._pending[provider] = contextlib.AsyncExitStack()
+        return await enter_context_maybe(obj, stack)
+
+    def enter_sync_context(
+        self,
+        obj: AbstractContextManager[T] | T,
+        provider: Provider[Any] | None = None,
+    ) -> T:
+        if not isinstance(provider, TTLSingleton):
+            return super().enter_sync_context(obj)
+        stack = self._pending[provider] = contextlib.ExitStack()
+        return enter_sync_context_maybe(obj, stack)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        stacks = [*self._retired, *self._generations.values()]
+        self._retired.clear()
+        self._generations.clear()
+        for stack in reversed(stacks):
+            if isinstance(stack, contextlib.AsyncExitStack):
+                await stack.aclose()
+            else:
+                stack.close()
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        for provider, stack in reversed(list(self._generations.items())):
+            if isinstance(stack, contextlib.ExitStack):
+                del self._generations[provider]
+                stack.close()
+        super().__exit__(exc_type, exc_val, exc_tb)
+
+    # Cached instances are held while locked, so that weakly referenced ones
+    # can't be collected before the caller gets them from the store
     @contextlib.asynccontextmanager
     async def lock(self, provider: Provider[Any]) -> AsyncIterator[bool]:
-        if provider not in self._cache:
+        cached = self._cache.get(provider, NotInCache.sentinel)
+        if cached is NotInCache.sentinel:
             async with self._locks[provider]:
-                yield provider not in self._cache
+                cached = self._cache.get(provider, NotInCache.sentinel)
+                yield cached is NotInCache.sentinel
                 return
         yield False
 
@@ -142,8 +519,173 @@ class SingletonStore(InstanceStore):
         self,
         provider: Provider[Any],
     ) -> Iterator[bool]:
-        if provider not in self._cache:
+        cached = self._cache.get(provider, NotInCache.sentinel)
+        if cached is NotInCache.sentinel:
             with self._sync_locks[provider]:
-                yield provider not in self._cache
+                cached = self._cache.get(provider, NotInCache.sentinel)
+                yield cached is NotInCache.sentinel
                 return
         yield False
+
+
+class WeakSingletonStore(SingletonStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self._cache = weakref.WeakValueDictionary()
+
+
+class ThreadLocalStore(InstanceStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self._local = threading.local()
+        self._stores: list[InstanceStore] = []
+        self._stores_lock = threading.Lock()
+
+    @property
+    def _store(self) -> InstanceStore:
+        try:
+            return typing.cast(InstanceStore, self._local.store)
+        except AttributeError:
+            store = self._local.store = InstanceStore()
+            with self._stores_lock:
+                self._stores.append(store)
+            return store
+
+    def get(self, provider: Provider[T]) -> T | Literal[NotInCache.sentinel]:
+        return self._store.get(provider)
+
+    def add(self, provider: Provider[T], obj: T) -> None:
+        self._store.add(provider, obj)
+
+    async def enter_context(
+        self,
+        obj: AbstractAsyncContextManager[T] | AbstractContextManager[T] | T,
+        provider: Provider[Any] | None = None,
+    ) -> T:
+        return await self._store.enter_context(obj, provider)
+
+    def enter_sync_context(
+        self,
+        obj: AbstractContextManager[T] | T,
+        provider: Provider[Any] | None = None,
+    ) -> T:
+        return self._store.enter_sync_context(obj, provider)
+
+    def _pop_stores(self) -> list[InstanceStore]:
+        with self._stores_lock:
+            stores, self._stores = self._stores, []
+        self._local = threading.local()
+        return stores
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        for store in self._pop_stores():
+            await store.__aexit__(exc_type, exc_val, exc_tb)
+            store.__exit__(exc_type, exc_val, exc_tb)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        for store in self._pop_stores():
+            store.__exit__(exc_type, exc_val, exc_tb)
+
+
+def _current_task() -> object:
+    with contextlib.suppress(RuntimeError):
+        if (task := asyncio.current_task()) is not None:
+            return task
+    if (trio := sys.modules.get("trio")) is not None:
+        with contextlib.suppress(RuntimeError):
+            return trio.lowlevel.current_task()
+    return threading.current_thread()
+
+
+@contextlib.contextmanager
+def _log_close_errors() -> Iterator[None]:
+    try:
+        yield
+    except Exception:
+        logger.exception("Failed to close task local dependencies")
+
+
+class TaskLocalStore(InstanceStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self._stores: weakref.WeakKeyDictionary[
+            object, tuple[InstanceStore, weakref.finalize[Any, Any]]
+        ] = weakref.WeakKeyDictionary()
+        self._finished: list[InstanceStore] = []
+
+    @property
+    def _store(self) -> InstanceStore:
+        task = _current_task()
+        if (entry := self._stores.get(task)) is None:
+            store = InstanceStore()
+            finalizer = weakref.finalize(task, self._finished.append, store)
+            entry = self._stores[task] = (store, finalizer)
+        return entry[0]
+
+    def get(self, provider: Provider[T]) -> T | Literal[NotInCache.sentinel]:
+        return self._store.get(provider)
+
+    def add(self, provider: Provider[T], obj: T) -> None:
+        self._store.add(provider, obj)
+
+    async def enter_context(
+        self,
+        obj: AbstractAsyncContextManager[T] | AbstractContextManager[T] | T,
+        provider: Provider[Any] | None = None,
+    ) -> T:
+        await self._close_finished()
+        return await self._store.enter_context(obj, provider)
+
+    def enter_sync_context(
+        self,
+        obj: AbstractContextManager[T] | T,
+        provider: Provider[Any] | None = None,
+    ) -> T:
+        self._close_finished_sync()
+        return self._store.enter_sync_context(obj, provider)
+
+    async def _close_finished(self) -> None:
+        while self._finished:
+            with _log_close_errors():
+                await self._finished.pop().__aexit__(None, None, None)
+
+    def _close_finished_sync(self) -> None:
+        while self._finished:
+            with _log_close_errors():
+                self._finished.pop().__exit__(None, None, None)
+
+    def _pop_stores(self) -> list[InstanceStore]:
+        entries = list(self._stores.values())
+        self._stores = weakref.WeakKeyDictionary()
+        for _, finalizer in entries:
+            finalizer.detach()
+        stores, self._finished = self._finished, []
+        return [*stores, *(store for store, _ in entries)]
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        for store in reversed(self._pop_stores()):
+            await store.__aexit__(exc_type, exc_val, exc_tb)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        for store in reversed(self._pop_stores()):
+            store.__exit__(exc_type, exc_val, exc_tb)
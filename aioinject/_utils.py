@@ -13,7 +13,7 @@ from contextlib import (
     AsyncExitStack,
     ExitStack,
 )
-from typing import Any, TypeVar
+from typing import Annotated, Any, TypeVar
 
 from aioinject.markers import Inject
 
@@ -22,6 +22,7 @@ _T = TypeVar("_T")
 _F = TypeVar("_F", bound=Callable[..., Any])
 
 sentinel = object()
+_TYPE_CACHE_SIZE = 1024
 
 
 def clear_wrapper(wrapper: _F) -> _F:
@@ -90,6 +91,12 @@ def enter_sync_context_maybe(
     return resolved  # type: ignore[return-value]
 
 
+def qualify(type_: Any, name: str | None) -> Any:
+    if name is None:
+        return type_
+    return Annotated[type_, Inject(name=name)]
+
+
 @contextlib.contextmanager
 def remove_annotation(
     annotations: dict[str, Any],
@@ -121,7 +128,7 @@ def get_return_annotation(
     return eval(ret_annotation, context)  # noqa: S307
 
 
-@functools.cache
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
 def is_iterable_generic_collection(type_: Any) -> bool:
     if not (origin := typing.get_origin(type_)):
         return False
@@ -1,16 +1,29 @@
 import contextlib
 from collections import defaultdict
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Iterator, Mapping, Sequence
 from contextlib import AsyncExitStack
 from types import TracebackType
 from typing import Any
 
+import anyio
+import anyio.abc
 from typing_extensions import Self
 
 from aioinject import _types
-from aioinject._features.generics import get_generic_origin
-from aioinject._store import SingletonStore
+from aioinject._features.generics import (
+    close_generic_provider,
+    get_generic_origin,
+    get_interfaces,
+    is_open_generic,
+)
+from aioinject._store import (
+    InstanceStore,
+    SingletonStore,
+    ThreadLocalStore,
+    WeakSingletonStore,
+)
 from aioinject._types import T
+from aioinject._utils import qualify
 from aioinject.context import InjectionContext, SyncInjectionContext
 from aioinject.extensions import (
     ContextExtension,
@@ -19,15 +32,56 @@ from aioinject.extensions import (
     OnInitExtension,
     SyncContextExtension,
 )
-from aioinject.providers import Provider
+from aioinject.providers import (
+    DependencyLifetime,
+    Keyed,
+    KeyedPool,
+    Lifetime,
+    Pool,
+    Pooled,
+    Provider,
+)
 
 
 class Container:
-    def __init__(self, extensions: Sequence[Extension] | None = None) -> None:
+    def __init__(
+        self,
+        extensions: Sequence[Extension] | None = None,
+        *,
+        concurrent_teardown: bool = False,
+        concurrent_iterables: bool = False,
+        index_interfaces: bool = False,
+        background_tasks: bool = False,
+    ) -> None:
+        self.concurrent_teardown = concurrent_teardown
+        self.concurrent_iterables = concurrent_iterables
+        self.index_interfaces = index_interfaces
+        self.background_tasks = background_tasks
         self._exit_stack = AsyncExitStack()
-        self._singletons = SingletonStore(exit_stack=self._exit_stack)
+        self._singletons = SingletonStore(
+            exit_stack=self._exit_stack,
+            concurrent_teardown=concurrent_teardown,
+        )
+        self._task_group: anyio.abc.TaskGroup | None = None
+        self._cancel_scopes: set[anyio.CancelScope] = set()
+        self._closing = False
+        self._pools: dict[Provider[Any], Pool[Any] | KeyedPool[Any]] = {}
+        self.lifetimes: dict[Lifetime, InstanceStore | None] = {
+            DependencyLifetime.singleton: self._singletons,
+            DependencyLifetime.weak_singleton: WeakSingletonStore(),
+            DependencyLifetime.thread_local: ThreadLocalStore(),
+            DependencyLifetime.item_scoped: None,
+        }
+        self._stores: dict[Lifetime, InstanceStore] = {
+            lifetime: store
+            for lifetime, store in self.lifetimes.items()
+            if store is not None
+        }
 
         self.providers: _types.Providers[Any] = defaultdict(list)
+        self._open_generics: dict[type[Any], type[Any]] = {}
+        self._closed_generics: _types.Providers[Any] = {}
+        self._interfaces: _types.Providers[Any] = defaultdict(list)
         self.type_context: dict[str, type[Any]] = {}
         self.extensions = extensions or []
         self._init_extensions(self.extensions)
@@ -37,6 +91,74 @@ class Container:
             if isinstance(extension, OnInitExtension):
                 extension.on_init(self)
 
+    def register_lifetime(
+        self,
+        lifetime: Lifetime,
+        store: InstanceStore | None = None,
+    ) -> None:
+        builtin = isinstance(lifetime, DependencyLifetime)
+        if builtin or lifetime in self.lifetimes:
+            msg = f"Lifetime {lifetime} is already registered"
+            raise ValueError(msg)
+
+        if store is not None and any(
+            provider.releasable and provider.lifetime is lifetime
+            for providers in self.providers.values()
+            for provider in providers
+        ):
+            msg = (
+                f"Lifetime {lifetime} can't be shared between contexts, "
+                "releasable providers are registered with it"
+            )
+            raise ValueError(msg)
+
+        self.lifetimes[lifetime] = store
+        if store is not None:
+            self._stores[lifetime] = store
+
+    def _custom_stores(self) -> list[InstanceStore]:
+        return [
+            store
+            for store in reversed(self._stores.values())
+            if store is not self._singletons
+        ]
+
+    def _get_pool(
+        self,
+        provider: Pooled[T] | Keyed[T],
+    ) -> Pool[T] | KeyedPool[T]:
+        if (pool := self._pools.get(provider)) is None:
+            pool = self._pools[provider] = (
+                Pool(provider)
+                if isinstance(provider, Pooled)
+                else KeyedPool(provider)
+            )
+        return pool
+
+    def _start_cancellable(
+        self,
+        function: Callable[..., Awaitable[object]],
+        *args: Any,
+    ) -> None:
+        if self._task_group is None:  # pragma: no cover
+            msg = "Container must be entered with background_tasks=True"
+            raise RuntimeError(msg)
+        self._task_group.start_soon(self._run_cancellable, function, *args)
+
+    async def _run_cancellable(
+        self,
+        function: Callable[..., Awaitable[object]],
+        *args: Any,
+    ) -> None:
+        with anyio.CancelScope() as scope:
+            if self._closing:
+                scope.cancel()
+            self._cancel_scopes.add(scope)
+            try:
+                await function(*args)
+            finally:
+                self._cancel_scopes.discard(scope)
+
     def register(self, *providers: Provider[Any]) -> None:
         for provider in providers:
             self._register(provider)
@@ -46,10 +168,23 @@ class Container:
             with contextlib.suppress(ValueError):
                 self._register(provider)
 
+    def _check_releasable(self, provider: Provider[Any]) -> None:
+        if provider.releasable and (
+            provider.lifetime is DependencyLifetime.task_local
+            or self.lifetimes.get(provider.lifetime) is not None
+        ):
+            msg = (
+                f"{provider!r} can't be releasable, instances of "
+                f"{provider.lifetime} lifetime are shared between contexts"
+            )
+            raise ValueError(msg)
+
     def _register(self, provider: Provider[Any]) -> None:
+        self._check_releasable(provider)
+        qualified_type = provider.qualified_type
         if any(
             provider.impl == existing_provider.impl
-            for existing_provider in self.providers.get(provider.type_, [])
+            for existing_provider in self.providers.get(qualified_type, [])
         ):
             msg = (
                 f"Provider for type {provider.type_} with same "
@@ -57,7 +192,16 @@ class Container:
             )
             raise ValueError(msg)
 
-        self.providers[provider.type_].append(provider)
+        self.providers[qualified_type].append(provider)
+        if provider.name is None and is_open_generic(provider.type_):
+            origin = get_generic_origin(provider.type_)
+            self._open_generics[origin] = provider.type_
+            self._closed_generics.clear()
+        if self.index_interfaces:
+            for interface in get_interfaces(provider.type_):
+                self._interfaces[qualify(interface, provider.name)].append(
+                    provider
+                )
 
         class_name = getattr(provider.type_, "__name__", None)
         if class_name and class_name not in self.type_context:
@@ -67,58 +211,92 @@ class Container:
         return self.get_providers(type_)[0]
 
     def get_providers(self, type_: type[T]) -> list[Provider[T]]:
-        if providers := self.providers[type_]:
+        if providers := self.providers.get(type_):
+            return providers
+        if providers := self._closed_generics.get(type_):
+            return providers
+        if providers := self._interfaces.get(type_):
+            return providers
+        if providers := self._close_generic(type_):
             return providers
 
         err_msg = f"Providers for type {type_.__qualname__} not found"
         raise ValueError(err_msg)
 
+    def _close_generic(self, type_: type[T]) -> list[Provider[T]]:
+        open_type = self._open_generics.get(get_generic_origin(type_))
+        if open_type is None or is_open_generic(type_):
+            return []
+        open_providers = self.providers.get(open_type, [])
+        closed = self._closed_generics[type_] = [
+            close_generic_provider(provider, type_)
+            for provider in open_providers
+        ]
+        return closed
+
     def context(
         self,
         context: Mapping[Any, Any] | None = None,
         extensions: Sequence[ContextExtension] = (),
+        *,
+        use_context_var: bool = True,
+        prefetch: Sequence[type[Any]] = (),
+        defer_teardown: bool = False,
     ) -> InjectionContext:
         return InjectionContext(
             container=self,
-            singletons=self._singletons,
+            stores=self._stores,
             extensions=extensions,
             context=context,
+            use_context_var=use_context_var,
+            prefetch=prefetch,
+            defer_teardown=defer_teardown,
         )
 
     def sync_context(
         self,
         context: Mapping[Any, Any] | None = None,
         extensions: Sequence[SyncContextExtension] = (),
+        *,
+        use_context_var: bool = True,
     ) -> SyncInjectionContext:
         return SyncInjectionContext(
             container=self,
-            singletons=self._singletons,
+            stores=self._stores,
             extensions=extensions,
             context=context,
+            use_context_var=use_context_var,
         )
 
     @contextlib.contextmanager
     def override(self, *providers: Provider[Any]) -> Iterator[None]:
         previous = {
-            provider.type_: self.providers.get(provider.type_, None)
+            provider.qualified_type: self.providers.get(
+                provider.qualified_type, None
+            )
             for provider in providers
         }
         overridden = defaultdict(
             list,
-            {provider.type_: [provider] for provider in providers},
+            {provider.qualified_type: [provider] for provider in providers},
         )
 
         self.providers.update(overridden)
+        self._closed_generics.clear()
 
         try:
             yield
         finally:
+            self._closed_generics.clear()
             for provider in providers:
-                del self.providers[provider.type_]
-                if (prev := previous[provider.type_]) is not None:
-                    self.providers[provider.type_] = prev
+                del self.providers[provider.qualified_type]
+                if (prev := previous[provider.qualified_type]) is not None:
+                    self.providers[provider.qualified_type] = prev
 
     async def __aenter__(self) -> Self:
+        if self.background_tasks:
+            self._task_group = anyio.create_task_group()
+            await self._task_group.__aenter__()
         for extension in self.extensions:
             if isinstance(extension, LifespanExtension):
                 await self._exit_stack.enter_async_context(
@@ -132,8 +310,26 @@ class Container:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        if self._task_group is not None:
+            self._closing = True
+            for scope in self._cancel_scopes:
+                scope.cancel()
+            try:
+                await self._task_group.__aexit__(None, None, None)
+            finally:
+                self._task_group = None
+                self._closing = False
+
+        for store in self._custom_stores():
+            await store.__aexit__(exc_type, exc_val, exc_tb)
+        await self._close_pools()
         await self._singletons.__aexit__(exc_type, exc_val, exc_tb)
 
+    async def _close_pools(self) -> None:
+        for pool in self._pools.values():
+            await pool.aclose()
+        self._pools.clear()
+
     async def aclose(self) -> None:
         await self.__aexit__(None, None, None)  # pragma: no cover
 
@@ -146,6 +342,8 @@ class Container:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        for store in self._custom_stores():
+            store.__exit__(exc_type, exc_val, exc_tb)
         self._singletons.__exit__(exc_type, exc_val, exc_tb)
 
     def close(self) -> None:
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import contextlib
 import contextvars
+import functools
 import inspect
+import logging
 from collections import defaultdict
-from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import (
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from contextvars import ContextVar
 from types import TracebackType
 from typing import (
@@ -11,79 +21,427 @@ from typing import (
     Any,
     Generic,
     Literal,
+    TypeAlias,
     TypeVar,
+    cast,
     overload,
 )
 
+import anyio
 from typing_extensions import Self
 
-from aioinject._features.generics import get_generic_parameter_map
-from aioinject._store import InstanceStore, NotInCache
+from aioinject._features.lazy import (
+    Factory,
+    Lazy,
+    SyncFactory,
+    SyncLazy,
+    get_handle_type,
+    unwrap_handle,
+)
+from aioinject._store import InstanceStore, NotInCache, TaskLocalStore
 from aioinject._types import AnyCtx, T
 from aioinject.extensions import (
     ContextExtension,
     OnResolveExtension,
+    OnWaitExtension,
     SyncContextExtension,
     SyncOnResolveExtension,
 )
-from aioinject.providers import Dependency, DependencyLifetime, Object
+from aioinject.providers import (
+    Dependency,
+    DependencyLifetime,
+    Keyed,
+    Lifetime,
+    Object,
+    Pooled,
+    TTLSingleton,
+    collect_dependencies,
+)
 
 
 if TYPE_CHECKING:
     from aioinject import Provider, _types
     from aioinject.containers import Container
 
+
+logger = logging.getLogger(__name__)
+
 _T = TypeVar("_T")
+_T1 = TypeVar("_T1")
+_T2 = TypeVar("_T2")
+_T3 = TypeVar("_T3")
+_T4 = TypeVar("_T4")
+_ExcInfo: TypeAlias = tuple[
+    type[BaseException] | None,
+    BaseException | None,
+    TracebackType | None,
+]
 _TExtension = TypeVar("_TExtension")
 
+_CACHEABLE_LIFETIMES = frozenset(
+    (DependencyLifetime.scoped, DependencyLifetime.singleton),
+)
+
 context_var: ContextVar[AnyCtx] = ContextVar("aioinject_context")
 container_var: ContextVar[Container] = ContextVar("aioinject_container")
 
 
+@functools.cache
+def _is_pooled(provider_type: type[Provider[Any]]) -> bool:
+    # Checked per provider class, isinstance checks against protocols are slow
+    return issubclass(provider_type, (Pooled, Keyed))
+
+
+def _is_cacheable(provider: Provider[Any]) -> bool:
+    return (
+        provider.lifetime in _CACHEABLE_LIFETIMES
+        and not provider.releasable
+        and not isinstance(provider, TTLSingleton)
+    )
+
+
+@contextlib.contextmanager
+def _closing(stack: contextlib.ExitStack) -> Iterator[None]:
+    with stack:
+        yield
+
+
 class _BaseInjectionContext(Generic[_TExtension]):
-    def __init__(
+    # State that's only set on demand lives on the class, so that creating
+    # a context stays cheap
+    _child_stores: Mapping[Lifetime, InstanceStore] | None = None
+    _task_store: TaskLocalStore | None = None
+    _token: contextvars.Token[AnyCtx] | None = None
+    _iterables: dict[type[Any], tuple[Any, ...]] | None = None
+    _handles: dict[type[Any], Provider[Any]] | None = None
+    _closed = False
+
+    def __init__(  # noqa: PLR0913
         self,
         container: Container,
-        singletons: InstanceStore,
+        stores: Mapping[Lifetime, InstanceStore],
         extensions: Sequence[_TExtension],
         context: Mapping[Any, Any] | None = None,
+        *,
+        use_context_var: bool = True,
+        parent: _BaseInjectionContext[_TExtension] | None = None,
+        store: InstanceStore | None = None,
+        lifetime: Lifetime | None = None,
     ) -> None:
         self._container = container
         self._extensions = extensions
+        self._use_context_var = use_context_var
+        self._parent = parent
 
-        self._singletons = singletons
-        self._store = InstanceStore()
+        self._stores = stores
+        self._lifetime = lifetime
+        self._store = store or InstanceStore(
+            concurrent_teardown=container.concurrent_teardown,
+        )
 
-        self._token: contextvars.Token[AnyCtx] | None = None
         self._providers: _types.Providers[Any] = defaultdict(list)
 
         if context:
             for key, value in context.items():
                 self.register(Object(value, type_=key))
 
-        self._closed = False
+    def _get_store(self, lifetime: Lifetime) -> InstanceStore:
+        if (store := self._stores.get(lifetime)) is not None:
+            return store
+        if (
+            lifetime is self._lifetime
+            or lifetime is DependencyLifetime.scoped
+            or lifetime is DependencyLifetime.transient
+        ):
+            return self._store
+        if lifetime is DependencyLifetime.task_local:
+            return self._get_task_store()
+        if self._parent is not None:
+            return self._parent._get_store(lifetime)  # noqa: SLF001
+        if lifetime is DependencyLifetime.item_scoped:
+            # Outside of a batch item scoped dependencies behave like scoped
+            return self._store
+        raise self._lifetime_error(lifetime)
+
+    def _lifetime_error(self, lifetime: Lifetime) -> ValueError:
+        if lifetime not in self._container.lifetimes:
+            msg = (
+                f"Lifetime {lifetime} is not registered, "
+                "register it with Container.register_lifetime"
+            )
+        else:
+            msg = (
+                f"Lifetime {lifetime} is not open in this context, "
+                "resolve it from ctx.child(lifetime=...)"
+            )
+        return ValueError(msg)
+
+    def _get_owned_store(
+        self, provider: Provider[Any]
+    ) -> InstanceStore | None:
+        # Instances cached by parent contexts may still be used by them or by
+        # sibling contexts, so only this context's own ones are released
+        store = self._get_store(provider.lifetime)
+        if store is self._store or provider.lifetime is self._lifetime:
+            return store
+        return None
 
-    def _get_store(self, lifetime: DependencyLifetime) -> InstanceStore:
-        if lifetime is DependencyLifetime.singleton:
-            return self._singletons
-        return self._store
+    def _get_task_store(self) -> TaskLocalStore:
+        if self._parent is not None:
+            return self._parent._get_task_store()  # noqa: SLF001
+        if self._task_store is None:
+            self._task_store = TaskLocalStore()
+        return self._task_store
 
     def _get_providers(self, type_: type[_T]) -> list[Provider[_T]]:
-        return self._providers.get(type_) or self._container.get_providers(
-            type_,
-        )
+        if self._handles and (handle := self._handles.get(type_)):
+            return [handle]
+        try:
+            return self._find_providers(type_)
+        except ValueError:
+            if (handle := self._make_handle_provider(type_)) is None:
+                raise
+        # Handles are bound to the context that created them, so they're
+        # neither inherited by child contexts nor cached in shared stores
+        handle.lifetime = DependencyLifetime.transient
+        if self._handles is None:
+            self._handles = {}
+        self._handles[type_] = handle
+        return [handle]
+
+    def _find_providers(self, type_: type[_T]) -> list[Provider[_T]]:
+        if providers := self._providers.get(type_):
+            return providers
+        if self._parent is not None:
+            return self._parent._find_providers(type_)  # noqa: SLF001
+        return self._container.get_providers(type_)
+
+    def _make_handle_provider(self, type_: type[Any]) -> Provider[Any] | None:
+        raise NotImplementedError
+
+    def _compile_dependencies(
+        self,
+        provider: Provider[Any],
+    ) -> list[tuple[str, type[Any], Provider[Any] | None]]:
+        return [
+            (
+                name,
+                type_,
+                None if is_iterable else self._get_providers(type_)[-1],
+            )
+            for name, type_, is_iterable in provider.specialized_dependencies(
+                context=self._container.type_context
+            )
+        ]
+
+    def _dependency_providers(
+        self,
+        provider: Provider[Any],
+    ) -> list[Provider[Any]]:
+        providers: list[Provider[Any]] = []
+        for _, type_, is_iterable in provider.specialized_dependencies(
+            context=self._container.type_context
+        ):
+            found = self._get_providers(type_)
+            providers.extend(found if is_iterable else found[-1:])
+            if (inner := unwrap_handle(type_)) is not type_:
+                # Handles resolve the wrapped type later, it's used by the
+                # provider all the same
+                with contextlib.suppress(ValueError):
+                    providers.extend(self._get_providers(inner)[-1:])
+        return providers
 
     def register(self, provider: Provider[Any]) -> None:
-        self._providers[provider.type_].append(provider)
+        self._providers[provider.qualified_type].append(provider)
+        if self._iterables:
+            self._iterables.pop(provider.qualified_type, None)
+        if self._handles:
+            self._handles.pop(provider.qualified_type, None)
+
+    def child(
+        self,
+        context: Mapping[Any, Any] | None = None,
+        *,
+        lifetime: Lifetime | None = None,
+        store: InstanceStore | None = None,
+    ) -> Self:
+        if lifetime is None:
+            return self.__class__(
+                container=self._container,
+                stores=self._stores,
+                extensions=self._extensions,
+                context=context,
+                use_context_var=self._use_context_var,
+                parent=self,
+                store=InstanceStore(
+                    parent=self._store,
+                    concurrent_teardown=self._container.concurrent_teardown,
+                ),
+            )
+
+        lifetimes = self._container.lifetimes
+        if lifetime not in lifetimes or lifetimes[lifetime] is not None:
+            msg = f"Lifetime {lifetime} can't be opened in a child context"
+            raise ValueError(msg)
+        return self._open_lifetime(lifetime, context, store)
+
+    def item(self, context: Mapping[Any, Any] | None = None) -> Self:
+        return self._open_lifetime(DependencyLifetime.item_scoped, context)
+
+    def _open_lifetime(
+        self,
+        lifetime: Lifetime,
+        context: Mapping[Any, Any] | None,
+        store: InstanceStore | None = None,
+    ) -> Self:
+        if self._child_stores is None:
+            # Scoped dependencies stay shared with this context, the child's
+            # own store is used for its lifetime and for transients
+            self._child_stores = {
+                **self._stores,
+                DependencyLifetime.scoped: self._get_store(
+                    DependencyLifetime.scoped,
+                ),
+            }
+        return self.__class__(
+            container=self._container,
+            stores=(
+                self._child_stores
+                if store is None
+                else {**self._child_stores, lifetime: store}
+            ),
+            extensions=self._extensions,
+            context=context,
+            use_context_var=self._use_context_var,
+            parent=self,
+            store=InstanceStore(
+                concurrent_teardown=self._container.concurrent_teardown,
+            ),
+            lifetime=lifetime,
+        )
 
 
 class InjectionContext(_BaseInjectionContext[ContextExtension]):
+    _prefetching: tuple[anyio.CancelScope, anyio.Event] | None = None
+    _inflight: dict[Provider[Any], anyio.Event] | None = None
+    _concurrent_calls = 0
+    _spawned = 0
+    _pending_exit: _ExcInfo | None = None
+
+    def __init__(  # noqa: PLR0913
+        self,
+        container: Container,
+        stores: Mapping[Lifetime, InstanceStore],
+        extensions: Sequence[ContextExtension],
+        context: Mapping[Any, Any] | None = None,
+        *,
+        use_context_var: bool = True,
+        parent: InjectionContext | None = None,
+        store: InstanceStore | None = None,
+        lifetime: Lifetime | None = None,
+        prefetch: Sequence[type[Any]] = (),
+        defer_teardown: bool = False,
+    ) -> None:
+        super().__init__(
+            container,
+            stores,
+            extensions,
+            context,
+            use_context_var=use_context_var,
+            parent=parent,
+            store=store,
+            lifetime=lifetime,
+        )
+        self._prefetch = prefetch
+        self._defer_teardown = defer_teardown
+
     async def resolve(self, type_: type[_T]) -> _T:
         return await self._resolve(type_, is_iterable=False)
 
+    def _make_handle_provider(self, type_: type[Any]) -> Provider[Any] | None:
+        if (inner := get_handle_type(type_, Lazy)) is not None:
+            return Object(Lazy(functools.partial(self.resolve, inner)), type_)
+        if (inner := get_handle_type(type_, Factory)) is not None:
+            return Object(Factory(self._compile_factory(inner)), type_)
+        return None
+
+    def _compile_factory(
+        self,
+        type_: type[_T],
+    ) -> Callable[[], Coroutine[Any, Any, _T]]:
+        provider = self._get_providers(type_)[-1]
+        if provider.lifetime is not DependencyLifetime.transient:
+            return functools.partial(self._resolve_provider, provider)
+
+        store = self._get_store(provider.lifetime)
+        dependencies = self._compile_dependencies(provider)
+
+        async def factory() -> _T:
+            kwargs = {
+                name: await self._resolve(dependency_type, is_iterable=True)
+                if dependency is None
+                else await self._resolve_provider(dependency)
+                for name, dependency_type, dependency in dependencies
+            }
+            return await self._provide_and_store(provider, store, kwargs)
+
+        return factory
+
     async def resolve_iterable(self, type_: type[_T]) -> list[_T]:
         return await self._resolve(type_, is_iterable=True)
 
+    @overload
+    async def resolve_many(
+        self,
+        type_1: type[_T1],
+        type_2: type[_T2],
+        /,
+        *,
+        concurrent: bool = ...,
+    ) -> tuple[_T1, _T2]: ...
+
+    @overload
+    async def resolve_many(
+        self,
+        type_1: type[_T1],
+        type_2: type[_T2],
+        type_3: type[_T3],
+        /,
+        *,
+        concurrent: bool = ...,
+    ) -> tuple[_T1, _T2, _T3]: ...
+
+    @overload
+    async def resolve_many(
+        self,
+        type_1: type[_T1],
+        type_2: type[_T2],
+        type_3: type[_T3],
+        type_4: type[_T4],
+        /,
+        *,
+        concurrent: bool = ...,
+    ) -> tuple[_T1, _T2, _T3, _T4]: ...
+
+    @overload
+    async def resolve_many(
+        self,
+        *types: type[Any],
+        concurrent: bool = ...,
+    ) -> tuple[Any, ...]: ...
+
+    async def resolve_many(
+        self,
+        *types: type[Any],
+        concurrent: bool = False,
+    ) -> tuple[Any, ...]:
+        providers = [self._get_providers(type_)[-1] for type_ in types]
+        if concurrent:
+            return tuple(await self._resolve_concurrently(providers))
+        return tuple(
+            [await self._resolve_provider(provider) for provider in providers]
+        )
+
     @overload
     async def _resolve(
         self,
@@ -106,12 +464,49 @@ class InjectionContext(_BaseInjectionContext[ContextExtension]):
         *,
         is_iterable: bool,
     ) -> _T | list[_T]:
-        providers = self._get_providers(type_)
         if not is_iterable:
-            return await self._resolve_provider(providers[-1])  # type: ignore[arg-type]
-        return [
-            await self._resolve_provider(provider) for provider in providers
-        ]
+            return await self._resolve_provider(self._get_providers(type_)[-1])
+        return await self._resolve_all(type_)
+
+    async def _resolve_all(self, type_: type[_T]) -> list[_T]:
+        if self._iterables and (cached := self._iterables.get(type_)):
+            return list(cached)
+
+        providers = self._get_providers(type_)
+        if self._container.concurrent_iterables and len(providers) > 1:
+            instances = await self._resolve_concurrently(providers)
+        else:
+            instances = [
+                await self._resolve_provider(provider)
+                for provider in providers
+            ]
+        if all(_is_cacheable(provider) for provider in providers):
+            if self._iterables is None:
+                self._iterables = {}
+            self._iterables[type_] = tuple(instances)
+        return instances
+
+    async def _resolve_concurrently(
+        self,
+        providers: Sequence[Provider[Any]],
+    ) -> list[Any]:
+        if self._inflight is None:
+            self._inflight = {}
+        self._concurrent_calls += 1
+        resolved: list[Any] = [None] * len(providers)
+
+        async def resolve(index: int, provider: Provider[Any]) -> None:
+            resolved[index] = await self._resolve_provider(provider)
+
+        try:
+            async with anyio.create_task_group() as task_group:
+                for index, provider in enumerate(providers):
+                    task_group.start_soon(resolve, index, provider)
+        finally:
+            self._concurrent_calls -= 1
+            if not self._concurrent_calls and not self._prefetch:
+                self._inflight = None
+        return resolved
 
     async def _resolve_provider(
         self,
@@ -119,27 +514,34 @@ class InjectionContext(_BaseInjectionContext[ContextExtension]):
     ) -> _T:
         store = self._get_store(provider.lifetime)
         if (cached := store.get(provider)) is not NotInCache.sentinel:
+            if store.should_refresh(provider):
+                return await self._refresh(provider, store, cached)
             return cached
 
-        provider_dependencies = provider.collect_dependencies(
-            context=self._container.type_context
-        )
-        dependencies_map = get_generic_parameter_map(
-            provider.type_,  # type: ignore[arg-type]
-            provider_dependencies,
-        )
-        dependencies = {
-            dependency.name: await self._resolve(  # type: ignore[call-overload]
-                type_=dependencies_map.get(
-                    dependency.name,
-                    dependency.inner_type,
-                ),
-                is_iterable=dependency.is_iterable,
-            )
-            for dependency in provider_dependencies
-        }
+        inflight = self._inflight
+        if (
+            inflight is None
+            or provider.lifetime is DependencyLifetime.transient
+        ):
+            return await self._create(provider, store)
+
+        if (event := inflight.get(provider)) is not None:
+            await event.wait()
+            if (resolved := store.get(provider)) is not NotInCache.sentinel:
+                return resolved
 
-        if provider.lifetime is DependencyLifetime.singleton:
+        event = inflight[provider] = anyio.Event()
+        try:
+            return await self._create(provider, store)
+        finally:
+            del inflight[provider]
+            event.set()
+
+    async def _create(
+        self, provider: Provider[_T], store: InstanceStore
+    ) -> _T:
+        dependencies = await self._resolve_dependencies(provider)
+        if store.requires_lock:
             async with store.lock(provider) as should_provide:
                 if should_provide:
                     return await self._provide_and_store(
@@ -149,16 +551,107 @@ class InjectionContext(_BaseInjectionContext[ContextExtension]):
 
         return await self._provide_and_store(provider, store, dependencies)
 
+    async def _resolve_dependencies(
+        self,
+        provider: Provider[Any],
+    ) -> dict[str, object]:
+        return {
+            name: await self._resolve(type_, is_iterable=is_iterable)  # type: ignore[call-overload]
+            for name, type_, is_iterable in provider.specialized_dependencies(
+                context=self._container.type_context
+            )
+        }
+
+    async def _refresh(
+        self,
+        provider: Provider[_T],
+        store: InstanceStore,
+        stale: _T,
+    ) -> _T:
+        if self._container._task_group is not None:  # noqa: SLF001
+            self._container._start_cancellable(  # noqa: SLF001
+                self._refresh_in_context, provider, store
+            )
+            return stale
+        # Refreshing inline closes the stale instance, or keeps it if the
+        # refresh failed, so the instance is looked up again
+        await self._refresh_in_context(provider, store)
+        return store.get(provider)  # type: ignore[return-value]
+
+    async def _refresh_in_context(
+        self,
+        provider: Provider[Any],
+        store: InstanceStore,
+    ) -> None:
+        async with self._container.context(
+            extensions=self._extensions,
+            use_context_var=False,
+        ) as context:
+            try:
+                await store.refresh(
+                    provider,
+                    functools.partial(context._provide, provider, store),  # noqa: SLF001
+                )
+            except Exception:
+                logger.exception("Failed to refresh %r", provider)
+
+    async def _provide(
+        self,
+        provider: Provider[_T],
+        store: InstanceStore,
+    ) -> _T:
+        dependencies = await self._resolve_dependencies(provider)
+        return await self._provide_and_store(provider, store, dependencies)
+
     async def _provide_and_store(
         self,
         provider: Provider[_T],
         store: InstanceStore,
         dependencies: Mapping[str, object],
     ) -> _T:
-        provided = await provider.provide(dependencies)
+        if (limit := provider.limit) is None:
+            return await self._create_and_store(provider, store, dependencies)
+
+        waited = await limit.acquire()
+        permit = contextlib.ExitStack()
+        permit.callback(limit.release)
+        try:
+            if waited:
+                await self._on_wait(provider=provider, seconds=waited)
+            if limit.hold:
+                # Closing the permit again when the instance is closed is a
+                # no-op, so it's released right away if creation fails
+                await store.enter_context(_closing(permit), provider)
+            provided = await self._create_and_store(
+                provider, store, dependencies
+            )
+        except BaseException:
+            permit.close()
+            raise
+        if not limit.hold:
+            permit.close()
+        return provided
+
+    async def _create_and_store(
+        self,
+        provider: Provider[_T],
+        store: InstanceStore,
+        dependencies: Mapping[str, object],
+    ) -> _T:
+        if _is_pooled(type(provider)):
+            pool = self._container._get_pool(  # noqa: SLF001
+                cast("Pooled[_T] | Keyed[_T]", provider)
+            )
+            provided: Any = pool.lease(dependencies)
+        else:
+            provided = await provider.provide(dependencies)
         if provider.is_generator:
-            provided = await store.enter_context(provided)
+            provided = await store.enter_context(provided, provider)
         store.add(provider, provided)
+        if store.tracks_dependencies:
+            store.add_dependencies(
+                provider, self._dependency_providers(provider)
+            )
         await self._on_resolve(provider=provider, instance=provided)
         return provided
 
@@ -187,26 +680,145 @@ class InjectionContext(_BaseInjectionContext[ContextExtension]):
         *args: Any,
         **kwargs: Any,
     ) -> _T:
+        dependencies = [
+            dependency
+            for dependency in dependencies
+            if dependency.name not in kwargs
+        ]
         resolved = {
             dependency.name: await self._resolve(  # type: ignore[call-overload]
-                type_=dependency.inner_type,
+                type_=dependency.qualified_type,
                 is_iterable=dependency.is_iterable,
             )
             for dependency in dependencies
-            if dependency.name not in kwargs
         }
 
         if inspect.iscoroutinefunction(function):
-            return await function(*args, **kwargs, **resolved)
-        return function(*args, **kwargs, **resolved)  # type: ignore[return-value]
+            try:
+                return await function(*args, **kwargs, **resolved)
+            finally:
+                await self._release_dependencies(dependencies)
+
+        result = function(*args, **kwargs, **resolved)
+        if not inspect.isasyncgen(result):
+            await self._release_dependencies(dependencies)
+        return result  # type: ignore[return-value]
+
+    async def release(self, type_: type[Any]) -> None:
+        for provider in self._get_providers(type_):
+            if not provider.releasable:
+                msg = f"{provider!r} is not releasable"
+                raise ValueError(msg)
+            await self._release(provider)
+
+    async def _release_dependencies(
+        self,
+        dependencies: Iterable[Dependency[object]],
+    ) -> None:
+        for dependency in dependencies:
+            for provider in self._get_providers(dependency.qualified_type):
+                if provider.releasable:
+                    await self._release(provider)
+
+    async def _release(self, provider: Provider[Any]) -> None:
+        if (store := self._get_owned_store(provider)) is not None:
+            self._iterables = None
+            await store.release(provider)
 
     async def _on_resolve(self, provider: Provider[T], instance: T) -> None:
         for extension in self._extensions:
             if isinstance(extension, OnResolveExtension):
                 await extension.on_resolve(self, provider, instance)
 
+    async def _on_wait(self, provider: Provider[Any], seconds: float) -> None:
+        for extension in self._extensions:
+            if isinstance(extension, OnWaitExtension):
+                await extension.on_wait(self, provider, seconds)
+
+    def spawn(
+        self,
+        function: Callable[..., Coroutine[Any, Any, Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        task_group = self._container._task_group  # noqa: SLF001
+        if task_group is None:
+            msg = (
+                "Container must be entered with background_tasks=True "
+                "to spawn tasks"
+            )
+            raise RuntimeError(msg)
+        if self._closed:
+            msg = "Can't spawn tasks from a closed context"
+            raise RuntimeError(msg)
+
+        self._retain()
+        task_group.start_soon(
+            functools.partial(self._run_spawned, function, *args, **kwargs)
+        )
+
+    async def _run_spawned(
+        self,
+        function: Callable[..., Coroutine[Any, Any, Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        try:
+            await self.execute(
+                function,
+                collect_dependencies(function),
+                *args,
+                **kwargs,
+            )
+        except Exception:
+            logger.exception("Spawned task %r failed", function)
+        finally:
+            await self._unretain()
+
+    def _retain(self) -> None:
+        self._spawned += 1
+        if isinstance(self._parent, InjectionContext):
+            self._parent._retain()  # noqa: SLF001
+
+    async def _unretain(self) -> None:
+        self._spawned -= 1
+        if not self._spawned and self._pending_exit is not None:
+            exc_info, self._pending_exit = self._pending_exit, None
+            await self._deferred_teardown(*exc_info)
+        if isinstance(self._parent, InjectionContext):
+            await self._parent._unretain()  # noqa: SLF001
+
+    async def _run_prefetch(
+        self,
+        scope: anyio.CancelScope,
+        done: anyio.Event,
+    ) -> None:
+        try:
+            with scope:
+                async with anyio.create_task_group() as task_group:
+                    for type_ in self._prefetch:
+                        task_group.start_soon(self._prefetch_type, type_)
+        finally:
+            done.set()
+
+    async def _prefetch_type(self, type_: type[Any]) -> None:
+        # Errors are raised again when the dependency is actually resolved
+        with contextlib.suppress(Exception):
+            await self.resolve(type_)
+
     async def __aenter__(self) -> Self:
-        self._token = context_var.set(self)
+        if self._use_context_var:
+            self._token = context_var.set(self)
+
+        if self._prefetch:
+            self._inflight = {}
+            self._prefetching = (anyio.CancelScope(), anyio.Event())
+            if self._container._task_group is None:  # noqa: SLF001
+                await self._run_prefetch(*self._prefetching)
+            else:
+                self._container._start_cancellable(  # noqa: SLF001
+                    self._run_prefetch, *self._prefetching
+                )
         return self
 
     async def __aexit__(
@@ -218,18 +830,118 @@ class InjectionContext(_BaseInjectionContext[ContextExtension]):
         if self._closed:
             return
 
-        await self._store.__aexit__(exc_type, exc_val, exc_tb)
-        context_var.reset(self._token)  # type: ignore[arg-type]
+        if self._prefetching is not None:
+            scope, done = self._prefetching
+            scope.cancel()
+            await done.wait()
+
+        task_group = self._container._task_group  # noqa: SLF001
+        if self._spawned:
+            self._pending_exit = (exc_type, exc_val, exc_tb)
+        elif self._defer_teardown and task_group is not None:
+            task_group.start_soon(
+                self._deferred_teardown, exc_type, exc_val, exc_tb
+            )
+        else:
+            await self._teardown(exc_type, exc_val, exc_tb)
+        if self._token is not None:
+            context_var.reset(self._token)
         self._closed = True
 
+    async def _teardown(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._task_store is not None:
+            await self._task_store.__aexit__(exc_type, exc_val, exc_tb)
+        await self._store.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _deferred_teardown(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        with anyio.CancelScope(shield=True):
+            try:
+                await self._teardown(exc_type, exc_val, exc_tb)
+            except Exception:
+                logger.exception("Failed to close context")
+
 
 class SyncInjectionContext(_BaseInjectionContext[SyncContextExtension]):
     def resolve(self, type_: type[_T]) -> _T:
         return self._resolve(type_, is_iterable=False)
 
+    def _make_handle_provider(self, type_: type[Any]) -> Provider[Any] | None:
+        if (inner := get_handle_type(type_, SyncLazy)) is not None:
+            return Object(
+                SyncLazy(functools.partial(self.resolve, inner)), type_
+            )
+        if (inner := get_handle_type(type_, SyncFactory)) is not None:
+            return Object(SyncFactory(self._compile_factory(inner)), type_)
+        return None
+
+    def _compile_factory(self, type_: type[_T]) -> Callable[[], _T]:
+        provider = self._get_providers(type_)[-1]
+        if provider.lifetime is not DependencyLifetime.transient:
+            return functools.partial(self._resolve_provider, provider)
+
+        store = self._get_store(provider.lifetime)
+        dependencies = self._compile_dependencies(provider)
+
+        def factory() -> _T:
+            kwargs = {
+                name: self._resolve(dependency_type, is_iterable=True)
+                if dependency is None
+                else self._resolve_provider(dependency)
+                for name, dependency_type, dependency in dependencies
+            }
+            return self._provide_and_store(provider, store, kwargs)
+
+        return factory
+
     def resolve_iterable(self, type_: type[_T]) -> list[_T]:
         return self._resolve(type_, is_iterable=True)
 
+    @overload
+    def resolve_many(
+        self,
+        type_1: type[_T1],
+        type_2: type[_T2],
+        /,
+    ) -> tuple[_T1, _T2]: ...
+
+    @overload
+    def resolve_many(
+        self,
+        type_1: type[_T1],
+        type_2: type[_T2],
+        type_3: type[_T3],
+        /,
+    ) -> tuple[_T1, _T2, _T3]: ...
+
+    @overload
+    def resolve_many(
+        self,
+        type_1: type[_T1],
+        type_2: type[_T2],
+        type_3: type[_T3],
+        type_4: type[_T4],
+        /,
+    ) -> tuple[_T1, _T2, _T3, _T4]: ...
+
+    @overload
+    def resolve_many(self, *types: type[Any]) -> tuple[Any, ...]: ...
+
+    def resolve_many(self, *types: type[Any]) -> tuple[Any, ...]:
+        providers = [self._get_providers(type_)[-1] for type_ in types]
+        return tuple(
+            [self._resolve_provider(provider) for provider in providers]
+        )
+
     @overload
     def _resolve(
         self,
@@ -252,10 +964,23 @@ class SyncInjectionContext(_BaseInjectionContext[SyncContextExtension]):
         *,
         is_iterable: bool,
     ) -> _T | list[_T]:
-        providers = self._get_providers(type_)
         if not is_iterable:
-            return self._resolve_provider(providers[-1])
-        return [self._resolve_provider(provider) for provider in providers]
+            return self._resolve_provider(self._get_providers(type_)[-1])
+        return self._resolve_all(type_)
+
+    def _resolve_all(self, type_: type[_T]) -> list[_T]:
+        if self._iterables and (cached := self._iterables.get(type_)):
+            return list(cached)
+
+        providers = self._get_providers(type_)
+        instances = [
+            self._resolve_provider(provider) for provider in providers
+        ]
+        if all(_is_cacheable(provider) for provider in providers):
+            if self._iterables is None:
+                self._iterables = {}
+            self._iterables[type_] = tuple(instances)
+        return instances
 
     def _resolve_provider(
         self,
@@ -263,27 +988,12 @@ class SyncInjectionContext(_BaseInjectionContext[SyncContextExtension]):
     ) -> _T:
         store = self._get_store(provider.lifetime)
         if (cached := store.get(provider)) is not NotInCache.sentinel:
+            if store.should_refresh(provider):
+                return self._refresh(provider, store)
             return cached
 
-        provider_dependencies = provider.collect_dependencies(
-            context=self._container.type_context
-        )
-        dependencies_map = get_generic_parameter_map(
-            provider.type_,  # type: ignore[arg-type]
-            provider_dependencies,
-        )
-        dependencies = {
-            dependency.name: self._resolve(  # type: ignore[call-overload]
-                type_=dependencies_map.get(
-                    dependency.name,
-                    dependency.inner_type,
-                ),
-                is_iterable=dependency.is_iterable,
-            )
-            for dependency in provider_dependencies
-        }
-
-        if provider.lifetime is DependencyLifetime.singleton:
+        dependencies = self._resolve_dependencies(provider)
+        if store.requires_lock:
             with store.sync_lock(provider) as should_provide:
                 if should_provide:
                     return self._provide_and_store(
@@ -293,6 +1003,35 @@ class SyncInjectionContext(_BaseInjectionContext[SyncContextExtension]):
 
         return self._provide_and_store(provider, store, dependencies)
 
+    def _resolve_dependencies(
+        self,
+        provider: Provider[Any],
+    ) -> dict[str, object]:
+        return {
+            name: self._resolve(type_, is_iterable=is_iterable)  # type: ignore[call-overload]
+            for name, type_, is_iterable in provider.specialized_dependencies(
+                context=self._container.type_context
+            )
+        }
+
+    def _refresh(self, provider: Provider[_T], store: InstanceStore) -> _T:
+        with self._container.sync_context(
+            extensions=self._extensions,
+            use_context_var=False,
+        ) as context:
+            try:
+                store.sync_refresh(
+                    provider,
+                    functools.partial(context._provide, provider, store),  # noqa: SLF001
+                )
+            except Exception:
+                logger.exception("Failed to refresh %r", provider)
+        return store.get(provider)  # type: ignore[return-value]
+
+    def _provide(self, provider: Provider[_T], store: InstanceStore) -> _T:
+        dependencies = self._resolve_dependencies(provider)
+        return self._provide_and_store(provider, store, dependencies)
+
     def _provide_and_store(
         self,
         provider: Provider[_T],
@@ -301,8 +1040,12 @@ class SyncInjectionContext(_BaseInjectionContext[SyncContextExtension]):
     ) -> _T:
         provided = provider.provide_sync(dependencies)
         if provider.is_generator:
-            provided = store.enter_sync_context(provided)
+            provided = store.enter_sync_context(provided, provider)
         store.add(provider, provided)
+        if store.tracks_dependencies:
+            store.add_dependencies(
+                provider, self._dependency_providers(provider)
+            )
         self._on_resolve(provider=provider, instance=provided)
         return provided
 
@@ -313,15 +1056,47 @@ class SyncInjectionContext(_BaseInjectionContext[SyncContextExtension]):
         *args: Any,
         **kwargs: Any,
     ) -> _T:
+        dependencies = [
+            dependency
+            for dependency in dependencies
+            if dependency.name not in kwargs
+        ]
         resolved = {
             dependency.name: self._resolve(  # type: ignore[call-overload]
-                type_=dependency.inner_type,
+                type_=dependency.qualified_type,
                 is_iterable=dependency.is_iterable,
             )
             for dependency in dependencies
-            if dependency.name not in kwargs
         }
-        return function(*args, **kwargs, **resolved)
+        try:
+            result = function(*args, **kwargs, **resolved)
+        except BaseException:
+            self._release_dependencies(dependencies)
+            raise
+        if not inspect.isgenerator(result):
+            self._release_dependencies(dependencies)
+        return result
+
+    def release(self, type_: type[Any]) -> None:
+        for provider in self._get_providers(type_):
+            if not provider.releasable:
+                msg = f"{provider!r} is not releasable"
+                raise ValueError(msg)
+            self._release(provider)
+
+    def _release_dependencies(
+        self,
+        dependencies: Iterable[Dependency[object]],
+    ) -> None:
+        for dependency in dependencies:
+            for provider in self._get_providers(dependency.qualified_type):
+                if provider.releasable:
+                    self._release(provider)
+
+    def _release(self, provider: Provider[Any]) -> None:
+        if (store := self._get_owned_store(provider)) is not None:
+            self._iterables = None
+            store.sync_release(provider)
 
     def _on_resolve(self, provider: Provider[T], instance: T) -> None:
         for extension in self._extensions:
@@ -329,7 +1104,8 @@ class SyncInjectionContext(_BaseInjectionContext[SyncContextExtension]):
                 extension.on_resolve_sync(self, provider, instance)
 
     def __enter__(self) -> Self:
-        self._token = context_var.set(self)
+        if self._use_context_var:
+            self._token = context_var.set(self)
         return self
 
     def __exit__(
@@ -341,6 +1117,9 @@ class SyncInjectionContext(_BaseInjectionContext[SyncContextExtension]):
         if self._closed:  # pragma: no cover
             return
 
+        if self._task_store is not None:
+            self._task_store.__exit__(exc_type, exc_val, exc_tb)
         self._store.__exit__(exc_type, exc_val, exc_tb)
-        context_var.reset(self._token)  # type: ignore[arg-type]
+        if self._token is not None:
+            context_var.reset(self._token)
         self._closed = True
@@ -74,6 +74,83 @@ def _wrap_async_gen(
     return wrapper
 
 
+def _wrap_from_parameter(
+    function: Callable[_P, Coroutine[Any, Any, _T]],
+    parameter: inspect.Parameter,
+    get_context: Callable[[Any], InjectionContext],
+) -> Callable[_P, Coroutine[Any, Any, _T]]:
+    dependencies = list(collect_dependencies(function))
+    signature = inspect.signature(function)
+    passthrough = parameter.name in signature.parameters
+
+    @functools.wraps(function)
+    async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+        source = (
+            kwargs[parameter.name]
+            if passthrough
+            else kwargs.pop(parameter.name)
+        )
+        return await get_context(source).execute(
+            function,
+            dependencies,
+            *args,
+            **kwargs,
+        )
+
+    if not passthrough:
+        params = list(signature.parameters.values())
+        position = len(params)
+        if params and params[-1].kind is inspect.Parameter.VAR_KEYWORD:
+            position -= 1
+        params.insert(position, parameter)
+        wrapper.__signature__ = signature.replace(  # type: ignore[attr-defined]
+            parameters=params,
+        )
+        wrapper.__annotations__ = {
+            **function.__annotations__,
+            parameter.name: parameter.annotation,
+        }
+    return wrapper
+
+
+def inject_from_parameter(
+    function: Callable[_P, _T],
+    parameter: inspect.Parameter,
+    get_context: Callable[[Any], InjectionContext],
+) -> Callable[_P, _T]:
+    if inspect.iscoroutinefunction(function):
+        return _wrap_from_parameter(  # type: ignore[return-value]
+            function,
+            parameter=parameter,
+            get_context=get_context,
+        )
+
+    if inspect.isasyncgenfunction(function):
+        wrapped: Callable[..., Coroutine[Any, Any, AsyncIterable[_T]]] = (
+            _wrap_from_parameter(
+                function,  # type: ignore[arg-type]
+                parameter=parameter,
+                get_context=get_context,
+            )
+        )
+
+        @functools.wraps(wrapped)
+        async def wrapper(
+            *args: _P.args,
+            **kwargs: _P.kwargs,
+        ) -> AsyncIterator[_T]:
+            async for element in await wrapped(*args, **kwargs):
+                yield element
+
+        return wrapper  # type: ignore[return-value]
+
+    msg = (
+        f"Can't inject into {function.__qualname__} from a parameter, "
+        "only async functions and async generators are supported"
+    )
+    raise TypeError(msg)
+
+
 def _wrap_sync(
     function: Callable[_P, _T],
     inject_method: InjectMethod,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING, ParamSpec, TypeVar
+import inspect
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, overload
+
+from starlette.requests import HTTPConnection
 
 from aioinject import _utils, decorators
 
@@ -10,19 +13,62 @@ if TYPE_CHECKING:
     from starlette.types import ASGIApp, Receive, Scope, Send
 
     from aioinject.containers import Container
+    from aioinject.context import InjectionContext
 
 __all__ = ["AioInjectMiddleware", "inject"]
 
 _T = TypeVar("_T")
 _P = ParamSpec("_P")
 
+_SCOPE_CONTEXT_KEY = "__aioinject_context__"
+_CONNECTION_PARAMETER = inspect.Parameter(
+    name="__aioinject_connection__",
+    kind=inspect.Parameter.KEYWORD_ONLY,
+    annotation=HTTPConnection,
+)
+
+
+def _get_context(connection: HTTPConnection) -> InjectionContext:
+    return connection.scope[_SCOPE_CONTEXT_KEY]
+
+
+@overload
+def inject(
+    function: Callable[_P, _T],
+    *,
+    from_scope: bool = False,
+) -> Callable[_P, _T]: ...
+
+
+@overload
+def inject(
+    *,
+    from_scope: bool = False,
+) -> Callable[[Callable[_P, _T]], Callable[_P, _T]]: ...
+
+
+def inject(
+    function: Callable[_P, _T] | None = None,
+    *,
+    from_scope: bool = False,
+) -> Callable[_P, _T] | Callable[[Callable[_P, _T]], Callable[_P, _T]]:
+    def wrap(function: Callable[_P, _T]) -> Callable[_P, _T]:
+        if from_scope:
+            wrapper = decorators.inject_from_parameter(
+                function,
+                parameter=_CONNECTION_PARAMETER,
+                get_context=_get_context,
+            )
+        else:
+            wrapper = decorators.inject(
+                function,
+                inject_method=decorators.InjectMethod.context,
+            )
+        return _utils.clear_wrapper(wrapper)
 
-def inject(function: Callable[_P, _T]) -> Callable[_P, _T]:
-    wrapper = decorators.inject(
-        function,
-        inject_method=decorators.InjectMethod.context,
-    )
-    return _utils.clear_wrapper(wrapper)
+    if function is None:
+        return wrap
+    return wrap(function)
 
 
 class AioInjectMiddleware:
@@ -30,9 +76,16 @@ class AioInjectMiddleware:
         self,
         app: ASGIApp,
         container: Container,
+        *,
+        use_context_var: bool = True,
+        prefetch: Sequence[type[Any]] = (),
+        defer_teardown: bool = False,
     ) -> None:
         self.app = app
         self.container = container
+        self.use_context_var = use_context_var
+        self.prefetch = prefetch
+        self.defer_teardown = defer_teardown
 
     async def __call__(
         self,
@@ -40,5 +93,10 @@ class AioInjectMiddleware:
         receive: Receive,
         send: Send,
     ) -> None:
-        async with self.container.context():
+        async with self.container.context(
+            use_context_var=self.use_context_var,
+            prefetch=self.prefetch,
+            defer_teardown=self.defer_teardown,
+        ) as ctx:
+            scope[_SCOPE_CONTEXT_KEY] = ctx
             await self.app(scope, receive, send)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import contextlib
-from collections.abc import AsyncIterator, Callable
-from typing import TYPE_CHECKING, ParamSpec, TypeVar
+import inspect
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, overload
 
 from litestar import Litestar
 from litestar.config.app import AppConfig
-from litestar.middleware import MiddlewareProtocol
+from litestar.middleware import DefineMiddleware, MiddlewareProtocol
 from litestar.plugins import InitPluginProtocol
 from litestar.types import ASGIApp, Receive, Scope, Send
 
@@ -15,6 +16,7 @@ from aioinject import _utils, decorators
 
 if TYPE_CHECKING:
     from aioinject.containers import Container
+    from aioinject.context import InjectionContext
 
 __all__ = ["AioInjectMiddleware", "AioInjectPlugin", "inject"]
 
@@ -23,19 +25,69 @@ _P = ParamSpec("_P")
 
 _STATE_KEY = "__aioinject_container__"
 _SCOPE_CONTEXT_KEY = "__aioinject_context__"
-
-
-def inject(function: Callable[_P, _T]) -> Callable[_P, _T]:
-    wrapper = decorators.inject(
-        function,
-        inject_method=decorators.InjectMethod.context,
-    )
-    return _utils.clear_wrapper(wrapper)
+_SCOPE_PARAMETER = inspect.Parameter(
+    name="scope",
+    kind=inspect.Parameter.KEYWORD_ONLY,
+    annotation=Scope,
+)
+
+
+def _get_context(scope: Scope) -> InjectionContext:
+    return scope[_SCOPE_CONTEXT_KEY]  # type: ignore[literal-required]
+
+
+@overload
+def inject(
+    function: Callable[_P, _T],
+    *,
+    from_scope: bool = False,
+) -> Callable[_P, _T]: ...
+
+
+@overload
+def inject(
+    *,
+    from_scope: bool = False,
+) -> Callable[[Callable[_P, _T]], Callable[_P, _T]]: ...
+
+
+def inject(
+    function: Callable[_P, _T] | None = None,
+    *,
+    from_scope: bool = False,
+) -> Callable[_P, _T] | Callable[[Callable[_P, _T]], Callable[_P, _T]]:
+    def wrap(function: Callable[_P, _T]) -> Callable[_P, _T]:
+        if from_scope:
+            wrapper = decorators.inject_from_parameter(
+                function,
+                parameter=_SCOPE_PARAMETER,
+                get_context=_get_context,
+            )
+        else:
+            wrapper = decorators.inject(
+                function,
+                inject_method=decorators.InjectMethod.context,
+            )
+        return _utils.clear_wrapper(wrapper)
+
+    if function is None:
+        return wrap
+    return wrap(function)
 
 
 class AioInjectMiddleware(MiddlewareProtocol):
-    def __init__(self, app: ASGIApp) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        use_context_var: bool = True,
+        prefetch: Sequence[type[Any]] = (),
+        defer_teardown: bool = False,
+    ) -> None:
         self.app = app
+        self.use_context_var = use_context_var
+        self.prefetch = prefetch
+        self.defer_teardown = defer_teardown
 
     async def __call__(
         self,
@@ -46,7 +98,11 @@ class AioInjectMiddleware(MiddlewareProtocol):
         app: Litestar = scope["app"]
         container: Container = app.state[_STATE_KEY]
 
-        async with container.context() as ctx:
+        async with container.context(
+            use_context_var=self.use_context_var,
+            prefetch=self.prefetch,
+            defer_teardown=self.defer_teardown,
+        ) as ctx:
             scope[_SCOPE_CONTEXT_KEY] = ctx  # type: ignore[literal-required]
             await self.app(scope, receive, send)
 
@@ -61,8 +117,18 @@ async def _after_exception(exception: BaseException, scope: Scope) -> None:
 
 
 class AioInjectPlugin(InitPluginProtocol):
-    def __init__(self, container: Container) -> None:
+    def __init__(
+        self,
+        container: Container,
+        *,
+        use_context_var: bool = True,
+        prefetch: Sequence[type[Any]] = (),
+        defer_teardown: bool = False,
+    ) -> None:
         self.container = container
+        self.use_context_var = use_context_var
+        self.prefetch = prefetch
+        self.defer_teardown = defer_teardown
 
     @contextlib.asynccontextmanager
     async def _lifespan(
@@ -74,7 +140,14 @@ class AioInjectPlugin(InitPluginProtocol):
 
     def on_app_init(self, app_config: AppConfig) -> AppConfig:
         app_config.state[_STATE_KEY] = self.container
-        app_config.middleware.append(AioInjectMiddleware)
+        app_config.middleware.append(
+            DefineMiddleware(
+                AioInjectMiddleware,
+                use_context_var=self.use_context_var,
+                prefetch=self.prefetch,
+                defer_teardown=self.defer_teardown,
+            ),
+        )
         app_config.lifespan.append(self._lifespan)
         app_config.after_exception.append(_after_exception)
         return app_config
@@ -51,6 +51,16 @@ class SyncOnResolveExtension(Protocol):
     ) -> None: ...
 
 
+@runtime_checkable
+class OnWaitExtension(Protocol):
+    async def on_wait(
+        self,
+        context: InjectionContext,
+        provider: Provider[T],
+        seconds: float,
+    ) -> None: ...
+
+
 Extension = LifespanExtension | OnInitExtension
-ContextExtension = OnResolveExtension
+ContextExtension = OnResolveExtension | OnWaitExtension
 SyncContextExtension = SyncOnResolveExtension
@@ -2,9 +2,9 @@ import dataclasses
 from typing import TYPE_CHECKING, Annotated, Generic, TypeAlias, TypeVar
 
 
-@dataclasses.dataclass(slots=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class Inject:
-    pass
+    name: str | None = None
 
 
 T = TypeVar("T")
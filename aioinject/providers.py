@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import collections
 import collections.abc
+import contextlib
 import enum
 import functools
 import inspect
+import time
 import typing
-from collections.abc import Mapping
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Mapping,
+)
 from dataclasses import dataclass
 from functools import cached_property
 from inspect import isclass
@@ -20,14 +28,18 @@ from typing import (
     runtime_checkable,
 )
 
+import anyio
 from typing_extensions import Self
 
+from aioinject._features.generics import get_generic_parameter_map
 from aioinject._utils import (
     _get_type_hints,
+    enter_context_maybe,
     get_fn_ns,
     get_return_annotation,
     is_context_manager_function,
     is_iterable_generic_collection,
+    qualify,
     remove_annotation,
 )
 from aioinject.markers import Inject
@@ -40,6 +52,11 @@ _T = TypeVar("_T")
 class Dependency(Generic[_T]):
     name: str
     type_: type[_T]
+    qualifier: str | None = None
+
+    @cached_property
+    def qualified_type(self) -> Any:
+        return qualify(self.inner_type, self.qualifier)
 
     @cached_property
     def inner_type(self) -> type[_T]:
@@ -56,6 +73,9 @@ class Dependency(Generic[_T]):
         return hash(self.type_)
 
 
+SpecializedDependency: TypeAlias = tuple[str, type[object], bool]
+
+
 def _get_annotation_args(type_hint: Any) -> tuple[type, tuple[Any, ...]]:
     try:
         dep_type, *args = typing.get_args(type_hint)
@@ -97,6 +117,7 @@ def collect_dependencies(
         yield Dependency(
             name=name,
             type_=dep_type,
+            qualifier=inject_marker.name,
         )
 
 
@@ -218,14 +239,52 @@ class DependencyLifetime(enum.Enum):
     transient = enum.auto()
     scoped = enum.auto()
     singleton = enum.auto()
+    item_scoped = enum.auto()
+    weak_singleton = enum.auto()
+    thread_local = enum.auto()
+    task_local = enum.auto()
+
+
+Lifetime: TypeAlias = enum.Enum
+
+
+class ConcurrencyLimit:
+    def __init__(self, limit: int, *, hold: bool = False) -> None:
+        self.limit = limit
+        self.hold = hold
+        self._semaphore: anyio.Semaphore | None = None
+
+    async def acquire(self) -> float:
+        if self._semaphore is None:
+            self._semaphore = anyio.Semaphore(self.limit)
+
+        try:
+            self._semaphore.acquire_nowait()
+        except anyio.WouldBlock:
+            started_at = time.perf_counter()
+            await self._semaphore.acquire()
+            return time.perf_counter() - started_at
+        return 0
+
+    def release(self) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
 
 
 @runtime_checkable
 class Provider(Protocol[_T]):
     impl: Any
     type_: type[_T]
-    lifetime: DependencyLifetime
+    lifetime: Lifetime
+    limit: ConcurrencyLimit | None = None
+    releasable: bool = False
+    name: str | None = None
     _cached_dependencies: tuple[Dependency[object], ...]
+    _specialized_dependencies: tuple[SpecializedDependency, ...]
+
+    @property
+    def qualified_type(self) -> Any:
+        return qualify(self.type_, self.name)
 
     async def provide(self, kwargs: Mapping[str, Any]) -> _T: ...
 
@@ -243,6 +302,33 @@ class Provider(Protocol[_T]):
             )
             return self._cached_dependencies
 
+    def specialized_dependencies(
+        self,
+        context: dict[str, Any] | None = None,
+    ) -> tuple[SpecializedDependency, ...]:
+        try:
+            return self._specialized_dependencies
+        except AttributeError:
+            dependencies = self.collect_dependencies(context)
+            dependencies_map = get_generic_parameter_map(
+                self.type_,
+                dependencies,
+            )
+            self._specialized_dependencies = tuple(
+                (
+                    dependency.name,
+                    qualify(
+                        dependencies_map.get(
+                            dependency.name, dependency.inner_type
+                        ),
+                        dependency.qualifier,
+                    ),
+                    dependency.is_iterable,
+                )
+                for dependency in dependencies
+            )
+            return self._specialized_dependencies
+
     def type_hints(self, context: dict[str, Any] | None) -> dict[str, Any]: ...
 
     @property
@@ -257,15 +343,22 @@ class Provider(Protocol[_T]):
 
 
 class Scoped(Provider[_T]):
-    lifetime = DependencyLifetime.scoped
+    lifetime: Lifetime = DependencyLifetime.scoped
 
     def __init__(
         self,
         factory: _FactoryType[_T],
         type_: type[_T] | None = None,
+        *,
+        limit: ConcurrencyLimit | None = None,
+        releasable: bool = False,
+        name: str | None = None,
     ) -> None:
         self.impl = factory
         self.type_ = type_ or _guess_return_type(factory)
+        self.limit = limit
+        self.releasable = releasable
+        self.name = name
 
     def provide_sync(self, kwargs: Mapping[str, Any]) -> _T:
         return self.impl(**kwargs)  # type: ignore[return-value]
@@ -294,10 +387,317 @@ class Singleton(Scoped[_T]):
     lifetime = DependencyLifetime.singleton
 
 
+class WeakSingleton(Singleton[_T]):
+    lifetime = DependencyLifetime.weak_singleton
+
+    def __init__(
+        self,
+        factory: _FactoryType[_T],
+        type_: type[_T] | None = None,
+        *,
+        limit: ConcurrencyLimit | None = None,
+        releasable: bool = False,
+        name: str | None = None,
+    ) -> None:
+        if is_context_manager_function(factory):
+            msg = f"{self.__class__.__qualname__} can't use context managers"
+            raise TypeError(msg)
+        super().__init__(
+            factory,
+            type_=type_,
+            limit=limit,
+            releasable=releasable,
+            name=name,
+        )
+        origin = typing.get_origin(self.type_) or self.type_
+        if isclass(origin) and not origin.__weakrefoffset__:
+            msg = (
+                f"{self.__class__.__qualname__} can't hold {self.type_}, "
+                "its instances don't support weak references"
+            )
+            raise TypeError(msg)
+
+
+class ThreadLocal(Singleton[_T]):
+    lifetime = DependencyLifetime.thread_local
+
+
+class TTLSingleton(Singleton[_T]):
+    def __init__(  # noqa: PLR0913
+        self,
+        factory: _FactoryType[_T],
+        ttl: float,
+        type_: type[_T] | None = None,
+        *,
+        limit: ConcurrencyLimit | None = None,
+        releasable: bool = False,
+        name: str | None = None,
+    ) -> None:
+        super().__init__(
+            factory,
+            type_=type_,
+            limit=limit,
+            releasable=releasable,
+            name=name,
+        )
+        self.ttl = ttl
+
+
+class Pooled(Scoped[_T]):
+    def __init__(  # noqa: PLR0913
+        self,
+        factory: _FactoryType[_T],
+        max_size: int,
+        min_size: int = 0,
+        reset: Callable[[_T], Awaitable[object] | object] | None = None,
+        type_: type[_T] | None = None,
+        *,
+        limit: ConcurrencyLimit | None = None,
+        releasable: bool = False,
+        name: str | None = None,
+    ) -> None:
+        if not 0 <= min_size <= max_size or max_size < 1:
+            msg = "Pool size must satisfy 0 <= min_size <= max_size, max_size >= 1"
+            raise ValueError(msg)
+        super().__init__(
+            factory,
+            type_=type_,
+            limit=limit,
+            releasable=releasable,
+            name=name,
+        )
+        self.max_size = max_size
+        self.min_size = min_size
+        self.reset = reset
+
+    @functools.cached_property
+    def is_generator(self) -> bool:
+        return True
+
+    def provide_sync(self, kwargs: Mapping[str, Any]) -> _T:  # noqa: ARG002
+        msg = f"{self!r} can only be resolved from an async context"
+        raise TypeError(msg)
+
+    async def provide(self, kwargs: Mapping[str, Any]) -> _T:  # noqa: ARG002
+        msg = f"{self!r} can only be leased from a container's pool"
+        raise TypeError(msg)
+
+
+class Pool(Generic[_T]):
+    def __init__(self, provider: Pooled[_T]) -> None:
+        self.provider = provider
+        self._idle: list[tuple[_T, contextlib.AsyncExitStack]] = []
+        self._semaphore = anyio.Semaphore(provider.max_size)
+        self._warmed = False
+
+    @contextlib.asynccontextmanager
+    async def lease(self, kwargs: Mapping[str, Any]) -> AsyncIterator[_T]:
+        async with self._semaphore:
+            if not self._warmed:
+                self._warmed = True
+                self._idle.extend(
+                    [
+                        await self._create(kwargs)
+                        for _ in range(self.provider.min_size)
+                    ]
+                )
+
+            instance, stack = (
+                self._idle.pop() if self._idle else await self._create(kwargs)
+            )
+            try:
+                yield instance
+            finally:
+                await self._return(instance, stack)
+
+    async def _create(
+        self,
+        kwargs: Mapping[str, Any],
+    ) -> tuple[_T, contextlib.AsyncExitStack]:
+        stack = contextlib.AsyncExitStack()
+        instance: Any = self.provider.impl(**kwargs)
+        if self.provider.is_async:
+            instance = await instance
+        if is_context_manager_function(self.provider.impl):
+            instance = await enter_context_maybe(instance, stack)
+        return instance, stack
+
+    async def _return(
+        self,
+        instance: _T,
+        stack: contextlib.AsyncExitStack,
+    ) -> None:
+        reset = self.provider.reset
+        try:
+            if reset is not None and inspect.isawaitable(
+                result := reset(instance),
+            ):
+                await result
+        except BaseException:
+            await stack.aclose()
+            raise
+        self._idle.append((instance, stack))
+
+    async def aclose(self) -> None:
+        while self._idle:
+            _, stack = self._idle.pop()
+            await stack.aclose()
+        self._warmed = False
+
+
+@dataclass(slots=True)
+class _KeyedEntry(Generic[_T]):
+    instance: _T
+    exit_stack: contextlib.AsyncExitStack
+    used_at: float
+
+
+class Keyed(Scoped[_T]):
+    def __init__(  # noqa: PLR0913
+        self,
+        factory: _FactoryType[_T],
+        key: type[Any],
+        max_size: int,
+        idle_timeout: float | None = None,
+        type_: type[_T] | None = None,
+        *,
+        limit: ConcurrencyLimit | None = None,
+        releasable: bool = False,
+        name: str | None = None,
+    ) -> None:
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+        super().__init__(
+            factory,
+            type_=type_,
+            limit=limit,
+            releasable=releasable,
+            name=name,
+        )
+        self.key = key
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+
+    @functools.cached_property
+    def key_name(self) -> str:
+        for dependency in self.collect_dependencies():
+            if dependency.inner_type is self.key:
+                return dependency.name
+        msg = f"{self!r} does not depend on its key {self.key}"
+        raise ValueError(msg)
+
+    @functools.cached_property
+    def is_generator(self) -> bool:
+        return True
+
+    def provide_sync(self, kwargs: Mapping[str, Any]) -> _T:  # noqa: ARG002
+        msg = f"{self!r} can only be resolved from an async context"
+        raise TypeError(msg)
+
+    async def provide(self, kwargs: Mapping[str, Any]) -> _T:  # noqa: ARG002
+        msg = f"{self!r} can only be leased from a container's pool"
+        raise TypeError(msg)
+
+
+class KeyedPool(Generic[_T]):
+    def __init__(self, provider: Keyed[_T]) -> None:
+        self.provider = provider
+        self._entries: collections.OrderedDict[Any, _KeyedEntry[_T]] = (
+            collections.OrderedDict()
+        )
+        self._locks: dict[Any, anyio.Lock] = {}
+
+    @contextlib.asynccontextmanager
+    async def lease(self, kwargs: Mapping[str, Any]) -> AsyncIterator[_T]:
+        # Instances stay cached after the context exits
+        yield await self._get(kwargs)
+
+    async def _get(self, kwargs: Mapping[str, Any]) -> _T:
+        key = kwargs[self.provider.key_name]
+        await self._evict_idle()
+        if (entry := self._entries.get(key)) is not None:
+            return self._use(key, entry)
+
+        lock = self._locks.setdefault(key, anyio.Lock())
+        async with lock:
+            if (entry := self._entries.get(key)) is not None:
+                return self._use(key, entry)
+            try:
+                entry = await self._create(kwargs)
+            finally:
+                self._locks.pop(key, None)
+
+        self._entries[key] = entry
+        while len(self._entries) > self.provider.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            await evicted.exit_stack.aclose()
+        return entry.instance
+
+    def _use(self, key: object, entry: _KeyedEntry[_T]) -> _T:
+        entry.used_at = time.monotonic()
+        self._entries.move_to_end(key)
+        return entry.instance
+
+    async def _create(self, kwargs: Mapping[str, Any]) -> _KeyedEntry[_T]:
+        exit_stack = contextlib.AsyncExitStack()
+        instance: Any = self.provider.impl(**kwargs)
+        if self.provider.is_async:
+            instance = await instance
+        if is_context_manager_function(self.provider.impl):
+            instance = await enter_context_maybe(instance, exit_stack)
+        return _KeyedEntry(instance, exit_stack, time.monotonic())
+
+    async def _evict_idle(self) -> None:
+        if (idle_timeout := self.provider.idle_timeout) is None:
+            return
+        expired_at = time.monotonic() - idle_timeout
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.used_at > expired_at:
+                return
+            del self._entries[key]
+            await entry.exit_stack.aclose()
+
+    async def aclose(self) -> None:
+        while self._entries:
+            _, entry = self._entries.popitem()
+            await entry.exit_stack.aclose()
+
+
 class Transient(Scoped[_T]):
     lifetime = DependencyLifetime.transient
 
 
+class ItemScoped(Scoped[_T]):
+    lifetime = DependencyLifetime.item_scoped
+
+
+class TaskLocal(Scoped[_T]):
+    lifetime = DependencyLifetime.task_local
+
+
+class Custom(Scoped[_T]):
+    def __init__(  # noqa: PLR0913
+        self,
+        factory: _FactoryType[_T],
+        lifetime: Lifetime,
+        type_: type[_T] | None = None,
+        *,
+        limit: ConcurrencyLimit | None = None,
+        releasable: bool = False,
+        name: str | None = None,
+    ) -> None:
+        super().__init__(
+            factory,
+            type_=type_,
+            limit=limit,
+            releasable=releasable,
+            name=name,
+        )
+        self.lifetime = lifetime
+
+
 class Object(Provider[_T]):
     _type_hints: ClassVar[dict[str, Any]] = {}
     is_async = False
@@ -308,9 +708,12 @@ class Object(Provider[_T]):
         self,
         object_: _T,
         type_: type[_T] | None = None,
+        *,
+        name: str | None = None,
     ) -> None:
         self.type_ = type_ or type(object_)
         self.impl = object_
+        self.name = name
 
     def provide_sync(self, kwargs: Mapping[str, Any]) -> _T:  # noqa: ARG002
         return self.impl
@@ -1,6 +1,7 @@
 from collections.abc import Sequence
 
-from aioinject import Scoped, Singleton
+from aioinject import Pooled, Scoped, Singleton
+from aioinject.providers import DependencyLifetime
 from aioinject.validation._builtin import (
     ForbidDependency,
     all_dependencies_are_present,
@@ -16,9 +17,29 @@ forbid_singleton_on_scoped_dependency = ForbidDependency(
     and not isinstance(p, Singleton),
 )
 
+forbid_scoped_on_item_scoped_dependency = ForbidDependency(
+    dependant=lambda p: p.lifetime is DependencyLifetime.scoped,
+    dependency=lambda p: p.lifetime is DependencyLifetime.item_scoped,
+)
+
+_SHORT_LIVED_LIFETIMES = frozenset(
+    (
+        DependencyLifetime.transient,
+        DependencyLifetime.scoped,
+        DependencyLifetime.item_scoped,
+    ),
+)
+
+forbid_pooled_on_short_lived_dependency = ForbidDependency(
+    dependant=lambda p: isinstance(p, Pooled),
+    dependency=lambda p: p.lifetime in _SHORT_LIVED_LIFETIMES,
+)
+
 DEFAULT_VALIDATORS: Sequence[ContainerValidator] = [
     all_dependencies_are_present,
     forbid_singleton_on_scoped_dependency,
+    forbid_scoped_on_item_scoped_dependency,
+    forbid_pooled_on_short_lived_dependency,
 ]
 
 __all__ = [
@@ -27,5 +48,8 @@ __all__ = [
     "ForbidDependency",
     "all_dependencies_are_present",
     "all_providers_for_type_have_equal_lifetime",
+    "forbid_pooled_on_short_lived_dependency",
+    "forbid_scoped_on_item_scoped_dependency",
+    "forbid_singleton_on_scoped_dependency",
     "validate_container",
 ]
@@ -4,6 +4,8 @@ from typing import Any
 
 import aioinject
 from aioinject import Provider
+from aioinject._features.lazy import unwrap_handle
+from aioinject._utils import qualify
 from aioinject.validation.abc import ContainerValidator
 from aioinject.validation.error import (
     ContainerValidationError,
@@ -21,10 +23,21 @@ def all_dependencies_are_present(
         )
         for provider in chain.from_iterable(container.providers.values())
         for dependency in provider.collect_dependencies(container.type_context)
-        if dependency.type_ not in container.providers
+        if not _has_providers(
+            container,
+            qualify(unwrap_handle(dependency.type_), dependency.qualifier),
+        )
     ]
 
 
+def _has_providers(container: aioinject.Container, type_: type[Any]) -> bool:
+    try:
+        container.get_providers(type_)
+    except ValueError:
+        return False
+    return True
+
+
 class ForbidDependency(ContainerValidator):
     def __init__(
         self,
@@ -46,7 +59,9 @@ class ForbidDependency(ContainerValidator):
             for dependency in provider.collect_dependencies(
                 container.type_context,
             ):
-                dep_type = dependency.type_
+                dep_type = qualify(
+                    unwrap_handle(dependency.type_), dependency.qualifier
+                )
                 dependency_provider = container.get_provider(
                     type_=dep_type,
                 )
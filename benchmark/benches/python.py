@@ -4,7 +4,7 @@ from datetime import timedelta
 from typing import Annotated
 
 from aioinject import Inject, inject
-from benchmark.container import create_container
+from benchmark.container import create_container, create_item_container
 from benchmark.dependencies import (
     RepositoryA,
     RepositoryB,
@@ -37,6 +37,28 @@ async def bench_aioinject_raw(
     )
 
 
+async def bench_aioinject_item(
+    iterations: int,
+) -> AsyncIterator[BenchmarkResult]:
+    container = create_item_container()
+    durations = []
+    async with container.context() as ctx:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            async with ctx.item() as item:
+                use_case = await item.resolve(UseCase)
+                await use_case.execute()
+
+            durations.append(
+                timedelta(seconds=time.perf_counter() - start),
+            )
+    yield BenchmarkResult(
+        iterations=iterations,
+        durations=durations,
+        name="Aioinject - Item",
+    )
+
+
 async def bench_aioinject_decorator(
     iterations: int,
 ) -> AsyncIterator[BenchmarkResult]:
@@ -27,3 +27,9 @@ def create_container() -> aioinject.Container:
     container = aioinject.Container()
     container.register(*providers)
     return container
+
+
+def create_item_container() -> aioinject.Container:
+    container = aioinject.Container()
+    container.register(*providers[:-1], aioinject.ItemScoped(UseCase))
+    return container
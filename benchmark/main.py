@@ -8,6 +8,7 @@ from benchmark.benches.fastapi import fastapi_bench
 from benchmark.benches.litestar import litestar_bench
 from benchmark.benches.python import (
     bench_aioinject_decorator,
+    bench_aioinject_item,
     bench_aioinject_raw,
     bench_python,
 )
@@ -40,6 +41,7 @@ class BenchFunction(Protocol):
 BENCHMARK_FUNCTIONS: Sequence[BenchFunction] = [
     bench_python,
     bench_aioinject_raw,
+    bench_aioinject_item,
     bench_aioinject_decorator,
     functools.partial(
         litestar_bench,
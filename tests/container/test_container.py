@@ -1,6 +1,7 @@
 import contextlib
 from collections.abc import AsyncIterator, Iterator
 
+import anyio
 import pytest
 from pydantic_settings import BaseSettings
 
@@ -132,6 +133,13 @@ async def test_should_close_singletons() -> None:
     assert shutdown is True
 
 
+async def test_can_exit_in_another_task() -> None:
+    container = Container()
+    await container.__aenter__()
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(container.__aexit__, None, None, None)
+
+
 def test_should_close_singletons_sync() -> None:
     shutdown = False
 
@@ -0,0 +1,113 @@
+import abc
+from collections.abc import Sequence
+from typing import Generic, NewType, Protocol, TypeVar
+
+import pytest
+
+from aioinject import Container, Object, Scoped, Singleton, Transient
+
+
+T = TypeVar("T")
+
+
+class Notifier(abc.ABC):
+    @abc.abstractmethod
+    def notify(self) -> None: ...
+
+
+class Closeable(Protocol):
+    def close(self) -> None: ...
+
+
+class EmailNotifier(Notifier, Closeable):
+    def notify(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class SMSNotifier(Notifier):
+    def notify(self) -> None:
+        pass
+
+
+class User:
+    pass
+
+
+class Repository(Generic[T]):
+    pass
+
+
+class UserRepository(Repository[User]):
+    pass
+
+
+class Dispatcher:
+    def __init__(self, notifiers: Sequence[Notifier]) -> None:
+        self.notifiers = notifiers
+
+
+@pytest.fixture
+def container() -> Container:
+    container = Container(index_interfaces=True)
+    container.register(
+        Scoped(EmailNotifier),
+        Transient(SMSNotifier),
+        Singleton(UserRepository),
+        Transient(Dispatcher),
+    )
+    return container
+
+
+async def test_resolve_by_base_class(container: Container) -> None:
+    async with container.context() as ctx:
+        notifier = await ctx.resolve(Notifier)  # type: ignore[type-abstract]
+        assert isinstance(notifier, SMSNotifier)
+
+        closeable = await ctx.resolve(Closeable)  # type: ignore[type-abstract]
+        assert closeable is await ctx.resolve(EmailNotifier)
+
+
+async def test_resolve_iterable(container: Container) -> None:
+    async with container.context() as ctx:
+        dispatcher = await ctx.resolve(Dispatcher)
+        assert [type(notifier) for notifier in dispatcher.notifiers] == [
+            EmailNotifier,
+            SMSNotifier,
+        ]
+
+
+async def test_generic_base(container: Container) -> None:
+    async with container.context() as ctx:
+        repository = await ctx.resolve(Repository[User])
+        assert repository is await ctx.resolve(UserRepository)
+
+
+async def test_exact_registration_takes_precedence(
+    container: Container,
+) -> None:
+    container.register(Scoped(EmailNotifier, Notifier))
+    async with container.context() as ctx:
+        assert isinstance(await ctx.resolve(Notifier), EmailNotifier)
+
+
+async def test_not_indexed_by_default() -> None:
+    container = Container()
+    container.register(Scoped(EmailNotifier))
+    async with container.context() as ctx:
+        with pytest.raises(ValueError, match="Providers for type"):
+            await ctx.resolve(Notifier)  # type: ignore[type-abstract]
+        with pytest.raises(ValueError, match="Providers for type"):
+            await ctx.resolve(object)
+
+
+async def test_non_class_types_have_no_interfaces() -> None:
+    user_id = NewType("user_id", int)
+    container = Container(index_interfaces=True)
+    container.register(Object(user_id(1), user_id))
+    async with container.context() as ctx:
+        assert await ctx.resolve(user_id) == 1
+        with pytest.raises(ValueError, match="Providers for type"):
+            await ctx.resolve(int)
@@ -0,0 +1,113 @@
+import contextlib
+import dataclasses
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from aioinject import Container, Inject, ItemScoped, Scoped, Transient
+
+
+class _Connection:
+    pass
+
+
+@dataclasses.dataclass
+class _Message:
+    body: str
+
+
+@dataclasses.dataclass
+class _Handler:
+    connection: Annotated[_Connection, Inject]
+    message: Annotated[_Message, Inject]
+
+
+async def test_item_scoped_instances_are_isolated() -> None:
+    container = Container()
+    container.register(Scoped(_Connection), ItemScoped(_Handler))
+
+    handlers = []
+    async with container.context() as batch:
+        for body in ("a", "b"):
+            async with batch.item({_Message: _Message(body)}) as item:
+                handler = await item.resolve(_Handler)
+                assert await item.resolve(_Handler) is handler
+                handlers.append(handler)
+
+        connection = await batch.resolve(_Connection)
+
+    first, second = handlers
+    assert first is not second
+    assert first.message.body == "a"
+    assert second.message.body == "b"
+    assert first.connection is second.connection is connection
+
+
+async def test_item_teardown() -> None:
+    closed: list[str] = []
+
+    @contextlib.asynccontextmanager
+    async def create_connection() -> AsyncIterator[_Connection]:
+        yield _Connection()
+        closed.append("connection")
+
+    @contextlib.asynccontextmanager
+    async def create_message() -> AsyncIterator[_Message]:
+        yield _Message("")
+        closed.append("message")
+
+    container = Container()
+    container.register(Scoped(create_connection), ItemScoped(create_message))
+
+    async with container.context() as batch:
+        for _ in range(2):
+            async with batch.item() as item:
+                await item.resolve(_Message)
+                await item.resolve(_Connection)
+        assert closed == ["message", "message"]
+    assert closed == ["message", "message", "connection"]
+
+
+async def test_item_scoped_outside_of_batch() -> None:
+    container = Container()
+    container.register(ItemScoped(_Connection), Transient(list))
+
+    async with container.context() as ctx:
+        assert await ctx.resolve(_Connection) is await ctx.resolve(_Connection)
+
+
+async def test_child_of_item_uses_batch_scope() -> None:
+    container = Container()
+    container.register(Scoped(_Connection))
+
+    async with container.context() as batch, batch.item() as item:
+        async with item.child() as child:
+            connection = await child.resolve(_Connection)
+        assert await batch.resolve(_Connection) is connection
+
+
+async def test_child_of_item_shares_item_scope() -> None:
+    container = Container()
+    container.register(ItemScoped(_Connection))
+
+    async with container.context() as batch:
+        async with batch.item() as item:
+            async with item.child() as child:
+                connection = await child.resolve(_Connection)
+            assert await item.resolve(_Connection) is connection
+
+        async with batch.item() as item:
+            assert await item.resolve(_Connection) is not connection
+
+
+def test_sync_items() -> None:
+    container = Container()
+    container.register(Scoped(_Connection), ItemScoped(_Handler))
+
+    with container.sync_context() as batch:
+        with batch.item({_Message: _Message("a")}) as item:
+            first = item.resolve(_Handler)
+        with batch.item({_Message: _Message("b")}) as item:
+            second = item.resolve(_Handler)
+
+    assert first is not second
+    assert first.connection is second.connection
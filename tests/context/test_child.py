@@ -0,0 +1,90 @@
+import contextlib
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from aioinject import Container, Object, Scoped, Singleton, Transient
+from aioinject.context import context_var
+from tests.context.conftest import _A, _B, _C
+
+
+async def test_child_reads_parent_instances(container: Container) -> None:
+    async with container.context() as ctx:
+        a = await ctx.resolve(_A)
+        async with ctx.child() as child:
+            b = await child.resolve(_B)
+            assert b.a is a
+            assert await child.resolve(_B) is b
+
+        assert await ctx.resolve(_B) is not b
+
+
+async def test_child_instances_are_isolated(container: Container) -> None:
+    async with container.context() as ctx:
+        async with ctx.child() as child:
+            first = await child.resolve(_C)
+        async with ctx.child() as child:
+            second = await child.resolve(_C)
+
+    assert first is not second
+    assert first.b.a is not second.b.a
+
+
+async def test_child_closes_only_own_resources() -> None:
+    closed: list[str] = []
+
+    @contextlib.asynccontextmanager
+    async def create_int() -> AsyncIterator[int]:
+        yield 42
+        closed.append("int")
+
+    @contextlib.asynccontextmanager
+    async def create_str() -> AsyncIterator[str]:
+        yield "42"
+        closed.append("str")
+
+    container = Container()
+    container.register(Scoped(create_int), Scoped(create_str))
+
+    async with container.context() as ctx:
+        await ctx.resolve(int)
+        async with ctx.child() as child:
+            await child.resolve(int)
+            await child.resolve(str)
+        assert closed == ["str"]
+    assert closed == ["str", "int"]
+
+
+def test_sync_child() -> None:
+    closed = False
+
+    @contextlib.contextmanager
+    def create_int() -> Iterator[int]:
+        nonlocal closed
+        yield 42
+        closed = True
+
+    container = Container()
+    container.register(Scoped(create_int), Singleton(object), Transient(list))
+
+    with container.sync_context() as ctx:
+        with ctx.child() as child:
+            assert child.resolve(int) == 42  # noqa: PLR2004
+            assert child.resolve(object) is ctx.resolve(object)
+        assert closed is True
+
+
+@pytest.mark.parametrize("use_context_var", [True, False])
+async def test_child_context(use_context_var: bool) -> None:
+    container = Container()
+    container.register(Object(1))
+
+    async with container.context(
+        {str: "parent"},
+        use_context_var=use_context_var,
+    ) as ctx:
+        async with ctx.child({int: 2}) as child:
+            assert await child.resolve(str) == "parent"
+            assert await child.resolve(int) == 2  # noqa: PLR2004
+            assert (context_var.get(None) is child) is use_context_var
+        assert await ctx.resolve(int) == 1
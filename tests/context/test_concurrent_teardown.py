@@ -0,0 +1,322 @@
+import contextlib
+import sys
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+import anyio
+import pytest
+
+from aioinject import Container, Inject, Lazy, Scoped, Singleton, Transient
+
+
+if sys.version_info < (3, 11):  # pragma: no cover
+    from exceptiongroup import ExceptionGroup
+
+
+class _Session:
+    pass
+
+
+class _Client:
+    pass
+
+
+class _Repository:
+    pass
+
+
+def _create_providers(
+    events: list[str],
+) -> tuple[object, object, object]:
+    @contextlib.asynccontextmanager
+    async def create_session() -> AsyncIterator[_Session]:
+        yield _Session()
+        events.append("session:start")
+        await anyio.sleep(0.02)
+        events.append("session:end")
+
+    @contextlib.asynccontextmanager
+    async def create_client() -> AsyncIterator[_Client]:
+        yield _Client()
+        events.append("client:start")
+        await anyio.sleep(0.02)
+        events.append("client:end")
+
+    @contextlib.asynccontextmanager
+    async def create_repository(
+        session: Annotated[_Session, Inject],  # noqa: ARG001
+    ) -> AsyncIterator[_Repository]:
+        yield _Repository()
+        events.append("repository:start")
+        await anyio.sleep(0.01)
+        events.append("repository:end")
+
+    return create_session, create_client, create_repository
+
+
+@pytest.mark.parametrize("provider_type", [Scoped, Singleton])
+async def test_concurrent_teardown(
+    provider_type: type[Scoped[object]],
+) -> None:
+    events: list[str] = []
+    container = Container(concurrent_teardown=True)
+    for factory in _create_providers(events):
+        container.register(provider_type(factory))  # type: ignore[arg-type]
+
+    async with container, container.context() as ctx:
+        await ctx.resolve(_Client)
+        await ctx.resolve(_Repository)
+        await ctx.resolve(_Session)
+
+    assert events.index("client:start") < events.index("session:start")
+    assert events.index("client:start") < events.index("repository:end")
+    assert events.index("repository:end") < events.index("session:start")
+
+
+async def test_transitive_dependencies() -> None:
+    events: list[str] = []
+    create_session, _, create_repository = _create_providers(events)
+
+    class _Service:
+        def __init__(self, repository: _Repository) -> None:
+            self.repository = repository
+
+    @contextlib.asynccontextmanager
+    async def create_handler(
+        service: _Service,  # noqa: ARG001
+    ) -> AsyncIterator[int]:
+        yield 42
+        events.append("handler:start")
+        await anyio.sleep(0.01)
+        events.append("handler:end")
+
+    container = Container(concurrent_teardown=True)
+    container.register(
+        Scoped(create_session),  # type: ignore[arg-type]
+        Scoped(create_repository),  # type: ignore[arg-type]
+        Transient(_Service),
+        Scoped(create_handler),
+    )
+
+    async with container.context() as ctx:
+        await ctx.resolve(int)
+
+    assert events.index("handler:end") < events.index("repository:start")
+    assert events.index("repository:end") < events.index("session:start")
+
+
+async def test_shared_transitive_dependency() -> None:
+    events: list[str] = []
+    create_session, _, create_repository = _create_providers(events)
+
+    class _Reader:
+        def __init__(self, repository: _Repository) -> None:
+            self.repository = repository
+
+    class _Writer:
+        def __init__(self, repository: _Repository) -> None:
+            self.repository = repository
+
+    @contextlib.asynccontextmanager
+    async def create_handler(
+        reader: _Reader,  # noqa: ARG001
+        writer: _Writer,  # noqa: ARG001
+    ) -> AsyncIterator[int]:
+        yield 42
+        events.append("handler:start")
+        await anyio.sleep(0.01)
+        events.append("handler:end")
+
+    container = Container(concurrent_teardown=True)
+    container.register(
+        Scoped(create_session),  # type: ignore[arg-type]
+        Scoped(create_repository),  # type: ignore[arg-type]
+        Transient(_Reader),
+        Transient(_Writer),
+        Scoped(create_handler),
+    )
+
+    async with container.context() as ctx:
+        await ctx.resolve(int)
+
+    assert events.index("handler:end") < events.index("repository:start")
+    assert events.index("repository:end") < events.index("session:start")
+
+
+async def test_dependencies_resolved_by_interface() -> None:
+    events: list[str] = []
+    create_session, _, _ = _create_providers(events)
+
+    class _Base:
+        pass
+
+    class _Impl(_Base):
+        pass
+
+    @contextlib.asynccontextmanager
+    async def create_impl(
+        session: _Session,  # noqa: ARG001
+    ) -> AsyncIterator[_Impl]:
+        yield _Impl()
+        events.append("impl:start")
+        await anyio.sleep(0.01)
+        events.append("impl:end")
+
+    @contextlib.asynccontextmanager
+    async def create_handler(
+        base: _Base,  # noqa: ARG001
+    ) -> AsyncIterator[int]:
+        yield 42
+        events.append("handler:start")
+        await anyio.sleep(0.01)
+        events.append("handler:end")
+
+    container = Container(concurrent_teardown=True, index_interfaces=True)
+    container.register(
+        Scoped(create_session),  # type: ignore[arg-type]
+        Scoped(create_impl),
+        Scoped(create_handler),
+    )
+
+    async with container.context() as ctx:
+        await ctx.resolve(int)
+
+    assert events.index("handler:end") < events.index("impl:start")
+    assert events.index("impl:end") < events.index("session:start")
+
+
+async def test_dependencies_resolved_by_handle() -> None:
+    events: list[str] = []
+    create_session, _, _ = _create_providers(events)
+
+    @contextlib.asynccontextmanager
+    async def create_handler(
+        session: Lazy[_Session],  # noqa: ARG001
+    ) -> AsyncIterator[int]:
+        yield 42
+        events.append("handler:start")
+        await anyio.sleep(0.01)
+        events.append("handler:end")
+
+    container = Container(concurrent_teardown=True)
+    container.register(
+        Scoped(create_session),  # type: ignore[arg-type]
+        Scoped(create_handler),
+    )
+
+    async with container.context() as ctx:
+        await ctx.resolve(_Session)
+        await ctx.resolve(int)
+
+    assert events.index("handler:end") < events.index("session:start")
+
+
+async def test_sequential_teardown_by_default() -> None:
+    events: list[str] = []
+    container = Container()
+    for factory in _create_providers(events):
+        container.register(Scoped(factory))  # type: ignore[arg-type]
+
+    async with container.context() as ctx:
+        await ctx.resolve(_Client)
+        await ctx.resolve(_Repository)
+
+    assert events == [
+        "repository:start",
+        "repository:end",
+        "session:start",
+        "session:end",
+        "client:start",
+        "client:end",
+    ]
+
+
+async def test_errors_are_aggregated() -> None:
+    closed = []
+
+    @contextlib.asynccontextmanager
+    async def create_session() -> AsyncIterator[_Session]:
+        yield _Session()
+        raise ValueError
+
+    @contextlib.asynccontextmanager
+    async def create_client() -> AsyncIterator[_Client]:
+        yield _Client()
+        raise KeyError
+
+    @contextlib.asynccontextmanager
+    async def create_repository() -> AsyncIterator[_Repository]:
+        yield _Repository()
+        closed.append(True)
+
+    container = Container(concurrent_teardown=True)
+    container.register(Scoped(create_session))
+    container.register(Scoped(create_client))
+    container.register(Scoped(create_repository))
+
+    ctx = await container.context().__aenter__()
+    await ctx.resolve(_Session)
+    await ctx.resolve(_Client)
+    await ctx.resolve(_Repository)
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await ctx.__aexit__(None, None, None)
+
+    assert sorted(type(e).__name__ for e in exc_info.value.exceptions) == [
+        "KeyError",
+        "ValueError",
+    ]
+    assert closed == [True]
+
+
+async def test_lifespan_is_closed_after_errors() -> None:
+    events: list[str] = []
+
+    class _Lifespan:
+        @contextlib.asynccontextmanager
+        async def lifespan(
+            self,
+            container: Container,  # noqa: ARG002
+        ) -> AsyncIterator[None]:
+            yield
+            events.append("lifespan")
+            raise KeyError
+
+    @contextlib.asynccontextmanager
+    async def create_client() -> AsyncIterator[_Client]:
+        yield _Client()
+        raise ValueError
+
+    container = Container([_Lifespan()], concurrent_teardown=True)
+    container.register(Singleton(create_client))
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        async with container, container.context() as ctx:
+            await ctx.resolve(_Client)
+
+    assert events == ["lifespan"]
+    assert sorted(type(e).__name__ for e in exc_info.value.exceptions) == [
+        "KeyError",
+        "ValueError",
+    ]
+
+
+async def test_lifespan_error_without_provider_errors() -> None:
+    class _Lifespan:
+        @contextlib.asynccontextmanager
+        async def lifespan(
+            self,
+            container: Container,  # noqa: ARG002
+        ) -> AsyncIterator[None]:
+            yield
+            raise KeyError
+
+    @contextlib.asynccontextmanager
+    async def create_client() -> AsyncIterator[_Client]:
+        yield _Client()
+
+    container = Container([_Lifespan()], concurrent_teardown=True)
+    container.register(Singleton(create_client))
+
+    with pytest.raises(KeyError):
+        async with container, container.context() as ctx:
+            await ctx.resolve(_Client)
@@ -0,0 +1,61 @@
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+
+import anyio
+import pytest
+
+from aioinject import Container, Scoped
+
+
+class _Session:
+    pass
+
+
+def _create_container(
+    closed: list[str],
+    *,
+    fail: bool = False,
+    background_tasks: bool = True,
+) -> Container:
+    @contextlib.asynccontextmanager
+    async def create_session() -> AsyncIterator[_Session]:
+        yield _Session()
+        await anyio.sleep(0.01)
+        if fail:
+            raise ValueError
+        closed.append("session")
+
+    container = Container(background_tasks=background_tasks)
+    container.register(Scoped(create_session))
+    return container
+
+
+async def test_deferred_teardown() -> None:
+    closed: list[str] = []
+    container = _create_container(closed)
+
+    async with container:
+        async with container.context(defer_teardown=True) as ctx:
+            await ctx.resolve(_Session)
+        assert closed == []
+    assert closed == ["session"]
+
+
+async def test_inline_without_task_group() -> None:
+    closed: list[str] = []
+    container = _create_container(closed, background_tasks=False)
+
+    async with container, container.context(defer_teardown=True) as ctx:
+        await ctx.resolve(_Session)
+        assert closed == []
+    assert closed == ["session"]
+
+
+async def test_errors_are_logged(caplog: pytest.LogCaptureFixture) -> None:
+    container = _create_container([], fail=True)
+
+    with caplog.at_level(logging.ERROR):
+        async with container, container.context(defer_teardown=True) as ctx:
+            await ctx.resolve(_Session)
+    assert "Failed to close context" in caplog.text
@@ -0,0 +1,157 @@
+import contextlib
+import enum
+from collections.abc import AsyncIterator
+
+import pytest
+
+from aioinject import Container, Custom, Scoped
+from aioinject._store import InstanceStore
+from aioinject.providers import DependencyLifetime
+
+
+class Lifetime(enum.Enum):
+    tenant = enum.auto()
+    process = enum.auto()
+
+
+class _Tenant:
+    pass
+
+
+class _Session:
+    pass
+
+
+@pytest.fixture
+def container() -> Container:
+    container = Container()
+    container.register(Custom(_Tenant, lifetime=Lifetime.tenant))
+    container.register(Scoped(_Session))
+    return container
+
+
+async def test_custom_scoped_lifetime(container: Container) -> None:
+    container.register_lifetime(Lifetime.tenant)
+
+    async with container.context() as ctx:
+        async with ctx.child(lifetime=Lifetime.tenant) as tenant:
+            tenant_instance = await tenant.resolve(_Tenant)
+            session = await tenant.resolve(_Session)
+            async with tenant.child() as child:
+                assert await child.resolve(_Tenant) is tenant_instance
+                assert await child.resolve(_Session) is session
+
+        assert await ctx.resolve(_Session) is session
+        async with ctx.child(lifetime=Lifetime.tenant) as tenant:
+            assert await tenant.resolve(_Tenant) is not tenant_instance
+
+
+async def test_custom_lifetime_is_closed_with_its_scope() -> None:
+    closed = []
+
+    @contextlib.asynccontextmanager
+    async def create_tenant() -> AsyncIterator[_Tenant]:
+        yield _Tenant()
+        closed.append(True)
+
+    container = Container()
+    container.register(Custom(create_tenant, lifetime=Lifetime.tenant))
+    container.register_lifetime(Lifetime.tenant)
+
+    async with container.context() as ctx:
+        async with ctx.child(lifetime=Lifetime.tenant) as tenant:
+            await tenant.resolve(_Tenant)
+        assert closed == [True]
+
+
+async def test_custom_store(container: Container) -> None:
+    store = InstanceStore()
+    container.register_lifetime(Lifetime.tenant)
+
+    async with container.context() as ctx:
+        async with ctx.child(lifetime=Lifetime.tenant, store=store) as tenant:
+            instance = await tenant.resolve(_Tenant)
+        async with ctx.child(lifetime=Lifetime.tenant, store=store) as tenant:
+            assert await tenant.resolve(_Tenant) is instance
+
+
+async def test_container_store() -> None:
+    closed = []
+
+    @contextlib.asynccontextmanager
+    async def create_tenant() -> AsyncIterator[_Tenant]:
+        yield _Tenant()
+        closed.append(True)
+
+    container = Container()
+    container.register(Custom(create_tenant, lifetime=Lifetime.process))
+    container.register_lifetime(Lifetime.process, InstanceStore())
+
+    async with container:
+        async with container.context() as ctx:
+            instance = await ctx.resolve(_Tenant)
+        async with container.context() as ctx:
+            assert await ctx.resolve(_Tenant) is instance
+        assert closed == []
+    assert closed == [True]
+
+
+def test_container_store_sync() -> None:
+    container = Container()
+    container.register(Custom(_Tenant, lifetime=Lifetime.process))
+    container.register_lifetime(Lifetime.process, InstanceStore())
+
+    with container:
+        with container.sync_context() as ctx:
+            instance = ctx.resolve(_Tenant)
+        with container.sync_context() as ctx:
+            assert ctx.resolve(_Tenant) is instance
+
+
+async def test_unregistered_lifetime(container: Container) -> None:
+    async with container.context() as ctx:
+        with pytest.raises(ValueError, match="is not registered"):
+            await ctx.resolve(_Tenant)
+
+
+async def test_lifetime_outside_of_its_scope(container: Container) -> None:
+    container.register_lifetime(Lifetime.tenant)
+
+    async with container.context() as ctx, ctx.child() as child:
+        with pytest.raises(ValueError, match="is not open"):
+            await child.resolve(_Tenant)
+
+
+def test_lifetime_outside_of_its_scope_sync(container: Container) -> None:
+    container.register_lifetime(Lifetime.tenant)
+
+    with container.sync_context() as ctx:
+        with pytest.raises(ValueError, match="is not open"):
+            ctx.resolve(_Tenant)
+        with ctx.child(lifetime=Lifetime.tenant) as tenant:
+            assert tenant.resolve(_Tenant) is tenant.resolve(_Tenant)
+
+
+@pytest.mark.parametrize(
+    "lifetime",
+    [Lifetime.tenant, DependencyLifetime.singleton],
+)
+async def test_child_with_unsupported_lifetime(
+    container: Container,
+    lifetime: enum.Enum,
+) -> None:
+    async with container.context() as ctx:
+        with pytest.raises(ValueError, match="can't be opened"):
+            ctx.child(lifetime=lifetime)
+
+
+@pytest.mark.parametrize(
+    "lifetime",
+    [DependencyLifetime.scoped, DependencyLifetime.item_scoped],
+)
+def test_register_lifetime_twice(
+    container: Container,
+    lifetime: enum.Enum,
+) -> None:
+    with pytest.raises(ValueError, match="already registered"):
+        container.register_lifetime(lifetime)
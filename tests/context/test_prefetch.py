@@ -0,0 +1,89 @@
+import anyio
+import pytest
+
+from aioinject import Container, Scoped
+
+
+class _Session:
+    pass
+
+
+class _Cache:
+    pass
+
+
+@pytest.fixture
+def created() -> list[type[object]]:
+    return []
+
+
+@pytest.fixture
+def container(created: list[type[object]]) -> Container:
+    async def create_session() -> _Session:
+        await anyio.sleep(0.01)
+        created.append(_Session)
+        return _Session()
+
+    async def create_cache() -> _Cache:
+        await anyio.sleep(0.01)
+        created.append(_Cache)
+        return _Cache()
+
+    container = Container(background_tasks=True)
+    container.register(Scoped(create_session))
+    container.register(Scoped(create_cache))
+    return container
+
+
+async def test_prefetch_on_enter(
+    container: Container,
+    created: list[type[object]],
+) -> None:
+    async with container.context(prefetch=[_Session, _Cache]) as ctx:
+        assert sorted(created, key=str) == [_Cache, _Session]
+        await ctx.resolve(_Session)
+        await ctx.resolve(_Cache)
+    assert len(created) == 2  # noqa: PLR2004
+
+
+async def test_prefetch_in_background(
+    container: Container,
+    created: list[type[object]],
+) -> None:
+    async with container, container.context(prefetch=[_Session]) as ctx:
+        assert created == []
+        first = await ctx.resolve(_Session)
+        assert await ctx.resolve(_Session) is first
+    assert created == [_Session]
+
+
+async def test_prefetch_cancelled_on_exit(
+    container: Container,
+    created: list[type[object]],
+) -> None:
+    async with container:
+        async with container.context(prefetch=[_Session, _Cache]):
+            pass
+        await anyio.sleep(0.02)
+    assert created == []
+
+
+async def test_exit_after_prefetch_was_cancelled(container: Container) -> None:
+    async with container:
+        ctx = container.context(prefetch=[_Session])
+        await ctx.__aenter__()
+
+    with anyio.fail_after(1):
+        await ctx.__aexit__(None, None, None)
+
+
+async def test_prefetch_errors_are_raised_on_resolve() -> None:
+    async def create() -> _Session:
+        raise ValueError
+
+    container = Container()
+    container.register(Scoped(create))
+
+    async with container.context(prefetch=[_Session]) as ctx:
+        with pytest.raises(ValueError):  # noqa: PT011
+            await ctx.resolve(_Session)
@@ -0,0 +1,275 @@
+import contextlib
+import enum
+from collections.abc import AsyncIterator, Iterator
+from typing import Annotated
+
+import pytest
+
+from aioinject import (
+    Container,
+    Custom,
+    Inject,
+    Injected,
+    Scoped,
+    Singleton,
+    TaskLocal,
+    ThreadLocal,
+    TTLSingleton,
+    WeakSingleton,
+    inject,
+)
+from aioinject._store import InstanceStore
+from aioinject.providers import (
+    DependencyLifetime,
+    Provider,
+    collect_dependencies,
+)
+
+
+class _Connection:
+    pass
+
+
+class _Repository:
+    def __init__(self, connection: _Connection) -> None:
+        self.connection = connection
+
+
+class _Service:
+    def __init__(self, repository: _Repository) -> None:
+        self.repository = repository
+
+
+class _Lifetime(enum.Enum):
+    process = enum.auto()
+
+
+@pytest.fixture
+def closed() -> list[_Connection]:
+    return []
+
+
+@pytest.fixture
+def container(closed: list[_Connection]) -> Container:
+    @contextlib.asynccontextmanager
+    async def create_connection() -> AsyncIterator[_Connection]:
+        connection = _Connection()
+        yield connection
+        closed.append(connection)
+
+    container = Container()
+    container.register(Scoped(create_connection, releasable=True))
+    container.register(Scoped(int))
+    return container
+
+
+async def test_release(
+    container: Container, closed: list[_Connection]
+) -> None:
+    async with container.context() as ctx:
+        connection = await ctx.resolve(_Connection)
+        await ctx.release(_Connection)
+        assert closed == [connection]
+
+        new_connection = await ctx.resolve(_Connection)
+        assert new_connection is not connection
+    assert closed == [connection, new_connection]
+
+
+async def test_release_from_child(
+    container: Container,
+    closed: list[_Connection],
+) -> None:
+    async with container.context() as ctx:
+        connection = await ctx.resolve(_Connection)
+        async with ctx.child() as child:
+            # The parent's connection may still be used by it and by siblings
+            await child.release(_Connection)
+            assert closed == []
+            assert await child.resolve(_Connection) is connection
+        assert closed == []
+
+        async with ctx.child() as child:
+            await ctx.release(_Connection)
+            own_connection = await child.resolve(_Connection)
+            await child.release(_Connection)
+            assert closed == [connection, own_connection]
+    assert closed == [connection, own_connection]
+
+
+async def test_release_from_item(
+    container: Container,
+    closed: list[_Connection],
+) -> None:
+    async with container.context() as ctx:
+        connection = await ctx.resolve(_Connection)
+        async with ctx.item() as item:
+            # Scoped instances are shared with the batch
+            await item.release(_Connection)
+            assert await item.resolve(_Connection) is connection
+        assert closed == []
+    assert closed == [connection]
+
+
+async def test_release_sync_context_manager() -> None:
+    closed = []
+
+    @contextlib.contextmanager
+    def create_connection() -> Iterator[_Connection]:
+        yield _Connection()
+        closed.append(True)
+
+    container = Container()
+    container.register(Scoped(create_connection, releasable=True))
+
+    async with container.context() as ctx:
+        await ctx.resolve(_Connection)
+        await ctx.release(_Connection)
+        assert closed == [True]
+    assert closed == [True]
+
+
+async def test_release_drops_dependants(
+    container: Container,
+    closed: list[_Connection],
+) -> None:
+    container.register(Scoped(_Repository), Scoped(_Service))
+
+    async with container.context() as ctx:
+        service = await ctx.resolve(_Service)
+        assert await ctx.resolve_iterable(_Service) == [service]
+        await ctx.release(_Connection)
+        assert closed == [service.repository.connection]
+
+        new_service = await ctx.resolve(_Service)
+        assert new_service is not service
+        assert new_service.repository is not service.repository
+        assert new_service.repository.connection not in closed
+        assert await ctx.resolve_iterable(_Service) == [new_service]
+
+
+@pytest.mark.parametrize(
+    "provider",
+    [
+        Singleton(_Connection, releasable=True),
+        TTLSingleton(_Connection, ttl=1, releasable=True),
+        WeakSingleton(_Connection, releasable=True),
+        ThreadLocal(_Connection, releasable=True),
+        TaskLocal(_Connection, releasable=True),
+        Custom(
+            _Connection,
+            lifetime=DependencyLifetime.singleton,
+            releasable=True,
+        ),
+    ],
+)
+def test_shared_lifetimes_are_not_releasable(
+    provider: Provider[_Connection],
+) -> None:
+    container = Container()
+    with pytest.raises(ValueError, match="shared between contexts"):
+        container.register(provider)
+
+
+def test_custom_shared_lifetime_is_not_releasable() -> None:
+    container = Container()
+    container.register_lifetime(_Lifetime.process, InstanceStore())
+    with pytest.raises(ValueError, match="shared between contexts"):
+        container.register(
+            Custom(_Connection, lifetime=_Lifetime.process, releasable=True)
+        )
+
+    container = Container()
+    container.register(
+        Custom(_Connection, lifetime=_Lifetime.process, releasable=True)
+    )
+    with pytest.raises(ValueError, match="shared between contexts"):
+        container.register_lifetime(_Lifetime.process, InstanceStore())
+    assert _Lifetime.process not in container.lifetimes
+
+
+async def test_release_after_execute(
+    container: Container,
+    closed: list[_Connection],
+) -> None:
+    async def handler(
+        connection: Annotated[_Connection, Inject],
+        number: Annotated[int, Inject],  # noqa: ARG001
+    ) -> _Connection:
+        assert closed == []
+        return connection
+
+    async with container.context() as ctx:
+        connection = await ctx.execute(
+            handler,
+            collect_dependencies(handler),
+        )
+        assert closed == [connection]
+        assert await ctx.resolve(int) == 0
+    assert closed == [connection]
+
+
+async def test_release_with_inject(
+    container: Container,
+    closed: list[_Connection],
+) -> None:
+    @inject
+    async def handler(connection: Injected[_Connection]) -> _Connection:
+        return connection
+
+    async with container.context():
+        connection = await handler()  # type: ignore[call-arg]
+        assert closed == [connection]
+
+
+async def test_release_not_releasable(container: Container) -> None:
+    async with container.context() as ctx:
+        with pytest.raises(ValueError, match="is not releasable"):
+            await ctx.release(int)
+
+
+def test_release_sync() -> None:
+    closed = []
+
+    @contextlib.contextmanager
+    def create_connection() -> Iterator[_Connection]:
+        yield _Connection()
+        closed.append(True)
+
+    def handler(connection: Annotated[_Connection, Inject]) -> None:  # noqa: ARG001
+        assert closed == []
+
+    container = Container()
+    container.register(Scoped(create_connection, releasable=True))
+    container.register(Scoped(int))
+
+    with container.sync_context() as ctx:
+        ctx.execute(handler, collect_dependencies(handler))
+        assert closed == [True]
+
+        ctx.resolve(_Connection)
+        ctx.release(_Connection)
+        assert closed == [True, True]
+
+        with pytest.raises(ValueError, match="is not releasable"):
+            ctx.release(int)
+    assert closed == [True, True]
+
+
+def test_release_drops_dependants_sync() -> None:
+    container = Container()
+    container.register(
+        Scoped(_Connection, releasable=True),
+        Scoped(_Repository),
+    )
+
+    with container.sync_context() as ctx:
+        repository = ctx.resolve(_Repository)
+        with ctx.child() as child:
+            child.release(_Connection)
+            assert ctx.resolve(_Repository) is repository
+
+        ctx.release(_Connection)
+        new_repository = ctx.resolve(_Repository)
+        assert new_repository is not repository
+        assert new_repository.connection is not repository.connection
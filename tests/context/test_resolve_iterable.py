@@ -0,0 +1,134 @@
+from collections.abc import Sequence
+
+import anyio.lowlevel
+import pytest
+
+from aioinject import Container, Object, Scoped, Singleton, Transient
+
+
+class Handler:
+    pass
+
+
+class HandlerA(Handler):
+    pass
+
+
+class HandlerB(Handler):
+    pass
+
+
+class HandlerC(Handler):
+    pass
+
+
+class Dispatcher:
+    def __init__(self, handlers: Sequence[Handler]) -> None:
+        self.handlers = handlers
+
+
+def _container(*, concurrent_iterables: bool = False) -> Container:
+    container = Container(concurrent_iterables=concurrent_iterables)
+    container.register(Transient(Dispatcher))
+    return container
+
+
+@pytest.mark.parametrize("concurrent_iterables", [True, False])
+async def test_order_is_preserved(*, concurrent_iterables: bool) -> None:
+    events: list[type[Handler]] = []
+
+    async def create_a() -> HandlerA:
+        for _ in range(3):
+            await anyio.lowlevel.checkpoint()
+        events.append(HandlerA)
+        return HandlerA()
+
+    async def create_b() -> HandlerB:
+        events.append(HandlerB)
+        return HandlerB()
+
+    container = _container(concurrent_iterables=concurrent_iterables)
+    container.register(
+        Scoped(create_a, Handler),
+        Scoped(create_b, Handler),
+        Singleton(HandlerC, Handler),
+    )
+    async with container.context() as ctx:
+        handlers = await ctx.resolve_iterable(Handler)
+        assert [type(handler) for handler in handlers] == [
+            HandlerA,
+            HandlerB,
+            HandlerC,
+        ]
+        dispatcher = await ctx.resolve(Dispatcher)
+        assert dispatcher.handlers == handlers
+        assert dispatcher.handlers is not handlers
+
+    if concurrent_iterables:
+        assert events == [HandlerB, HandlerA]
+    else:
+        assert events == [HandlerA, HandlerB]
+
+
+async def test_list_is_cached_in_context() -> None:
+    created = 0
+
+    def create_handler() -> HandlerA:
+        nonlocal created
+        created += 1
+        return HandlerA()
+
+    container = _container()
+    container.register(Scoped(create_handler, Handler))
+    async with container.context() as ctx:
+        first = await ctx.resolve_iterable(Handler)
+        first.clear()
+        assert len(await ctx.resolve_iterable(Handler)) == 1
+
+        handler = HandlerB()
+        ctx.register(Object(handler, Handler))
+        assert await ctx.resolve_iterable(Handler) == [handler]
+
+    async with container.context() as ctx:
+        await ctx.resolve_iterable(Handler)
+
+    assert created == 2  # noqa: PLR2004
+
+
+async def test_transient_providers_are_not_cached() -> None:
+    container = _container()
+    container.register(Scoped(HandlerA, Handler), Transient(HandlerB, Handler))
+    async with container.context() as ctx:
+        first = await ctx.resolve_iterable(Handler)
+        second = await ctx.resolve_iterable(Handler)
+
+    assert first[0] is second[0]
+    assert first[1] is not second[1]
+
+
+def test_sync() -> None:
+    container = _container()
+    container.register(
+        Scoped(HandlerA, Handler),
+        Transient(HandlerB, Handler),
+        Singleton(HandlerC, Handler),
+    )
+    with container.sync_context() as ctx:
+        dispatcher = ctx.resolve(Dispatcher)
+        assert [type(handler) for handler in dispatcher.handlers] == [
+            HandlerA,
+            HandlerB,
+            HandlerC,
+        ]
+        assert ctx.resolve_iterable(Handler)[1] is not dispatcher.handlers[1]
+
+
+def test_sync_list_is_cached_in_context() -> None:
+    container = _container()
+    container.register(Scoped(HandlerA, Handler), Singleton(HandlerC, Handler))
+    with container.sync_context() as ctx:
+        first = ctx.resolve_iterable(Handler)
+        first.clear()
+        second = ctx.resolve_iterable(Handler)
+        assert [type(handler) for handler in second] == [HandlerA, HandlerC]
+        assert second == ctx.resolve_iterable(Handler)
@@ -0,0 +1,113 @@
+import functools
+import sys
+
+import anyio.lowlevel
+import pytest
+
+from aioinject import Container, Scoped, Singleton, Transient
+
+
+if sys.version_info < (3, 11):  # pragma: no cover
+    from exceptiongroup import ExceptionGroup
+
+
+class Session:
+    created = 0
+
+    def __init__(self) -> None:
+        Session.created += 1
+
+
+class UserRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+
+class OrderRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+
+async def _create_client() -> int:
+    await anyio.lowlevel.checkpoint()
+    return 42
+
+
+@pytest.fixture(autouse=True)
+def _reset_counter() -> None:
+    Session.created = 0
+
+
+@pytest.fixture
+def container() -> Container:
+    container = Container()
+    container.register(
+        Scoped(Session),
+        Transient(UserRepository),
+        Transient(OrderRepository),
+        Singleton(_create_client),
+    )
+    return container
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+async def test_resolve_many(container: Container, *, concurrent: bool) -> None:
+    async with container.context() as ctx:
+        users, orders, client = await ctx.resolve_many(
+            UserRepository,
+            OrderRepository,
+            int,
+            concurrent=concurrent,
+        )
+
+        assert isinstance(users, UserRepository)
+        assert isinstance(orders, OrderRepository)
+        assert users.session is orders.session
+        assert client == 42  # noqa: PLR2004
+        assert Session.created == 1
+
+
+async def test_resolve_many_empty(container: Container) -> None:
+    async with container.context() as ctx:
+        assert await ctx.resolve_many() == ()
+        assert await ctx.resolve_many(concurrent=True) == ()
+
+
+async def test_missing_provider(container: Container) -> None:
+    async with container.context() as ctx:
+        with pytest.raises(ValueError, match="Providers for type"):
+            await ctx.resolve_many(Session, str, concurrent=True)
+
+
+async def test_overlapping_concurrent_calls(container: Container) -> None:
+    async with container.context() as ctx, anyio.create_task_group() as tg:
+        for _ in range(2):
+            tg.start_soon(
+                functools.partial(
+                    ctx.resolve_many,
+                    UserRepository,
+                    int,
+                    concurrent=True,
+                )
+            )
+    assert Session.created == 1
+
+
+async def test_concurrent_errors() -> None:
+    async def failing() -> int:
+        raise ZeroDivisionError
+
+    container = Container()
+    container.register(Scoped(Session), Scoped(failing))
+    async with container.context() as ctx:
+        with pytest.raises(ExceptionGroup) as exc_info:
+            await ctx.resolve_many(Session, int, concurrent=True)
+
+    assert exc_info.group_contains(ZeroDivisionError)
+
+
+def test_sync(container: Container) -> None:
+    with container.sync_context() as ctx:
+        users, orders = ctx.resolve_many(UserRepository, OrderRepository)
+        assert users.session is orders.session
+        assert Session.created == 1
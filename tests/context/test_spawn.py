@@ -0,0 +1,128 @@
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+
+import anyio
+import pytest
+
+from aioinject import Container, Injected, Scoped
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.closed = False
+
+
+@pytest.fixture
+def container() -> Container:
+    @contextlib.asynccontextmanager
+    async def create_session() -> AsyncIterator[_Session]:
+        session = _Session()
+        yield session
+        session.closed = True
+
+    container = Container(background_tasks=True)
+    container.register(Scoped(create_session))
+    return container
+
+
+async def test_spawn_delays_teardown(container: Container) -> None:
+    event = anyio.Event()
+    used: list[bool] = []
+
+    async def audit(session: Injected[_Session], value: int) -> None:
+        await event.wait()
+        used.append(session.closed)
+        assert value == 1
+
+    async with container:
+        async with container.context() as ctx:
+            session = await ctx.resolve(_Session)
+            ctx.spawn(audit, value=1)
+
+        assert not session.closed
+        event.set()
+        await anyio.sleep(0.01)
+        assert used == [False]
+        assert session.closed
+
+
+async def test_spawn_from_child(container: Container) -> None:
+    event = anyio.Event()
+
+    async def audit(session: Injected[_Session]) -> None:
+        await event.wait()
+        assert not session.closed
+
+    async with container:
+        async with container.context() as ctx:
+            session = await ctx.resolve(_Session)
+            async with ctx.child() as child:
+                child.spawn(audit)
+
+        assert not session.closed
+        event.set()
+        await anyio.sleep(0.01)
+        assert session.closed
+
+
+async def test_container_waits_for_spawned_tasks(container: Container) -> None:
+    finished: list[bool] = []
+
+    async def audit(session: Injected[_Session]) -> None:
+        await anyio.sleep(0.01)
+        finished.append(session.closed)
+
+    async with container, container.context() as ctx:
+        session = await ctx.resolve(_Session)
+        ctx.spawn(audit)
+
+    assert finished == [False]
+    assert session.closed
+
+
+async def test_spawned_errors_are_logged(
+    container: Container,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    async def audit() -> None:
+        raise ValueError
+
+    with caplog.at_level(logging.ERROR):
+        async with container:
+            async with container.context() as ctx:
+                ctx.spawn(audit)
+            await anyio.sleep(0.01)
+    assert "Spawned task" in caplog.text
+
+
+async def test_spawn_requires_entered_container(
+    container: Container,
+) -> None:
+    async def audit() -> None:
+        pass
+
+    async with container.context() as ctx:
+        with pytest.raises(RuntimeError, match="Container must be entered"):
+            ctx.spawn(audit)
+
+
+async def test_spawn_requires_background_tasks() -> None:
+    async def audit() -> None:
+        pass
+
+    async with Container() as container, container.context() as ctx:
+        with pytest.raises(RuntimeError, match="background_tasks=True"):
+            ctx.spawn(audit)
+
+
+async def test_spawn_from_closed_context(container: Container) -> None:
+    async def audit() -> None:
+        pass
+
+    async with container:
+        async with container.context() as ctx:
+            pass
+
+        with pytest.raises(RuntimeError, match="closed context"):
+            ctx.spawn(audit)
@@ -1,13 +1,18 @@
 import contextlib
 import uuid
-from typing import Any
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
 
 import httpx
 import pytest
 from _pytest.fixtures import SubRequest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport
 
 import aioinject
-from aioinject import Scoped, Singleton, Transient
+from aioinject import Inject, Scoped, Singleton, Transient
+from aioinject.context import context_var
+from aioinject.ext.fastapi import AioInjectMiddleware, inject
 from tests.ext.utils import ExceptionPropagation, PropagatedError
 
 
@@ -64,3 +69,77 @@ async def test_propagation(
         assert isinstance(propagation.exc, PropagatedError)
     else:
         assert propagation.exc is None
+
+
+async def test_inject_from_scope(
+    container: aioinject.Container,
+    provided_value: int,
+) -> None:
+    app = FastAPI()
+    app.add_middleware(
+        AioInjectMiddleware,
+        container=container,
+        use_context_var=False,
+    )
+
+    @inject(from_scope=True)
+    async def dependency(
+        number: Annotated[int, Inject],
+    ) -> AsyncIterator[int]:
+        yield number
+
+    @app.get("/")
+    @inject(from_scope=True)
+    async def route(
+        provided: Annotated[int, Inject],
+        from_dependency: Annotated[int, Depends(dependency)],
+    ) -> dict[str, bool | int]:
+        return {
+            "value": provided,
+            "from_dependency": from_dependency,
+            "context_var_set": context_var.get(None) is not None,
+        }
+
+    async with httpx.AsyncClient(
+        transport=ASGITransport(app),
+        base_url="http://test",
+    ) as client:
+        response = await client.get("/")
+
+    assert response.status_code == httpx.codes.OK.value
+    assert response.json() == {
+        "value": provided_value,
+        "from_dependency": provided_value,
+        "context_var_set": False,
+    }
+
+
+async def test_prefetch(container: aioinject.Container) -> None:
+    prefetched = []
+
+    class _Prefetched:
+        pass
+
+    def create() -> _Prefetched:
+        prefetched.append(True)
+        return _Prefetched()
+
+    container.register(aioinject.Scoped(create))
+    app = FastAPI()
+    app.add_middleware(
+        AioInjectMiddleware,
+        container=container,
+        prefetch=[_Prefetched],
+    )
+
+    @app.get("/")
+    async def route() -> None:
+        assert prefetched == [True]
+
+    async with httpx.AsyncClient(
+        transport=ASGITransport(app),
+        base_url="http://test",
+    ) as client:
+        response = await client.get("/")
+
+    assert response.status_code == httpx.codes.OK.value
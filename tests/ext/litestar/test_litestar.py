@@ -1,11 +1,17 @@
 import contextlib
 import uuid
+from typing import Annotated
 
 import httpx
 import pytest
+from httpx import ASGITransport
+from litestar import Litestar, get
+from litestar.types import Scope
 
 import aioinject
-from aioinject import Provider, Scoped, Singleton, Transient
+from aioinject import Inject, Provider, Scoped, Singleton, Transient
+from aioinject.context import context_var
+from aioinject.ext.litestar import _SCOPE_CONTEXT_KEY, AioInjectPlugin, inject
 from tests.ext.utils import ExceptionPropagation, PropagatedError
 
 
@@ -55,3 +61,45 @@ async def test_should_propagate_exceptions(
         assert isinstance(propagation.exc, PropagatedError)
     else:
         assert propagation.exc is None
+
+
+async def test_inject_from_scope(
+    container: aioinject.Container,
+    provided_value: int,
+) -> None:
+    @get("/")
+    @inject(from_scope=True)
+    async def route(provided: Annotated[int, Inject]) -> dict[str, bool | int]:
+        return {
+            "value": provided,
+            "context_var_set": context_var.get(None) is not None,
+        }
+
+    @get("/with-scope")
+    @inject(from_scope=True)
+    async def route_with_scope(
+        provided: Annotated[int, Inject],
+        scope: Scope,
+    ) -> dict[str, bool | int]:
+        assert _SCOPE_CONTEXT_KEY in scope
+        return {
+            "value": provided,
+            "context_var_set": context_var.get(None) is not None,
+        }
+
+    app = Litestar(
+        [route, route_with_scope],
+        plugins=[AioInjectPlugin(container=container, use_context_var=False)],
+    )
+    async with httpx.AsyncClient(
+        transport=ASGITransport(app),  # type: ignore[arg-type]
+        base_url="http://test",
+    ) as client:
+        responses = [await client.get(path) for path in ("/", "/with-scope")]
+
+    for response in responses:
+        assert response.status_code == httpx.codes.OK.value
+        assert response.json() == {
+            "value": provided_value,
+            "context_var_set": False,
+        }
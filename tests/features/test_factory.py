@@ -0,0 +1,138 @@
+import contextlib
+from collections.abc import AsyncIterator, Sequence
+
+import pytest
+
+from aioinject import (
+    Container,
+    Factory,
+    ItemScoped,
+    Scoped,
+    SyncFactory,
+    Transient,
+)
+
+
+class Session:
+    pass
+
+
+class Handler:
+    pass
+
+
+class Command:
+    def __init__(self, session: Session, handlers: Sequence[Handler]) -> None:
+        self.session = session
+        self.handlers = handlers
+
+
+class Service:
+    def __init__(self, create_command: Factory[Command]) -> None:
+        self.create_command = create_command
+
+
+@pytest.fixture
+def container() -> Container:
+    container = Container()
+    container.register(
+        Scoped(Session),
+        Transient(Handler),
+        Transient(Command),
+        Transient(Service),
+    )
+    return container
+
+
+async def test_factory(container: Container) -> None:
+    async with container.context() as ctx:
+        service = await ctx.resolve(Service)
+        first = await service.create_command()
+        second = await service.create_command()
+
+        assert first is not second
+        assert first.session is second.session is await ctx.resolve(Session)
+        assert len(first.handlers) == 1
+
+
+async def test_factory_of_scoped_dependency(container: Container) -> None:
+    async with container.context() as ctx:
+        factory = await ctx.resolve(Factory[Session])
+        assert await factory() is await factory() is await ctx.resolve(Session)
+
+
+async def test_factory_closes_context_managers() -> None:
+    closed = []
+
+    @contextlib.asynccontextmanager
+    async def create_handler() -> AsyncIterator[Handler]:
+        handler = Handler()
+        yield handler
+        closed.append(handler)
+
+    container = Container()
+    container.register(Transient(create_handler))
+    async with container.context() as ctx:
+        factory = await ctx.resolve(Factory[Handler])
+        instances = [await factory() for _ in range(3)]
+        assert not closed
+
+    assert closed == instances[::-1]
+
+
+async def test_factory_is_bound_to_child_context(container: Container) -> None:
+    async with container.context() as ctx:
+        parent_factory = await ctx.resolve(Factory[Command])
+        session = Session()
+        async with ctx.child({Session: session}) as child:
+            factory = await child.resolve(Factory[Command])
+            assert factory is not parent_factory
+            assert (await factory()).session is session
+
+
+async def test_factory_is_bound_to_item_context() -> None:
+    container = Container()
+    container.register(ItemScoped(Session), Transient(Handler))
+    container.register(Transient(Command), Transient(Service))
+
+    async with container.context() as ctx:
+        await ctx.resolve(Factory[Command])
+        sessions = []
+        for _ in range(2):
+            async with ctx.item() as item:
+                service = await item.resolve(Service)
+                sessions.append((await service.create_command()).session)
+                assert sessions[-1] is await item.resolve(Session)
+
+    assert sessions[0] is not sessions[1]
+
+
+async def test_missing_provider() -> None:
+    container = Container()
+    async with container.context() as ctx:
+        with pytest.raises(ValueError, match="Providers for type"):
+            await ctx.resolve(Factory[Command])
+
+
+def test_sync(container: Container) -> None:
+    with container.sync_context() as ctx:
+        factory = ctx.resolve(SyncFactory[Command])
+        first, second = factory(), factory()
+
+        assert first is not second
+        assert first.session is second.session is ctx.resolve(Session)
+
+
+def test_sync_factory_of_scoped_dependency(container: Container) -> None:
+    with container.sync_context() as ctx:
+        factory = ctx.resolve(SyncFactory[Session])
+        assert factory() is factory() is ctx.resolve(Session)
+
+
+def test_sync_missing_provider() -> None:
+    container = Container()
+    with container.sync_context() as ctx:
+        with pytest.raises(ValueError, match="Providers for type"):
+            ctx.resolve(SyncFactory[Command])
+        with pytest.raises(ValueError, match="Providers for type"):
+            ctx.resolve(Command)
@@ -72,6 +72,21 @@ async def test_generic_dependency() -> None:
     )
 
 
+def test_specialized_dependencies() -> None:
+    provider = Scoped(NestedGeneric[int, str])
+    assert provider.specialized_dependencies() == (
+        ("simple_gen", MultipleSimpleGeneric[int, str], False),
+        ("u", str, False),
+    )
+    assert (
+        provider.specialized_dependencies()
+        is provider.specialized_dependencies()
+    )
+    assert Scoped(UnusedGeneric[int]).specialized_dependencies() == (
+        ("dependency", str, False),
+    )
+
+
 @pytest.mark.parametrize(
     ("type_", "instanceof"),
     [
@@ -0,0 +1,170 @@
+from typing import Annotated, Generic, TypeVar
+
+import pytest
+
+from aioinject import (
+    Container,
+    Inject,
+    ItemScoped,
+    Lazy,
+    Object,
+    Scoped,
+    Singleton,
+    SyncLazy,
+    Transient,
+)
+from aioinject.providers import collect_dependencies
+from aioinject.validation import (
+    all_dependencies_are_present,
+    validate_container,
+)
+from aioinject.validation.error import (
+    ContainerValidationErrorGroup,
+    DependencyNotFoundError,
+)
+
+
+T = TypeVar("T")
+
+
+class Expensive:
+    created = 0
+
+    def __init__(self) -> None:
+        Expensive.created += 1
+
+
+class Service:
+    def __init__(self, expensive: Lazy[Expensive]) -> None:
+        self.expensive = expensive
+
+
+class SyncService:
+    def __init__(self, expensive: SyncLazy[Expensive]) -> None:
+        self.expensive = expensive
+
+
+class GenericService(Generic[T]):
+    def __init__(self, dependency: Lazy[T]) -> None:
+        self.dependency = dependency
+
+
+@pytest.fixture(autouse=True)
+def _reset_counter() -> None:
+    Expensive.created = 0
+
+
+@pytest.fixture
+def container() -> Container:
+    container = Container()
+    container.register(
+        Scoped(Expensive),
+        Transient(Service),
+        Transient(SyncService),
+    )
+    return container
+
+
+async def test_construction_is_deferred(container: Container) -> None:
+    async with container.context() as ctx:
+        service = await ctx.resolve(Service)
+        assert Expensive.created == 0
+
+        expensive = await service.expensive
+        assert Expensive.created == 1
+        assert await service.expensive.get() is expensive
+        assert await ctx.resolve(Expensive) is expensive
+        assert Expensive.created == 1
+
+
+async def test_resolve_lazy_directly(container: Container) -> None:
+    async with container.context() as ctx:
+        lazy = await ctx.resolve(Lazy[Expensive])
+        assert lazy is await ctx.resolve(Lazy[Expensive])
+        assert await lazy is await ctx.resolve(Expensive)
+
+
+async def test_registered_lazy_replaces_handle(container: Container) -> None:
+    async with container.context() as ctx:
+        handle = await ctx.resolve(Lazy[Expensive])
+        registered = Lazy(handle.get)
+        ctx.register(Object(registered, type_=Lazy[Expensive]))
+        assert await ctx.resolve(Lazy[Expensive]) is registered
+
+
+async def test_lazy_is_bound_to_context(container: Container) -> None:
+    async with container.context() as ctx:
+        first = await (await ctx.resolve(Service)).expensive
+
+    async with container.context() as ctx:
+        second = await (await ctx.resolve(Service)).expensive
+
+    assert first is not second
+
+
+async def test_lazy_is_bound_to_item_context() -> None:
+    container = Container()
+    container.register(ItemScoped(Expensive), Transient(Service))
+
+    async with container.context() as ctx:
+        await ctx.resolve(Lazy[Expensive])
+        instances = []
+        for _ in range(2):
+            async with ctx.item() as item:
+                service = await item.resolve(Service)
+                instances.append(await service.expensive)
+                assert instances[-1] is await item.resolve(Expensive)
+
+    assert instances[0] is not instances[1]
+
+
+async def test_injected_marker(container: Container) -> None:
+    async def function(
+        lazy: Annotated[Lazy[Expensive], Inject],
+    ) -> Expensive:
+        return await lazy
+
+    async with container.context() as ctx:
+        instance = await ctx.execute(function, collect_dependencies(function))
+        assert instance is await ctx.resolve(Expensive)
+
+
+async def test_generic() -> None:
+    container = Container()
+    container.register(
+        Singleton(Expensive),
+        Transient(GenericService[Expensive]),
+    )
+    async with container.context() as ctx:
+        service = await ctx.resolve(GenericService[Expensive])
+        assert Expensive.created == 0
+        assert await service.dependency is await ctx.resolve(Expensive)
+
+
+async def test_missing_dependency_is_raised_on_access() -> None:
+    container = Container()
+    async with container.context() as ctx:
+        lazy = await ctx.resolve(Lazy[Expensive])
+        with pytest.raises(ValueError, match="Providers for type"):
+            await lazy
+
+
+def test_sync(container: Container) -> None:
+    with container.sync_context() as ctx:
+        service = ctx.resolve(SyncService)
+        assert Expensive.created == 0
+        assert service.expensive.get() is ctx.resolve(Expensive)
+        assert Expensive.created == 1
+
+
+def test_validation() -> None:
+    container = Container()
+    container.register(Transient(Service))
+    with pytest.raises(ContainerValidationErrorGroup) as exc_info:
+        validate_container(container, [all_dependencies_are_present])
+    (error,) = exc_info.value.errors
+    assert isinstance(error, DependencyNotFoundError)
+    assert error.dependency == Lazy[Expensive]
+
+    container.register(Scoped(Expensive))
+    validate_container(container, [all_dependencies_are_present])
@@ -0,0 +1,153 @@
+import dataclasses
+from collections.abc import Sequence
+from typing import Annotated
+
+import pytest
+
+from aioinject import (
+    ConcurrencyLimit,
+    Container,
+    Custom,
+    Inject,
+    Keyed,
+    Object,
+    Pooled,
+    Provider,
+    Scoped,
+    Singleton,
+    TTLSingleton,
+    WeakSingleton,
+)
+from aioinject.providers import DependencyLifetime, collect_dependencies
+from aioinject.validation import (
+    all_dependencies_are_present,
+    validate_container,
+)
+from aioinject.validation.error import ContainerValidationErrorGroup
+
+
+@dataclasses.dataclass
+class Redis:
+    url: str
+
+
+def _cache_redis() -> Redis:
+    return Redis("redis://cache")
+
+
+def _queue_redis() -> Redis:
+    return Redis("redis://queue")
+
+
+class Cache:
+    def __init__(self, redis: Annotated[Redis, Inject(name="cache")]) -> None:
+        self.redis = redis
+
+
+class Queue:
+    def __init__(
+        self,
+        redis: Annotated[Redis, Inject(name="queue")],
+        default: Redis,
+    ) -> None:
+        self.redis = redis
+        self.default = default
+
+
+@pytest.fixture
+def container() -> Container:
+    container = Container()
+    container.register(
+        Singleton(_cache_redis, name="cache"),
+        Singleton(_queue_redis, name="queue"),
+        Object(Redis("redis://default")),
+        Scoped(Cache),
+        Scoped(Queue),
+    )
+    return container
+
+
+async def test_named_dependencies(container: Container) -> None:
+    async with container.context() as ctx:
+        cache = await ctx.resolve(Cache)
+        queue = await ctx.resolve(Queue)
+
+    assert cache.redis.url == "redis://cache"
+    assert queue.redis.url == "redis://queue"
+    assert queue.default.url == "redis://default"
+
+
+async def test_execute(container: Container) -> None:
+    def function(
+        cache: Annotated[Redis, Inject(name="cache")],
+        redis: Annotated[Sequence[Redis], Inject(name="queue")],
+    ) -> tuple[Redis, Sequence[Redis]]:
+        return cache, redis
+
+    async with container.context() as ctx:
+        cache, queue = await ctx.execute(
+            function, collect_dependencies(function)
+        )
+
+    assert cache.url == "redis://cache"
+    assert [redis.url for redis in queue] == ["redis://queue"]
+
+
+async def test_unnamed_lookup_ignores_named_providers() -> None:
+    container = Container()
+    container.register(Singleton(_cache_redis, name="cache"))
+    async with container.context() as ctx:
+        with pytest.raises(ValueError, match="Providers for type"):
+            await ctx.resolve(Redis)
+
+
+async def test_override(container: Container) -> None:
+    with container.override(Object(Redis("redis://test"), name="cache")):
+        async with container.context() as ctx:
+            assert (await ctx.resolve(Cache)).redis.url == "redis://test"
+            assert (await ctx.resolve(Queue)).redis.url == "redis://queue"
+
+
+@pytest.mark.parametrize(
+    "provider",
+    [
+        WeakSingleton(_cache_redis, name="cache"),
+        TTLSingleton(_cache_redis, ttl=60, name="cache"),
+        Pooled(_cache_redis, max_size=1, name="cache"),
+        Custom(_cache_redis, DependencyLifetime.scoped, name="cache"),
+    ],
+)
+async def test_provider_subclasses(provider: Provider[Redis]) -> None:
+    container = Container()
+    container.register(provider, Scoped(Cache))
+    async with container.context() as ctx:
+        assert (await ctx.resolve(Cache)).redis.url == "redis://cache"
+
+
+def test_provider_subclasses_forward_options() -> None:
+    limit = ConcurrencyLimit(1)
+    provider = Keyed(
+        Cache,
+        key=Redis,
+        max_size=1,
+        limit=limit,
+        releasable=True,
+        name="cache",
+    )
+    assert provider.limit is limit
+    assert provider.releasable
+    assert provider.name == "cache"
+
+
+def test_sync(container: Container) -> None:
+    with container.sync_context() as ctx:
+        assert ctx.resolve(Cache).redis.url == "redis://cache"
+
+
+def test_validation(container: Container) -> None:
+    validate_container(container, [all_dependencies_are_present])
+
+    container = Container()
+    container.register(Object(Redis("redis://default")), Scoped(Cache))
+    with pytest.raises(ContainerValidationErrorGroup):
+        validate_container(container, [all_dependencies_are_present])
@@ -0,0 +1,120 @@
+from typing import Generic, TypeVar
+
+import pytest
+
+from aioinject import Container, Object, Scoped, Singleton, Transient
+from aioinject.validation import (
+    all_dependencies_are_present,
+    validate_container,
+)
+
+
+T = TypeVar("T")
+
+
+class Session:
+    pass
+
+
+class User:
+    pass
+
+
+class Order:
+    pass
+
+
+class Repository(Generic[T]):
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+
+class SQLRepository(Repository[T]):
+    pass
+
+
+class Service(Generic[T]):
+    def __init__(self, repository: Repository[T]) -> None:
+        self.repository = repository
+
+
+class UserService:
+    def __init__(self, repository: Repository[User]) -> None:
+        self.repository = repository
+
+
+@pytest.fixture
+def container() -> Container:
+    container = Container()
+    container.register(Scoped(Session), Scoped(Repository))
+    return container
+
+
+async def test_open_generic(container: Container) -> None:
+    container.register(Transient(UserService))
+    async with container.context() as ctx:
+        users = await ctx.resolve(Repository[User])
+        orders = await ctx.resolve(Repository[Order])
+        service = await ctx.resolve(UserService)
+
+        assert isinstance(users, Repository)
+        assert users is not orders  # type: ignore[comparison-overlap]
+        assert users is service.repository
+        assert users.session is orders.session
+
+
+async def test_closed_provider_is_cached(container: Container) -> None:
+    users = container.get_provider(Repository[User])
+    orders = container.get_provider(Repository[Order])
+    assert users is container.get_provider(Repository[User])
+    assert users is not orders  # type: ignore[comparison-overlap]
+
+
+async def test_open_generic_alias() -> None:
+    container = Container()
+    container.register(
+        Scoped(Session),
+        Scoped(SQLRepository, Repository[T]),  # type: ignore[valid-type]
+        Transient(Service),
+    )
+    async with container.context() as ctx:
+        service = await ctx.resolve(Service[User])
+        assert isinstance(service.repository, SQLRepository)
+        assert service.repository is await ctx.resolve(Repository[User])
+
+
+async def test_singleton_is_shared_across_contexts() -> None:
+    container = Container()
+    container.register(Scoped(Session), Singleton(Repository))
+    async with container.context() as ctx:
+        first = await ctx.resolve(Repository[User])
+    async with container.context() as ctx:
+        assert await ctx.resolve(Repository[User]) is first
+
+
+async def test_closed_registration_takes_precedence(
+    container: Container,
+) -> None:
+    repository = Repository[User](Session())
+    container.register(Object(repository, Repository[User]))
+    async with container.context() as ctx:
+        assert await ctx.resolve(Repository[User]) is repository
+        assert await ctx.resolve(Repository[Order]) is not repository  # type: ignore[comparison-overlap]
+
+
+async def test_override(container: Container) -> None:
+    repository = Repository[User](Session())
+    async with container.context() as ctx:
+        await ctx.resolve(Repository[User])
+
+    with container.override(Object(repository, Repository)):
+        async with container.context() as ctx:
+            assert await ctx.resolve(Repository[User]) is repository
+
+    async with container.context() as ctx:
+        assert await ctx.resolve(Repository[User]) is not repository
+
+
+def test_validation(container: Container) -> None:
+    container.register(Transient(UserService))
+    validate_container(container, [all_dependencies_are_present])
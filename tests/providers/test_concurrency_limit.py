@@ -0,0 +1,183 @@
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Any
+
+import anyio
+import pytest
+
+from aioinject import (
+    ConcurrencyLimit,
+    Container,
+    InjectionContext,
+    Provider,
+    Scoped,
+    Singleton,
+    Transient,
+)
+
+
+class _Connection:
+    pass
+
+
+class _WaitExtension:
+    def __init__(self) -> None:
+        self.waits: list[tuple[Provider[Any], float]] = []
+
+    async def on_wait(
+        self,
+        context: InjectionContext,  # noqa: ARG002
+        provider: Provider[Any],
+        seconds: float,
+    ) -> None:
+        self.waits.append((provider, seconds))
+
+
+class _Tracker:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    @contextlib.asynccontextmanager
+    async def track(self) -> AsyncIterator[None]:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            yield
+        finally:
+            self.active -= 1
+
+
+async def _run_concurrently(
+    container: Container,
+    extension: _WaitExtension,
+    count: int,
+) -> None:
+    async def resolve() -> None:
+        async with container.context(extensions=[extension]) as ctx:
+            await ctx.resolve(_Connection)
+            await anyio.sleep(0.01)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(count):
+            tg.start_soon(resolve)
+
+
+async def test_limits_construction() -> None:
+    tracker = _Tracker()
+
+    async def create() -> _Connection:
+        async with tracker.track():
+            await anyio.sleep(0.01)
+        return _Connection()
+
+    extension = _WaitExtension()
+    container = Container()
+    provider = Scoped[_Connection](create, limit=ConcurrencyLimit(2))
+    container.register(provider)
+
+    await _run_concurrently(container, extension, count=5)
+    assert tracker.max_active == 2  # noqa: PLR2004
+    assert len(extension.waits) == 3  # noqa: PLR2004
+    assert all(p is provider and seconds > 0 for p, seconds in extension.waits)
+
+
+async def test_hold_limits_alive_instances() -> None:
+    tracker = _Tracker()
+
+    @contextlib.asynccontextmanager
+    async def create() -> AsyncIterator[_Connection]:
+        async with tracker.track():
+            yield _Connection()
+
+    extension = _WaitExtension()
+    container = Container()
+    container.register(Scoped(create, limit=ConcurrencyLimit(1, hold=True)))
+
+    await _run_concurrently(container, extension, count=3)
+    assert tracker.max_active == 1
+    assert len(extension.waits) == 2  # noqa: PLR2004
+
+
+async def test_shared_limit() -> None:
+    limit = ConcurrencyLimit(1, hold=True)
+    container = Container()
+    container.register(Scoped(_Connection, limit=limit))
+    container.register(Transient(int, limit=limit))
+
+    async with container.context() as ctx:
+        await ctx.resolve(_Connection)
+        with anyio.move_on_after(0.01) as scope:
+            await ctx.resolve(int)
+        assert scope.cancelled_caught
+
+    async with container.context() as ctx:
+        assert await ctx.resolve(int) == 0
+
+
+async def test_limit_released_on_error() -> None:
+    async def create() -> _Connection:
+        raise ValueError
+
+    container = Container()
+    container.register(Scoped(create, limit=ConcurrencyLimit(1)))
+
+    for _ in range(2):
+        async with container.context() as ctx:
+            with pytest.raises(ValueError):  # noqa: PT011
+                await ctx.resolve(_Connection)
+
+
+async def test_held_limit_released_on_error() -> None:
+    calls = 0
+
+    async def create() -> _Connection:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError
+        return _Connection()
+
+    container = Container()
+    container.register(
+        Singleton(create, limit=ConcurrencyLimit(1, hold=True)),
+    )
+
+    async with container:
+        async with container.context() as ctx:
+            with pytest.raises(ValueError):  # noqa: PT011
+                await ctx.resolve(_Connection)
+
+        with anyio.fail_after(1):
+            async with container.context() as ctx:
+                await ctx.resolve(_Connection)
+
+
+async def test_limit_released_when_on_wait_fails() -> None:
+    class _FailingExtension:
+        async def on_wait(
+            self,
+            context: InjectionContext,  # noqa: ARG002
+            provider: Provider[Any],  # noqa: ARG002
+            seconds: float,  # noqa: ARG002
+        ) -> None:
+            raise ValueError
+
+    limit = ConcurrencyLimit(1)
+    container = Container()
+    container.register(Scoped(_Connection, limit=limit))
+
+    async def release() -> None:
+        await anyio.sleep(0.01)
+        limit.release()
+
+    await limit.acquire()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(release)
+        async with container.context(extensions=[_FailingExtension()]) as ctx:
+            with pytest.raises(ValueError):  # noqa: PT011
+                await ctx.resolve(_Connection)
+
+    with anyio.fail_after(1):
+        async with container.context() as ctx:
+            await ctx.resolve(_Connection)
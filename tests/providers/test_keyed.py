@@ -0,0 +1,160 @@
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Generic, NewType, TypeVar
+
+import anyio
+import pytest
+
+from aioinject import Container, Keyed
+
+
+T = TypeVar("T")
+
+
+TenantId = NewType("TenantId", str)
+
+
+class _Engine:
+    def __init__(self, tenant_id: TenantId) -> None:
+        self.tenant_id = tenant_id
+
+
+class _Client(Generic[T]):
+    def __init__(self, tenant_id: TenantId) -> None:
+        self.tenant_id = tenant_id
+
+
+class _Engines:
+    def __init__(self) -> None:
+        self.closed: list[str] = []
+
+    @contextlib.asynccontextmanager
+    async def create(self, tenant_id: TenantId) -> AsyncIterator[_Engine]:
+        yield _Engine(tenant_id)
+        self.closed.append(tenant_id)
+
+
+async def _resolve(container: Container, tenant_id: str) -> _Engine:
+    async with container.context({TenantId: TenantId(tenant_id)}) as ctx:
+        return await ctx.resolve(_Engine)
+
+
+async def test_cached_per_key() -> None:
+    container = Container()
+    container.register(Keyed(_Engine, key=TenantId, max_size=10))
+
+    first = await _resolve(container, "a")
+    assert first.tenant_id == "a"
+    assert await _resolve(container, "a") is first
+    assert await _resolve(container, "b") is not first
+
+
+async def test_lru_eviction() -> None:
+    engines = _Engines()
+    container = Container()
+    container.register(Keyed(engines.create, key=TenantId, max_size=2))
+
+    engine_a = await _resolve(container, "a")
+    await _resolve(container, "b")
+    await _resolve(container, "a")
+    await _resolve(container, "c")
+    assert engines.closed == ["b"]
+    assert await _resolve(container, "a") is engine_a
+
+    await container.aclose()
+    assert sorted(engines.closed) == ["a", "b", "c"]
+
+
+async def test_idle_timeout() -> None:
+    engines = _Engines()
+    container = Container()
+    container.register(
+        Keyed(engines.create, key=TenantId, max_size=10, idle_timeout=0)
+    )
+
+    engine_a = await _resolve(container, "a")
+    assert await _resolve(container, "b") is not engine_a
+    assert engines.closed == ["a"]
+
+
+async def test_recently_used_instances_are_kept() -> None:
+    engines = _Engines()
+    container = Container()
+    container.register(
+        Keyed(engines.create, key=TenantId, max_size=10, idle_timeout=60)
+    )
+
+    engine_a = await _resolve(container, "a")
+    await _resolve(container, "b")
+    assert await _resolve(container, "a") is engine_a
+    assert engines.closed == []
+
+
+async def test_factory_without_key() -> None:
+    container = Container()
+    container.register(Keyed(_Engine, key=int, max_size=1))
+
+    with pytest.raises(ValueError, match="does not depend on its key"):
+        await _resolve(container, "a")
+
+
+def test_invalid_max_size() -> None:
+    with pytest.raises(ValueError, match="max_size"):
+        Keyed(_Engine, key=TenantId, max_size=0)
+
+
+async def test_async_factory() -> None:
+    async def create(tenant_id: TenantId) -> _Engine:
+        await anyio.sleep(0.01)
+        return _Engine(tenant_id)
+
+    container = Container()
+    container.register(Keyed(create, key=TenantId, max_size=10))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(2):
+            tg.start_soon(_resolve, container, "a")
+    first = await _resolve(container, "a")
+    assert await _resolve(container, "a") is first
+
+
+async def test_closed_generics_have_own_caches() -> None:
+    container = Container()
+    container.register(Keyed(_Client, key=TenantId, max_size=10))
+
+    async with container.context({TenantId: TenantId("a")}) as ctx:
+        first: _Client[int] = await ctx.resolve(_Client[int])
+        second: _Client[str] = await ctx.resolve(_Client[str])
+        assert first is not second  # type: ignore[comparison-overlap]
+
+
+async def test_cache_is_owned_by_container() -> None:
+    engines = _Engines()
+    provider = Keyed(engines.create, key=TenantId, max_size=10)
+    first, second = Container(), Container()
+    first.register(provider)
+    second.register(provider)
+
+    engine = await _resolve(first, "a")
+    assert await _resolve(second, "a") is not engine
+
+    await second.aclose()
+    assert engines.closed == ["a"]
+    assert await _resolve(first, "a") is engine
+
+
+async def test_provide_outside_of_pool() -> None:
+    provider = Keyed(_Engine, key=TenantId, max_size=1)
+    with pytest.raises(TypeError, match="can only be leased"):
+        await provider.provide({})
+
+
+def test_sync_context() -> None:
+    container = Container()
+    container.register(Keyed(_Engine, key=TenantId, max_size=1))
+
+    with (
+        container.sync_context({TenantId: TenantId("a")}) as ctx,
+        pytest.raises(TypeError),
+    ):
+        ctx.resolve(_Engine)
@@ -0,0 +1,178 @@
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Generic, TypeVar
+
+import anyio
+import pytest
+
+from aioinject import Container, Pooled
+
+
+T = TypeVar("T")
+
+
+class _Parser:
+    def __init__(self) -> None:
+        self.buffer: list[str] = []
+
+
+class _Box(Generic[T]):
+    pass
+
+
+async def test_instance_is_reused_between_contexts() -> None:
+    container = Container()
+    container.register(Pooled(_Parser, max_size=2))
+
+    async with container.context() as ctx:
+        parser = await ctx.resolve(_Parser)
+        assert await ctx.resolve(_Parser) is parser
+
+    async with container.context() as ctx:
+        assert await ctx.resolve(_Parser) is parser
+
+
+async def test_async_factory() -> None:
+    async def create_parser() -> _Parser:
+        return _Parser()
+
+    container = Container()
+    container.register(Pooled(create_parser, max_size=1))
+
+    async with container.context() as ctx:
+        parser = await ctx.resolve(_Parser)
+    async with container.context() as ctx:
+        assert await ctx.resolve(_Parser) is parser
+
+
+async def test_provide_outside_of_pool() -> None:
+    with pytest.raises(TypeError, match="can only be leased"):
+        await Pooled(_Parser, max_size=1).provide({})
+
+
+async def test_concurrent_contexts_get_different_instances() -> None:
+    container = Container()
+    container.register(Pooled(_Parser, max_size=2))
+
+    async with container.context() as first, container.context() as second:
+        assert await first.resolve(_Parser) is not await second.resolve(
+            _Parser
+        )
+
+
+async def test_max_size() -> None:
+    container = Container()
+    container.register(Pooled(_Parser, max_size=1))
+    resolved = []
+
+    async def resolve() -> None:
+        async with container.context() as ctx:
+            resolved.append(await ctx.resolve(_Parser))
+            await anyio.sleep(0.01)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(resolve)
+
+    assert len(resolved) == 3  # noqa: PLR2004
+    assert len(set(map(id, resolved))) == 1
+
+
+async def test_min_size_and_reset() -> None:
+    created = 0
+
+    def create() -> _Parser:
+        nonlocal created
+        created += 1
+        return _Parser()
+
+    async def reset(parser: _Parser) -> None:
+        parser.buffer.clear()
+
+    container = Container()
+    container.register(Pooled(create, max_size=5, min_size=3, reset=reset))
+
+    async with container.context() as ctx:
+        parser = await ctx.resolve(_Parser)
+        parser.buffer.append("data")
+        assert created == 3  # noqa: PLR2004
+
+    assert parser.buffer == []
+
+
+async def test_instances_are_closed_with_container() -> None:
+    closed = []
+
+    @contextlib.asynccontextmanager
+    async def create() -> AsyncIterator[_Parser]:
+        yield _Parser()
+        closed.append(True)
+
+    container = Container()
+    container.register(Pooled(create, max_size=1))
+
+    async with container:
+        async with container.context() as ctx:
+            await ctx.resolve(_Parser)
+        assert closed == []
+    assert closed == [True]
+
+
+async def test_failed_reset_discards_instance() -> None:
+    failed: list[_Parser] = []
+
+    def reset(parser: _Parser) -> None:
+        if not failed:
+            failed.append(parser)
+            raise ValueError
+
+    container = Container()
+    container.register(Pooled(_Parser, max_size=1, reset=reset))
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        async with container.context() as ctx:
+            parser = await ctx.resolve(_Parser)
+
+    async with container.context() as ctx:
+        assert await ctx.resolve(_Parser) is not parser
+
+
+async def test_pool_is_owned_by_container() -> None:
+    provider = Pooled(_Parser, max_size=1)
+    first, second = Container(), Container()
+    first.register(provider)
+    second.register(provider)
+
+    async with first.context() as ctx:
+        parser = await ctx.resolve(_Parser)
+    async with second.context() as ctx:
+        assert await ctx.resolve(_Parser) is not parser
+    async with first.context() as ctx:
+        assert await ctx.resolve(_Parser) is parser
+
+
+async def test_closed_generics_have_own_pools() -> None:
+    container = Container()
+    container.register(Pooled(_Box, max_size=1))
+
+    async with container.context() as ctx:
+        first: _Box[int] = await ctx.resolve(_Box[int])
+        second: _Box[str] = await ctx.resolve(_Box[str])
+        assert first is not second  # type: ignore[comparison-overlap]
+
+
+@pytest.mark.parametrize(
+    ("min_size", "max_size"),
+    [(0, 0), (2, 1), (-1, 1)],
+)
+def test_invalid_size(min_size: int, max_size: int) -> None:
+    with pytest.raises(ValueError, match="Pool size"):
+        Pooled(_Parser, max_size=max_size, min_size=min_size)
+
+
+def test_sync_context() -> None:
+    container = Container()
+    container.register(Pooled(_Parser, max_size=1))
+
+    with container.sync_context() as ctx, pytest.raises(TypeError):
+        ctx.resolve(_Parser)
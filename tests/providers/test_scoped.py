@@ -140,6 +140,15 @@ def test_dependencies() -> None:
     assert provider.collect_dependencies() == expected
 
 
+def test_dependencies_are_hashable() -> None:
+    dependencies = {
+        Dependency(name="a", type_=int),
+        Dependency(name="a", type_=int),
+        Dependency(name="b", type_=str),
+    }
+    assert len(dependencies) == 2  # noqa: PLR2004
+
+
 def iterable() -> Iterator[int]:
     yield 42
 
@@ -0,0 +1,161 @@
+import contextlib
+import gc
+import threading
+from collections.abc import AsyncIterator, Iterator
+
+import anyio
+import pytest
+from anyio.lowlevel import checkpoint
+
+from aioinject import (
+    Container,
+    InjectionContext,
+    SyncInjectionContext,
+    TaskLocal,
+)
+
+
+class _Cursor:
+    pass
+
+
+@pytest.fixture
+def closed() -> list[_Cursor]:
+    return []
+
+
+@pytest.fixture
+def container(closed: list[_Cursor]) -> Container:
+    @contextlib.asynccontextmanager
+    async def create() -> AsyncIterator[_Cursor]:
+        cursor = _Cursor()
+        yield cursor
+        closed.append(cursor)
+
+    container = Container()
+    container.register(TaskLocal(create))
+    return container
+
+
+async def test_instance_per_task(
+    container: Container,
+    closed: list[_Cursor],
+) -> None:
+    cursors: list[_Cursor] = []
+
+    async def resolve(ctx: InjectionContext) -> None:
+        cursor = await ctx.resolve(_Cursor)
+        await checkpoint()
+        assert await ctx.resolve(_Cursor) is cursor
+        cursors.append(cursor)
+
+    async with container.context() as ctx:
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(resolve, ctx)
+        await resolve(ctx)
+
+        async with ctx.child() as child:
+            assert await child.resolve(_Cursor) is cursors[-1]
+
+        assert len(set(map(id, cursors))) == 4  # noqa: PLR2004
+        assert cursors[-1] not in closed
+    assert len(closed) == 4  # noqa: PLR2004
+
+
+async def test_finished_tasks_are_closed(
+    container: Container,
+    closed: list[_Cursor],
+) -> None:
+    cursors: list[_Cursor] = []
+
+    async def resolve(ctx: InjectionContext) -> None:
+        cursors.append(await ctx.resolve(_Cursor))
+
+    async with container.context() as ctx:
+        for _ in range(20):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(resolve, ctx)
+        assert len(set(map(id, cursors))) == 20  # noqa: PLR2004
+        assert closed == cursors[:-1]
+    assert closed == cursors
+
+
+def test_sync() -> None:
+    container = Container()
+    container.register(TaskLocal(_Cursor))
+
+    with container.sync_context() as ctx:
+        assert ctx.resolve(_Cursor) is ctx.resolve(_Cursor)
+
+
+async def test_close_errors_are_logged(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    created: list[_Cursor] = []
+
+    @contextlib.asynccontextmanager
+    async def create() -> AsyncIterator[_Cursor]:
+        cursor = _Cursor()
+        created.append(cursor)
+        yield cursor
+        if cursor is created[0]:
+            raise ValueError
+
+    container = Container()
+    container.register(TaskLocal(create))
+
+    async def resolve(ctx: InjectionContext) -> None:
+        await ctx.resolve(_Cursor)
+
+    async with container.context() as ctx:
+        for _ in range(2):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(resolve, ctx)
+
+    assert [record.message for record in caplog.records] == [
+        "Failed to close task local dependencies",
+    ]
+
+
+def test_sync_finished_threads_are_closed(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    closed: list[_Cursor] = []
+    failing: list[bool] = []
+
+    @contextlib.contextmanager
+    def create() -> Iterator[_Cursor]:
+        cursor = _Cursor()
+        yield cursor
+        if failing:
+            raise ValueError
+        closed.append(cursor)
+
+    container = Container()
+    container.register(TaskLocal(create))
+
+    def resolve_in_thread(ctx: SyncInjectionContext) -> None:
+        thread = threading.Thread(target=ctx.resolve, args=(_Cursor,))
+        thread.start()
+        thread.join()
+        del thread
+        gc.collect()
+
+    with container.sync_context() as ctx:
+        resolve_in_thread(ctx)
+        cursor = ctx.resolve(_Cursor)
+        assert len(closed) == 1
+        assert cursor not in closed
+
+        failing.append(True)
+        resolve_in_thread(ctx)
+        # Closing the finished thread's cursor fails, it's logged instead
+        # of breaking resolution in other threads
+        resolve_in_thread(ctx)
+        failing.clear()
+        assert [record.message for record in caplog.records] == [
+            "Failed to close task local dependencies",
+        ]
+    assert len(closed) == 3  # noqa: PLR2004
+    assert cursor in closed
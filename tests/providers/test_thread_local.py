@@ -0,0 +1,70 @@
+import contextlib
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from aioinject import Container, ThreadLocal
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.thread = threading.get_ident()
+
+
+def _resolve(container: Container) -> _Session:
+    with container.sync_context() as ctx:
+        return ctx.resolve(_Session)
+
+
+def test_instance_per_thread() -> None:
+    container = Container()
+    container.register(ThreadLocal(_Session))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sessions = list(executor.map(lambda _: _resolve(container), range(20)))
+
+    by_thread = {session.thread: session for session in sessions}
+    assert all(by_thread[session.thread] is session for session in sessions)
+    assert _resolve(container) is _resolve(container)
+    assert _resolve(container) not in sessions
+
+
+def test_closed_with_container() -> None:
+    closed = []
+
+    @contextlib.contextmanager
+    def create() -> Iterator[_Session]:
+        session = _Session()
+        yield session
+        closed.append(session)
+
+    container = Container()
+    container.register(ThreadLocal(create))
+
+    with container:
+        thread = threading.Thread(target=_resolve, args=(container,))
+        thread.start()
+        thread.join()
+        main = _resolve(container)
+        assert closed == []
+
+    assert len(closed) == 2  # noqa: PLR2004
+    assert main in closed
+
+    assert _resolve(container) is not main
+
+
+async def test_async_close() -> None:
+    closed = []
+
+    @contextlib.contextmanager
+    def create() -> Iterator[_Session]:
+        yield _Session()
+        closed.append(True)
+
+    container = Container()
+    container.register(ThreadLocal(create))
+
+    async with container, container.context() as ctx:
+        assert await ctx.resolve(_Session) is await ctx.resolve(_Session)
+    assert closed == [True]
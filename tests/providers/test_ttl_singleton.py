@@ -0,0 +1,197 @@
+import contextlib
+import logging
+from collections.abc import AsyncIterator, Iterator
+
+import anyio
+import pytest
+from anyio.lowlevel import checkpoint
+
+from aioinject import Container, TTLSingleton
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.created = 0
+        self.closed: list[int] = []
+
+    @contextlib.asynccontextmanager
+    async def create(self) -> AsyncIterator[int]:
+        self.created += 1
+        number = self.created
+        yield number
+        self.closed.append(number)
+
+    @contextlib.contextmanager
+    def create_sync(self) -> Iterator[int]:
+        self.created += 1
+        number = self.created
+        yield number
+        self.closed.append(number)
+
+
+async def _resolve(container: Container) -> int:
+    async with container.context() as ctx:
+        return await ctx.resolve(int)
+
+
+async def test_not_refreshed_before_ttl() -> None:
+    counter = _Counter()
+    container = Container()
+    container.register(TTLSingleton(counter.create, ttl=60))
+
+    assert await _resolve(container) == 1
+    assert await _resolve(container) == 1
+    assert counter.created == 1
+
+
+async def test_stale_while_revalidate() -> None:
+    counter = _Counter()
+    container = Container(background_tasks=True)
+    container.register(TTLSingleton(counter.create, ttl=0))
+
+    async with container:
+        assert await _resolve(container) == 1
+        assert await _resolve(container) == 1
+        for _ in range(5):
+            await checkpoint()
+        assert counter.closed == [1]
+        assert await _resolve(container) == 2  # noqa: PLR2004
+        for _ in range(5):
+            await checkpoint()
+
+    assert counter.closed == [1, 2, 3]
+
+
+async def test_refresh_cancelled_on_exit() -> None:
+    calls = 0
+
+    async def create() -> int:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            await anyio.sleep_forever()
+        return calls
+
+    container = Container(background_tasks=True)
+    container.register(TTLSingleton(create, ttl=0))
+
+    with anyio.fail_after(1):
+        async with container:
+            assert await _resolve(container) == 1
+            assert await _resolve(container) == 1
+            await checkpoint()
+    assert calls == 2  # noqa: PLR2004
+
+
+async def test_refresh_inline_without_task_group() -> None:
+    counter = _Counter()
+    container = Container()
+    container.register(TTLSingleton(counter.create, ttl=0))
+
+    assert await _resolve(container) == 1
+    for expected in (2, 3):
+        instance = await _resolve(container)
+        assert instance == expected
+        assert instance not in counter.closed
+    assert counter.closed == [1, 2]
+
+    await container.aclose()
+    assert counter.closed == [1, 2, 3]
+
+
+async def test_failed_refresh_keeps_stale_instance(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    calls = 0
+
+    async def create() -> int:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise ValueError
+        return calls
+
+    container = Container()
+    container.register(TTLSingleton(create, ttl=0))
+
+    with caplog.at_level(logging.ERROR):
+        assert await _resolve(container) == 1
+        assert await _resolve(container) == 1
+    assert "Failed to refresh" in caplog.text
+
+
+async def test_failed_refresh_returns_stale_instance(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    calls = 0
+    closed = []
+
+    @contextlib.asynccontextmanager
+    async def create() -> AsyncIterator[int]:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise ValueError
+        yield calls
+        closed.append(calls)
+
+    container = Container()
+    container.register(TTLSingleton(create, ttl=0))
+
+    with caplog.at_level(logging.ERROR):
+        assert await _resolve(container) == 1
+        assert await _resolve(container) == 1
+    assert closed == []
+    assert "Failed to refresh" in caplog.text
+
+
+def test_sync() -> None:
+    counter = _Counter()
+    container = Container()
+    container.register(TTLSingleton(counter.create_sync, ttl=0))
+
+    with container:
+        for expected in (1, 2, 3):
+            with container.sync_context() as ctx:
+                instance = ctx.resolve(int)
+                assert instance == expected
+                assert instance not in counter.closed
+        assert counter.closed == [1, 2]
+    assert counter.closed == [1, 2, 3]
+
+
+def test_sync_failed_refresh(caplog: pytest.LogCaptureFixture) -> None:
+    calls = 0
+
+    @contextlib.contextmanager
+    def create() -> Iterator[int]:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise ValueError
+        yield calls
+
+    container = Container()
+    container.register(TTLSingleton(create, ttl=0))
+
+    with caplog.at_level(logging.ERROR), container:
+        for _ in range(2):
+            with container.sync_context() as ctx:
+                assert ctx.resolve(int) == 1
+    assert "Failed to refresh" in caplog.text
+
+
+async def test_sync_generation_closed_by_async_refresh() -> None:
+    counter = _Counter()
+    container = Container()
+    container.register(TTLSingleton(counter.create_sync, ttl=0))
+
+    with container.sync_context() as ctx:
+        assert ctx.resolve(int) == 1
+    assert await _resolve(container) == 2  # noqa: PLR2004
+    assert counter.closed == [1]
+
+    with container.sync_context() as ctx:
+        assert ctx.resolve(int) == 3  # noqa: PLR2004
+    await container.aclose()
+    assert sorted(counter.closed) == [1, 2, 3]
@@ -0,0 +1,113 @@
+import contextlib
+import gc
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from aioinject import Container, WeakSingleton
+from aioinject._store import NotInCache, WeakSingletonStore
+
+
+class _Index:
+    pass
+
+
+@pytest.fixture
+def container() -> Container:
+    container = Container()
+    container.register(WeakSingleton(_Index))
+    return container
+
+
+async def test_reused_while_referenced(container: Container) -> None:
+    async with container.context() as ctx:
+        instance = await ctx.resolve(_Index)
+
+    async with container.context() as ctx:
+        assert await ctx.resolve(_Index) is instance
+
+
+async def test_rebuilt_after_collected() -> None:
+    created = 0
+
+    def create() -> _Index:
+        nonlocal created
+        created += 1
+        return _Index()
+
+    container = Container()
+    container.register(WeakSingleton(create))
+
+    async with container.context() as ctx:
+        await ctx.resolve(_Index)
+    gc.collect()
+
+    async with container.context() as ctx:
+        await ctx.resolve(_Index)
+    assert created == 2  # noqa: PLR2004
+
+
+def test_threads(container: Container) -> None:
+    instances = []
+    barrier = threading.Barrier(4)
+
+    def resolve() -> None:
+        barrier.wait()
+        with container.sync_context() as ctx:
+            instances.append(ctx.resolve(_Index))
+
+    threads = [threading.Thread(target=resolve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(instance) for instance in instances}) == 1
+
+
+def test_context_managers_are_rejected() -> None:
+    @contextlib.contextmanager
+    def create() -> Iterator[_Index]:
+        yield _Index()
+
+    with pytest.raises(TypeError, match="can't use context managers"):
+        WeakSingleton(create)
+
+
+class _Slotted:
+    __slots__ = ("value",)
+
+
+@pytest.mark.parametrize("type_", [dict, int, list[int], _Slotted])
+def test_types_without_weak_references_are_rejected(
+    type_: type[object],
+) -> None:
+    with pytest.raises(TypeError, match="don't support weak references"):
+        WeakSingleton(type_)
+
+
+async def test_lock_keeps_instance_alive() -> None:
+    store = WeakSingletonStore()
+    provider = WeakSingleton(_Index)
+    instance = _Index()
+    store.add(provider, instance)
+
+    async with store.lock(provider) as should_provide:
+        del instance
+        gc.collect()
+        assert not should_provide
+        assert store.get(provider) is not NotInCache.sentinel
+
+
+def test_sync_lock_keeps_instance_alive() -> None:
+    store = WeakSingletonStore()
+    provider = WeakSingleton(_Index)
+    instance = _Index()
+    store.add(provider, instance)
+
+    with store.sync_lock(provider) as should_provide:
+        del instance
+        gc.collect()
+        assert not should_provide
+        assert store.get(provider) is not NotInCache.sentinel
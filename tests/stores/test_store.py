@@ -75,3 +75,18 @@ async def test_lock(store_cls: type[InstanceStore]) -> None:
 
     with store.sync_lock(provider) as should_provide:
         assert should_provide is False
+
+
+async def test_refresh() -> None:
+    store = InstanceStore()
+    provider = Object(0)
+    assert store.should_refresh(provider) is False
+
+    async def provide() -> None:
+        store.add(provider, 1)
+
+    await store.refresh(provider, provide)
+    assert store.get(provider) == 1
+
+    store.sync_refresh(provider, lambda: store.add(provider, 2))
+    assert store.get(provider) == 2  # noqa: PLR2004
@@ -1,12 +1,13 @@
 import abc
+import inspect
 from collections.abc import Sequence
 from typing import Annotated, NewType
 
 import pytest
 
 from aioinject import Container, Inject, Object, Scoped, inject, providers
-from aioinject.context import container_var
-from aioinject.decorators import InjectMethod
+from aioinject.context import container_var, context_var
+from aioinject.decorators import InjectMethod, inject_from_parameter
 from aioinject.markers import Injected
 
 
@@ -170,3 +171,56 @@ async def test_iterable_provider() -> None:
     with container.sync_context() as sync_ctx:
         loggers = sync_ctx.resolve_iterable(ILogger)  # type: ignore[type-abstract]
         assert len(loggers) == 2  # noqa: PLR2004
+
+
+async def test_context_without_context_var(container: Container) -> None:
+    async with container.context(use_context_var=False):
+        with pytest.raises(LookupError):
+            context_var.get()
+
+    with (
+        container.sync_context(use_context_var=False),
+        pytest.raises(LookupError),
+    ):
+        context_var.get()
+
+
+def test_inject_from_parameter_requires_async_function() -> None:
+    def function() -> None:
+        pass
+
+    with pytest.raises(TypeError):
+        inject_from_parameter(
+            function,
+            parameter=inspect.Parameter(
+                "context",
+                kind=inspect.Parameter.KEYWORD_ONLY,
+            ),
+            get_context=lambda context: context,
+        )
+
+
+async def test_inject_from_parameter(container: Container) -> None:
+    async def function(
+        session: Injected[_Session],
+        **kwargs: object,
+    ) -> tuple[_Session, dict[str, object]]:
+        return session, kwargs
+
+    wrapper = inject_from_parameter(
+        function,
+        parameter=inspect.Parameter(
+            "context",
+            kind=inspect.Parameter.KEYWORD_ONLY,
+        ),
+        get_context=lambda context: context,
+    )
+    assert list(inspect.signature(wrapper).parameters) == [
+        "session",
+        "context",
+        "kwargs",
+    ]
+    async with container.context(use_context_var=False) as ctx:
+        session, kwargs = await wrapper(context=ctx, extra=1)  # type: ignore[call-arg]
+        assert isinstance(session, _Session)
+        assert kwargs == {"extra": 1}
@@ -1,7 +1,10 @@
 from typing import Annotated
 
 from aioinject import Inject
-from aioinject._utils import get_inject_annotations
+from aioinject._utils import (
+    get_inject_annotations,
+    is_iterable_generic_collection,
+)
 
 
 def test_inject_annotations_returns_all_inject_markers() -> None:
@@ -16,3 +19,14 @@ def test_inject_annotations_returns_all_inject_markers() -> None:
         "b": Annotated[int, Inject],
         "c": Annotated[int, Inject()],
     }
+
+
+def test_iterable_generic_collection_cache_is_bounded() -> None:
+    is_iterable_generic_collection.cache_clear()
+    assert is_iterable_generic_collection(list[int])
+    assert is_iterable_generic_collection(list[int])
+    assert not is_iterable_generic_collection(int)
+
+    info = is_iterable_generic_collection.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+    assert info.maxsize is not None
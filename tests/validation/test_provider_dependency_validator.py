@@ -3,8 +3,21 @@ from typing import Any
 
 import pytest
 
-from aioinject import Container, Provider, Scoped, Singleton
-from aioinject.validation import ForbidDependency, validate_container
+from aioinject import (
+    Container,
+    ItemScoped,
+    Pooled,
+    Provider,
+    Scoped,
+    Singleton,
+    Transient,
+)
+from aioinject.validation import (
+    ForbidDependency,
+    forbid_pooled_on_short_lived_dependency,
+    forbid_scoped_on_item_scoped_dependency,
+    validate_container,
+)
 from aioinject.validation.error import (
     ContainerValidationErrorGroup,
 )
@@ -53,3 +66,40 @@ def test_err(providers: Sequence[Provider[Any]]) -> None:
 
     with pytest.raises(ContainerValidationErrorGroup):
         validate_container(container, _VALIDATORS)
+
+
+@pytest.mark.parametrize(
+    ("providers", "is_valid"),
+    [
+        ([ItemScoped(_str_dependency), Scoped(int)], True),
+        ([Scoped(_str_dependency), ItemScoped(int)], False),
+    ],
+)
+def test_forbid_scoped_on_item_scoped(
+    providers: Sequence[Provider[Any]],
+    is_valid: bool,
+) -> None:
+    container = Container()
+    container.register(*providers)
+
+    errors = forbid_scoped_on_item_scoped_dependency(container)
+    assert (not errors) is is_valid
+
+
+@pytest.mark.parametrize(
+    ("providers", "is_valid"),
+    [
+        ([Pooled(_str_dependency, max_size=1), Singleton(int)], True),
+        ([Pooled(_str_dependency, max_size=1), Scoped(int)], False),
+        ([Pooled(_str_dependency, max_size=1), Transient(int)], False),
+    ],
+)
+def test_forbid_pooled_on_short_lived(
+    providers: Sequence[Provider[Any]],
+    is_valid: bool,
+) -> None:
+    container = Container()
+    container.register(*providers)
+
+    errors = forbid_pooled_on_short_lived_dependency(container)
+    assert (not errors) is is_valid